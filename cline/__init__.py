@@ -8,23 +8,114 @@ Homepage: https://github.com/cariad/cline
 Documentation: https://cariad.github.io/cline/
 """
 
-from importlib.resources import open_text
+from importlib import import_module
 
-from cline.cli import ArgumentParserCli, Cli, RegisteredTasks
-from cline.cli_args import CommandLineArguments
-from cline.exceptions import CannotMakeArguments
-from cline.tasks import AnyTask, AnyTaskType, Task
+# `typing` is expensive to import so we avoid it at runtime. Type checkers treat
+# `TYPE_CHECKING` as true regardless of where it's defined.
+TYPE_CHECKING = False
 
-with open_text(__package__, "VERSION") as t:
-    __version__ = t.readline().strip()
+if TYPE_CHECKING:
+    from typing import Any, Dict, List
+
+    from cline.cancellation import CancellationToken
+    from cline.cli import (
+        ArgumentParserCli,
+        ArgumentSpec,
+        Cli,
+        Flag,
+        Option,
+        Positional,
+        RegisteredTasks,
+        SpecCli,
+    )
+    from cline.cli_args import CommandLineArguments
+    from cline.exceptions import Cancelled, CannotMakeArguments, InvalidArguments
+    from cline.tasks import (
+        NO_MATCH,
+        AnyTask,
+        AnyTaskType,
+        AsyncTask,
+        DataclassTask,
+        LazyTask,
+        Selector,
+        StreamTask,
+        Task,
+    )
+    from cline.timings import Timings
+
+    __version__: str
+
+# Names are imported from their modules only when they're first used, so
+# importing Cline costs next to nothing until the host application needs it:
+_exports: "Dict[str, str]" = {
+    "NO_MATCH": "cline.tasks",
+    "AnyTask": "cline.tasks",
+    "AnyTaskType": "cline.tasks",
+    "ArgumentParserCli": "cline.cli",
+    "ArgumentSpec": "cline.cli",
+    "AsyncTask": "cline.tasks",
+    "CancellationToken": "cline.cancellation",
+    "Cancelled": "cline.exceptions",
+    "Cli": "cline.cli",
+    "CommandLineArguments": "cline.cli_args",
+    "CannotMakeArguments": "cline.exceptions",
+    "DataclassTask": "cline.tasks",
+    "Flag": "cline.cli",
+    "InvalidArguments": "cline.exceptions",
+    "LazyTask": "cline.tasks",
+    "Option": "cline.cli",
+    "Positional": "cline.cli",
+    "RegisteredTasks": "cline.cli",
+    "Selector": "cline.tasks",
+    "SpecCli": "cline.cli",
+    "StreamTask": "cline.tasks",
+    "Task": "cline.tasks",
+    "Timings": "cline.timings",
+}
 
 __all__ = [
+    "NO_MATCH",
     "AnyTask",
     "AnyTaskType",
     "ArgumentParserCli",
+    "ArgumentSpec",
+    "AsyncTask",
+    "CancellationToken",
+    "Cancelled",
     "Cli",
     "CommandLineArguments",
     "CannotMakeArguments",
+    "DataclassTask",
+    "Flag",
+    "InvalidArguments",
+    "LazyTask",
+    "Option",
+    "Positional",
     "RegisteredTasks",
+    "Selector",
+    "SpecCli",
+    "StreamTask",
     "Task",
+    "Timings",
 ]
+
+
+def __dir__() -> "List[str]":
+    return sorted([*globals(), *__all__, "__version__"])
+
+
+def __getattr__(name: str) -> "Any":
+    if name == "__version__":
+        from importlib.resources import open_text
+
+        with open_text(__name__, "VERSION") as t:
+            value: "Any" = t.readline().strip()
+
+    elif name in _exports:
+        value = getattr(import_module(_exports[name]), name)
+
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
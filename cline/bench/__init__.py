@@ -0,0 +1,6 @@
+"""
+`cline.bench` benchmarks Cline's hot paths.
+
+Run `python -m cline.bench` to print the results, or `python -m cline.bench
+--json` to write them in a machine-readable format to track across releases.
+"""
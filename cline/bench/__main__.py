@@ -0,0 +1,9 @@
+from cline.bench.cli import BenchCli
+
+
+def entry() -> None:
+    BenchCli.invoke_and_exit()
+
+
+if __name__ == "__main__":
+    entry()
@@ -0,0 +1,115 @@
+from argparse import ArgumentParser, ArgumentTypeError
+
+from cline.bench.suite import GROUPS
+from cline.bench.tasks import CompareTask, ParsersTask, SuiteTask
+from cline.cli import ArgumentParserCli, RegisteredTasks
+
+
+def _positive(value: str) -> str:
+    # Leave the value as a string, as tasks read it with `get_integer()`:
+    try:
+        if int(value) >= 1:
+            return value
+    except ValueError:
+        pass
+    raise ArgumentTypeError(f'"{value}" is not a whole number of at least 1')
+
+
+class BenchCli(ArgumentParserCli):
+    """
+    Command line interface for `python -m cline.bench`.
+    """
+
+    def make_parser(self) -> ArgumentParser:
+        parser = ArgumentParser(
+            description="Benchmarks Cline's hot paths.",
+            epilog=(
+                '"compare" runs the dispatch, import and make_cli_args groups '
+                "(unless --group is set), compares them with the baseline and "
+                "fails if any regressed. The baseline is saved first if it "
+                "doesn't exist."
+            ),
+            prog="python -m cline.bench",
+        )
+
+        parser.add_argument(
+            "command",
+            choices=["compare"],
+            help="compare with a baseline",
+            nargs="?",
+        )
+
+        parser.add_argument(
+            "--baseline",
+            default="cline-bench.json",
+            help="baseline results to compare with (default: cline-bench.json)",
+            metavar="PATH",
+        )
+
+        parser.add_argument(
+            "--group",
+            action="append",
+            choices=GROUPS,
+            help="run only this group of benchmarks (can be repeated)",
+        )
+
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="write results as JSON",
+        )
+
+        parser.add_argument(
+            "--parsers",
+            action="store_true",
+            help="compare ArgumentParser with ArgumentSpec instead",
+        )
+
+        parser.add_argument(
+            "--repeat",
+            default="5",
+            help="maximum rounds of each benchmark (default: 5)",
+            metavar="N",
+            type=_positive,
+        )
+
+        parser.add_argument(
+            "--save",
+            action="store_true",
+            help="save the results as the new baseline instead of comparing",
+        )
+
+        parser.add_argument(
+            "--size",
+            action="append",
+            help=(
+                "number of arguments to compare the parsers on (can be repeated; "
+                "default: 10, 1000 and 10000). ArgumentParser slows down "
+                "quadratically, so 100000 arguments take minutes"
+            ),
+            metavar="N",
+            type=_positive,
+        )
+
+        parser.add_argument(
+            "--threshold",
+            default="10",
+            help="percentage slow-down to fail a comparison on (default: 10)",
+            metavar="PCT",
+        )
+
+        parser.add_argument(
+            "--warmup",
+            default="1",
+            help="untimed rounds before each benchmark (default: 1)",
+            metavar="N",
+        )
+
+        return parser
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [
+            ParsersTask,
+            CompareTask,
+            SuiteTask,
+        ]
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from json import load
+from typing import IO, Dict, List, Optional
+
+from cline.bench.suite import BenchmarkResult, format_seconds
+
+COMPARE_GROUPS = ("dispatch", "imports", "make_cli_args")
+"""
+Benchmark groups that `python -m cline.bench compare` gates on by default:
+dispatch, parsing and startup.
+"""
+
+
+@dataclass
+class Comparison:
+    """
+    A benchmark's current result compared with its baseline.
+
+    Arguments:
+        baseline: Fastest round of the baseline in seconds, if measured.
+        current:  Fastest round of the current run in seconds, if measured.
+        name:     Benchmark name.
+    """
+
+    baseline: Optional[float]
+    current: Optional[float]
+    name: str
+
+    @property
+    def change(self) -> Optional[float]:
+        """
+        Gets the change from the baseline as a fraction of the baseline, where
+        positive is slower. `None` if either side wasn't measured.
+        """
+
+        if not self.baseline or self.current is None:
+            return None
+
+        return (self.current - self.baseline) / self.baseline
+
+    def regressed(self, threshold: float) -> bool:
+        """
+        Checks if the benchmark slowed down by more than `threshold` (as a
+        fraction of the baseline).
+        """
+
+        change = self.change
+        return change is not None and change > threshold
+
+
+def compare_results(
+    baseline: Dict[str, float],
+    current: List[BenchmarkResult],
+) -> List[Comparison]:
+    """
+    Compares the current results with the baseline's fastest rounds.
+
+    Benchmarks in the baseline but not the current run are not compared.
+    """
+
+    return [
+        Comparison(baseline=baseline.get(r.name), current=r.fastest, name=r.name)
+        for r in current
+    ]
+
+
+def read_baseline(reader: IO[str]) -> Dict[str, float]:
+    """
+    Reads the fastest round of each benchmark from results written by
+    `dump_results()`.
+
+    Raises:
+        ValueError: If the results are not valid.
+    """
+
+    try:
+        results = load(reader)["results"]
+        return {str(r["name"]): float(r["fastest"]) for r in results}
+    except (KeyError, TypeError) as ex:
+        raise ValueError(f"baseline results are not valid ({ex})")
+
+
+def write_comparisons(
+    comparisons: List[Comparison],
+    threshold: float,
+    out: IO[str],
+) -> None:
+    """
+    Writes comparisons as a human-readable table.
+    """
+
+    width = max([len("benchmark"), *[len(c.name) for c in comparisons]])
+
+    out.write(
+        f"{'benchmark':<{width}} {'baseline':>11} {'current':>11} {'change':>8}\n"
+    )
+
+    for c in comparisons:
+        baseline = "-" if c.baseline is None else format_seconds(c.baseline)
+        current = "-" if c.current is None else format_seconds(c.current)
+        change = "new" if c.change is None else f"{c.change:+.1%}"
+        status = " regressed" if c.regressed(threshold) else ""
+
+        out.write(
+            f"{c.name:<{width}} {baseline:>11} {current:>11} {change:>8}{status}\n"
+        )
@@ -0,0 +1,122 @@
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from cline.cli.spec import ArgumentSpec, Flag, Option, Positional
+
+OPTIONS = 50
+"""
+Number of options that each benchmarked parser declares.
+"""
+
+
+def make_args(count: int) -> List[str]:
+    """
+    Makes `count` command line arguments that use every kind of argument that
+    the benchmarked parsers declare.
+    """
+
+    groups = [["--verbose"], ["--name", "foo"], ["--opt-1=2"], ["--tag", "bar"]]
+    args: List[str] = []
+    index = 0
+
+    while len(args) < count:
+        group = groups[index % len(groups)]
+        args.extend(group if len(args) + len(group) <= count else ["baz"])
+        index += 1
+
+    return args
+
+
+def make_argument_parser() -> ArgumentParser:
+    parser = ArgumentParser()
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--name")
+    parser.add_argument("--tag", action="append")
+    parser.add_argument("--verbose", action="store_true")
+    for i in range(OPTIONS):
+        parser.add_argument(f"--opt-{i}")
+    return parser
+
+
+def make_argument_spec() -> ArgumentSpec:
+    return ArgumentSpec(
+        [
+            Positional("files", multiple=True),
+            Option("name"),
+            Option("tag", multiple=True),
+            Flag("verbose"),
+            *[Option(f"opt_{i}") for i in range(OPTIONS)],
+        ]
+    )
+
+
+def measure(func: Callable[[], object], repeat: int, budget: float = 1.0) -> float:
+    """
+    Gets the fastest of up to `repeat` calls to `func`, in seconds.
+
+    Stops repeating once `budget` seconds have been spent, so slow functions
+    are called at least once but not necessarily `repeat` times.
+    """
+
+    return min(sample(func, repeat, budget))
+
+
+def sample(
+    func: Callable[[], object],
+    repeat: int,
+    budget: float = 1.0,
+    number: int = 1,
+    warmup: int = 0,
+) -> List[float]:
+    """
+    Times up to `repeat` rounds of `number` calls to `func`, and gets the
+    seconds per call in each round.
+
+    `func` is first called `warmup` times without being timed, so that caches
+    are populated and rounds are comparable.
+
+    Stops repeating once `budget` seconds have been spent, so slow functions
+    are called at least once but not necessarily `repeat` times.
+    """
+
+    for _ in range(warmup):
+        func()
+
+    samples: List[float] = []
+    spent = 0.0
+
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = perf_counter() - start
+        samples.append(elapsed / number)
+        spent += elapsed
+        if spent > budget:
+            break
+
+    return samples
+
+
+def benchmark_parsers(sizes: List[int], repeat: int = 5) -> List[Dict[str, float]]:
+    """
+    Benchmarks `ArgumentParser` against `ArgumentSpec` on each number of
+    command line arguments in `sizes`.
+    """
+
+    parser = make_argument_parser()
+    spec = make_argument_spec()
+    results: List[Dict[str, float]] = []
+
+    for size in sizes:
+        args = make_args(size)
+        results.append(
+            {
+                "arguments": size,
+                "argparse": measure(lambda: parser.parse_known_args(args), repeat),
+                "spec": measure(lambda: spec.parse(args), repeat),
+            }
+        )
+
+    return results
@@ -0,0 +1,391 @@
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from importlib import import_module
+from io import StringIO
+from json import dumps
+from platform import platform, python_implementation, python_version
+from statistics import median, stdev
+from subprocess import check_output
+from sys import executable
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from cline.bench.parsers import make_args, make_argument_parser, sample
+from cline.cli import ArgumentParserCli, RegisteredTasks, SpecCli
+from cline.cli.spec import ArgumentSpec, Positional
+from cline.cli_args import CommandLineArguments
+from cline.tasks import NO_MATCH, AnyTaskType, NoMatch, Selector, Task
+
+EXAMPLES: Dict[str, Tuple[str, List[str]]] = {
+    "example01": ("examples.example01.cli:ExampleCli", ["1", "3"]),
+    "example02": ("examples.example02.cli:ExampleCli", ["1", "3", "--sub"]),
+    "example03": ("examples.example03.cli:ExampleCli", ["1", "3", "--sum"]),
+}
+"""
+Example applications to invoke end-to-end, by name. Each is the import path of
+the application's CLI class and the command line arguments to invoke it with.
+
+The examples are only available when benchmarking from a clone of the Cline
+repository; unavailable examples are skipped.
+"""
+
+GROUPS = ("dispatch", "examples", "getters", "imports", "make_cli_args")
+"""
+Names of the benchmark groups in the suite.
+"""
+
+IMPORT_CODE = (
+    "from time import perf_counter_ns as n; s = n(); import {module}; print(n() - s)"
+)
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The result of one benchmark.
+
+    Arguments:
+        group:   Benchmark group, like "dispatch".
+        name:    Benchmark name, unique within the suite.
+        samples: Seconds per operation in each round.
+    """
+
+    group: str
+    name: str
+    samples: List[float]
+
+    @property
+    def fastest(self) -> float:
+        """
+        Gets the fastest round in seconds per operation.
+        """
+
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        """
+        Gets the median round in seconds per operation.
+        """
+
+        return median(self.samples)
+
+    @property
+    def stdev(self) -> float:
+        """
+        Gets the standard deviation of the rounds in seconds per operation.
+        """
+
+        return stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the result as a JSON-serialisable dictionary.
+        """
+
+        return {
+            "fastest": self.fastest,
+            "group": self.group,
+            "median": self.median,
+            "name": self.name,
+            "rounds": len(self.samples),
+            "stdev": self.stdev,
+        }
+
+
+class _BenchArgumentParserCli(ArgumentParserCli):
+    def make_parser(self) -> ArgumentParser:
+        return make_argument_parser()
+
+    def register_tasks(self) -> RegisteredTasks:
+        return []
+
+
+def make_dispatch_cli(tasks: RegisteredTasks, args: List[str]) -> SpecCli:
+    """
+    Makes a CLI that registers `tasks` and parses a single positional "task"
+    argument.
+    """
+
+    class DispatchCli(SpecCli):
+        def make_parser(self) -> ArgumentSpec:
+            return ArgumentSpec([Positional("task")])
+
+        def register_tasks(self) -> RegisteredTasks:
+            return tasks
+
+    return DispatchCli(args=args, out=StringIO())
+
+
+def make_numbered_task(index: int, mode: str = "probe") -> AnyTaskType:
+    """
+    Makes a task class that handles only the command line argument "task" with
+    the value `index`.
+
+    Arguments:
+        index: Task number.
+        mode:  "probe" to implement only `make_args()`, "try" to also implement
+               `try_make_args()`, "selector" to also declare a selector or
+               "command" to handle the subcommand "run <index>" instead.
+    """
+
+    value = str(index)
+
+    selectors = {
+        "command": Selector(command=["run", value]),
+        "selector": Selector(values={"task": value}),
+    }
+
+    class NumberedTask(Task[int]):
+        selector = selectors.get(mode)
+
+        @classmethod
+        def make_args(cls, args: CommandLineArguments) -> int:
+            if mode != "command":
+                args.assert_string("task", value)
+            return index
+
+        def invoke(self) -> int:
+            return 0
+
+    class TryNumberedTask(NumberedTask):
+        @classmethod
+        def try_make_args(cls, args: CommandLineArguments) -> Union[int, NoMatch]:
+            return index if args.try_get_string("task") == value else NO_MATCH
+
+    task = TryNumberedTask if mode == "try" else NumberedTask
+    task.__name__ = f"NumberedTask{index}"
+    task.__qualname__ = task.__name__
+    return task
+
+
+def benchmark_dispatch(
+    counts: Sequence[int],
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[BenchmarkResult]:
+    """
+    Benchmarks `Cli.task` choosing the last of `counts` registered tasks by
+    probing every task's `make_args()`, probing every task's `try_make_args()`,
+    by selector and by subcommand.
+    """
+
+    results: List[BenchmarkResult] = []
+
+    for mode in ("probe", "try", "selector", "command"):
+        for count in counts:
+            tasks: RegisteredTasks = [make_numbered_task(i, mode) for i in range(count)]
+
+            args = [str(count - 1)]
+            if mode == "command":
+                args.insert(0, "run")
+
+            cli = make_dispatch_cli(tasks, args)
+            cli.warm()
+            # Parse once so that only dispatch is measured:
+            cli.cli_args
+
+            samples = sample(lambda: cli.task, repeat, number=10, warmup=warmup)
+            results.append(
+                BenchmarkResult("dispatch", f"dispatch/{mode}/{count}", samples)
+            )
+
+    return results
+
+
+def benchmark_examples(repeat: int = 5, warmup: int = 1) -> List[BenchmarkResult]:
+    """
+    Benchmarks `invoke_and_exit()` on each example application that can be
+    imported.
+    """
+
+    results: List[BenchmarkResult] = []
+
+    for name, (path, args) in EXAMPLES.items():
+        module_name, class_name = path.split(":")
+
+        try:
+            cli_type = getattr(import_module(module_name), class_name)
+        except ImportError:
+            continue
+
+        def invoke() -> None:
+            cli_type.invoke_and_exit(
+                args=args,
+                callback=lambda _: None,
+                init_logging=False,
+                out=StringIO(),
+            )
+
+        samples = sample(invoke, repeat, number=10, warmup=warmup)
+        results.append(BenchmarkResult("examples", f"examples/{name}", samples))
+
+    return results
+
+
+def benchmark_getters(repeat: int = 5, warmup: int = 1) -> List[BenchmarkResult]:
+    """
+    Benchmarks the throughput of each `CommandLineArguments` getter.
+    """
+
+    args = CommandLineArguments(
+        {
+            "bool": True,
+            "integer": "42",
+            "list": ["foo", "bar"],
+            "string": "foo",
+        }
+    )
+
+    getters = {
+        "get_bool": lambda: args.get_bool("bool"),
+        "get_integer": lambda: args.get_integer("integer"),
+        "get_list": lambda: args.get_list("list"),
+        "get_raw": lambda: args.get_raw("string"),
+        "get_string": lambda: args.get_string("string"),
+    }
+
+    return [
+        BenchmarkResult(
+            "getters",
+            f"getters/{name}",
+            sample(getter, repeat, number=10_000, warmup=warmup),
+        )
+        for name, getter in getters.items()
+    ]
+
+
+def benchmark_imports(
+    modules: Sequence[str] = ("cline", "cline.cli"),
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[BenchmarkResult]:
+    """
+    Benchmarks importing each of `modules` in a new interpreter.
+    """
+
+    results: List[BenchmarkResult] = []
+
+    for module in modules:
+        code = IMPORT_CODE.format(module=module)
+        samples = [
+            int(check_output([executable, "-c", code])) / 1_000_000_000
+            for _ in range(warmup + repeat)
+        ][warmup:]
+        results.append(BenchmarkResult("imports", f"imports/{module}", samples))
+
+    return results
+
+
+def benchmark_make_cli_args(
+    sizes: Sequence[int],
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[BenchmarkResult]:
+    """
+    Benchmarks `ArgumentParserCli.make_cli_args()` on each number of command
+    line arguments in `sizes`.
+    """
+
+    cli = _BenchArgumentParserCli(args=[], out=StringIO())
+    cli.warm()
+
+    results: List[BenchmarkResult] = []
+
+    for size in sizes:
+        args = make_args(size)
+        samples = sample(lambda: cli.make_cli_args(args), repeat, warmup=warmup)
+        results.append(
+            BenchmarkResult("make_cli_args", f"make_cli_args/{size}", samples)
+        )
+
+    return results
+
+
+def dump_results(results: List[BenchmarkResult], app_version: str = "") -> str:
+    """
+    Serialises benchmark results as JSON, along with the versions and platform
+    they were measured on.
+    """
+
+    return dumps(
+        {
+            "cline": app_version,
+            "platform": platform(),
+            "python": f"{python_implementation()} {python_version()}",
+            "results": [r.to_dict() for r in results],
+        },
+        indent=2,
+    )
+
+
+def run_suite(
+    groups: Optional[Sequence[str]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+) -> List[BenchmarkResult]:
+    """
+    Runs the benchmark suite.
+
+    Arguments:
+        groups: Names of the groups to run. Defaults to all of them.
+        repeat: Maximum number of rounds of each benchmark.
+        warmup: Number of untimed rounds before each benchmark.
+    """
+
+    benchmarks: Dict[str, Callable[[], List[BenchmarkResult]]] = {
+        "dispatch": lambda: benchmark_dispatch([1, 50, 500], repeat, warmup),
+        "examples": lambda: benchmark_examples(repeat, warmup),
+        "getters": lambda: benchmark_getters(repeat, warmup),
+        "imports": lambda: benchmark_imports(repeat=repeat, warmup=warmup),
+        "make_cli_args": lambda: benchmark_make_cli_args(
+            [10, 100, 1_000], repeat, warmup
+        ),
+    }
+
+    results: List[BenchmarkResult] = []
+
+    for group, benchmark in benchmarks.items():
+        if groups is None or group in groups:
+            results.extend(benchmark())
+
+    return results
+
+
+def format_seconds(seconds: float) -> str:
+    """
+    Formats a duration in the most readable unit.
+    """
+
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f}{unit}"
+
+    return f"{seconds / 1e-9:.3f}ns"
+
+
+def write_results(results: List[BenchmarkResult], out: IO[str]) -> None:
+    """
+    Writes benchmark results as a human-readable table.
+    """
+
+    width = max([len("benchmark"), *[len(r.name) for r in results]])
+
+    out.write(f"{'benchmark':<{width}} {'fastest':>11} {'median':>11} {'rounds':>6}\n")
+
+    for result in results:
+        out.write(
+            f"{result.name:<{width}} "
+            + f"{format_seconds(result.fastest):>11} "
+            + f"{format_seconds(result.median):>11} "
+            + f"{len(result.samples):>6}\n"
+        )
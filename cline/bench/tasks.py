@@ -0,0 +1,175 @@
+from dataclasses import dataclass
+from os.path import exists
+from typing import List, Optional, Sequence
+
+from cline.bench.compare import (
+    COMPARE_GROUPS,
+    compare_results,
+    read_baseline,
+    write_comparisons,
+)
+from cline.bench.parsers import benchmark_parsers
+from cline.bench.suite import dump_results, run_suite, write_results
+from cline.cli_args import CommandLineArguments
+from cline.exceptions import CannotMakeArguments
+from cline.tasks import Task
+
+PARSERS_SIZES = [10, 1_000, 10_000]
+"""
+Default numbers of arguments to compare `ArgumentParser` with `ArgumentSpec`
+on, which take a few seconds in all.
+"""
+
+
+class ParsersTask(Task[List[int]]):
+    """
+    Compares `ArgumentParser` with `ArgumentSpec`.
+    """
+
+    def invoke(self) -> int:
+        self.out.write(
+            f"{'arguments':>10} {'argparse':>12} {'spec':>12} {'speed-up':>9}\n"
+        )
+        self.out.flush()
+
+        # Large sizes are slow, so write each row as soon as it's measured:
+        for size in self.args:
+            for result in benchmark_parsers([size]):
+                self.out.write(
+                    f"{result['arguments']:>10,.0f} "
+                    + f"{result['argparse'] * 1000:>10.3f}ms "
+                    + f"{result['spec'] * 1000:>10.3f}ms "
+                    + f"{result['argparse'] / result['spec']:>8.1f}x\n"
+                )
+            self.out.flush()
+
+        return 0
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> List[int]:
+        args.assert_true("parsers")
+        sizes = args.get_raw("size")
+        return [int(s) for s in sizes] if isinstance(sizes, list) else PARSERS_SIZES
+
+
+@dataclass
+class CompareArgs:
+    baseline: str
+    groups: Sequence[str]
+    repeat: int
+    save: bool
+    threshold: float
+    version: str
+    warmup: int
+
+
+class CompareTask(Task[CompareArgs]):
+    """
+    Compares the benchmark suite with a baseline, or saves a new baseline.
+    """
+
+    def invoke(self) -> int:
+        results = run_suite(
+            groups=self.args.groups,
+            repeat=self.args.repeat,
+            warmup=self.args.warmup,
+        )
+
+        if self.args.save or not exists(self.args.baseline):
+            with open(self.args.baseline, "w", encoding="utf-8") as f:
+                f.write(dump_results(results, self.args.version))
+                f.write("\n")
+
+            write_results(results, self.out)
+            self.out.write(f"Saved baseline to {self.args.baseline}\n")
+            return 0
+
+        with open(self.args.baseline, encoding="utf-8") as f:
+            baseline = read_baseline(f)
+
+        comparisons = compare_results(baseline, results)
+        write_comparisons(comparisons, self.args.threshold, self.out)
+
+        regressed = [c for c in comparisons if c.regressed(self.args.threshold)]
+        if not regressed:
+            return 0
+
+        self.out.write(
+            f"🔥 {len(regressed)} of {len(comparisons)} benchmarks regressed by "
+            + f"more than {self.args.threshold:.0%}\n"
+        )
+        return 1
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> CompareArgs:
+        # Imported here since reading the version is only needed to run the
+        # suite:
+        from cline import __version__
+
+        args.assert_string("command", "compare")
+
+        try:
+            threshold = float(args.get_string("threshold")) / 100
+        except ValueError:
+            raise CannotMakeArguments()
+
+        groups = args.get_raw("group")
+
+        return CompareArgs(
+            baseline=args.get_string("baseline"),
+            groups=groups if isinstance(groups, list) else COMPARE_GROUPS,
+            repeat=args.get_integer("repeat"),
+            save=args.get_bool("save", False),
+            threshold=threshold,
+            version=__version__,
+            warmup=args.get_integer("warmup"),
+        )
+
+
+@dataclass
+class SuiteArgs:
+    groups: Optional[List[str]]
+    json: bool
+    repeat: int
+    version: str
+    warmup: int
+
+
+class SuiteTask(Task[SuiteArgs]):
+    """
+    Runs the benchmark suite.
+    """
+
+    def invoke(self) -> int:
+        results = run_suite(
+            groups=self.args.groups,
+            repeat=self.args.repeat,
+            warmup=self.args.warmup,
+        )
+
+        if self.args.json:
+            self.out.write(dump_results(results, self.args.version))
+            self.out.write("\n")
+        else:
+            write_results(results, self.out)
+
+        return 0
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> SuiteArgs:
+        # Imported here since reading the version is only needed to run the
+        # suite:
+        from cline import __version__
+
+        if args.get_raw("command") is not None:
+            raise CannotMakeArguments()
+
+        groups = args.get_raw("group")
+
+        return SuiteArgs(
+            groups=groups if isinstance(groups, list) else None,
+            json=args.get_bool("json", False),
+            repeat=args.get_integer("repeat"),
+            version=__version__,
+            warmup=args.get_integer("warmup"),
+        )
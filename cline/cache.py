@@ -0,0 +1,100 @@
+"""
+`cline.cache` persists files that are expensive to make (like argument parsers)
+in the user's cache directory.
+
+Caching is always best-effort: a cache that cannot be read or written is
+treated as empty.
+"""
+
+from hashlib import sha256
+from logging import getLogger
+from os import environ, replace
+from pathlib import Path
+from sys import platform
+from tempfile import NamedTemporaryFile
+from typing import Optional, Union
+
+
+def cache_dir() -> Path:
+    """
+    Gets Cline's cache directory.
+
+    Set the `CLINE_CACHE_DIR` environment variable to override the platform's
+    default user cache directory.
+    """
+
+    if path := environ.get("CLINE_CACHE_DIR"):
+        return Path(path)
+
+    if platform == "win32":
+        local = environ.get("LOCALAPPDATA")
+        root = Path(local) if local else Path.home() / "AppData" / "Local"
+    elif platform == "darwin":
+        root = Path.home() / "Library" / "Caches"
+    else:
+        xdg = environ.get("XDG_CACHE_HOME")
+        root = Path(xdg) if xdg else Path.home() / ".cache"
+
+    return root / "cline"
+
+
+def cache_key(*parts: Union[bytes, str]) -> str:
+    """
+    Makes a cache key that changes whenever any of `parts` changes.
+    """
+
+    hash = sha256()
+    for part in parts:
+        encoded = part.encode("utf-8") if isinstance(part, str) else part
+        hash.update(len(encoded).to_bytes(8, "big"))
+        hash.update(encoded)
+    return hash.hexdigest()
+
+
+def read_cache(group: str, key: str) -> Optional[bytes]:
+    """
+    Reads the cached value of `key` in `group`, or `None` if not cached.
+    """
+
+    try:
+        return (cache_dir() / group / key).read_bytes()
+    except OSError:
+        return None
+
+
+def write_cache(group: str, key: str, value: bytes, keep: int = 1) -> None:
+    """
+    Writes `value` as the cached value of `key` in `group`.
+
+    Only the `keep` most recently written keys in the group are kept, so by
+    default every other key is removed and groups should be scoped such that
+    only one key is ever current.
+    """
+
+    directory = cache_dir() / group
+
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file then move it into place so that concurrent
+        # processes never read a partially-written value:
+        with NamedTemporaryFile(dir=directory, delete=False, suffix=".tmp") as f:
+            f.write(value)
+
+        replace(f.name, directory / key)
+
+        others = [
+            path
+            for path in directory.iterdir()
+            if path.name != key and path.suffix != ".tmp"
+        ]
+
+        others.sort(key=lambda path: path.stat().st_mtime_ns, reverse=True)
+
+        # The value just written is one of the keys to keep:
+        kept = keep - 1
+        for path in others[kept:]:
+            path.unlink()
+
+    except OSError as ex:
+        getLogger("cline").debug("Failed to write cache %s/%s: %s", group, key, ex)
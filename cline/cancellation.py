@@ -0,0 +1,259 @@
+"""
+`cline.cancellation` cancels tasks cooperatively, and enforces deadlines and
+SIGTERM in the process that invokes them.
+"""
+
+from threading import Event, Lock, Timer
+from time import monotonic
+from typing import Callable, List, Optional
+
+from cline.exceptions import Cancelled
+
+CANCELLED = "cancelled"
+"""
+Reason for a cancellation requested by the host application.
+"""
+
+TERMINATED = "terminated"
+"""
+Reason for a cancellation requested by SIGTERM.
+"""
+
+TIMED_OUT = "timed out"
+"""
+Reason for a cancellation by a deadline passing.
+"""
+
+_POLL_SECONDS = 0.05
+"""
+Longest that `CancellationToken.wait()` waits before checking for a
+cancellation by a signal handler, which can't wake it.
+"""
+
+
+def exit_code(reason: str) -> int:
+    """
+    Gets the shell exit code of a task cancelled for `reason`: 102 for timing
+    out, otherwise 103.
+    """
+
+    return 102 if reason == TIMED_OUT else 103
+
+
+class CancellationToken:
+    """
+    Signals that a task should stop, either on request or when a deadline
+    passes.
+
+    Tasks call `check()` at convenient points to stop cooperatively. Tokens are
+    thread-safe, so one token can be shared by tasks on several threads.
+    """
+
+    def __init__(self) -> None:
+        self._deadline: Optional[float] = None
+        self._event = Event()
+        self._listeners: List[Callable[[], None]] = []
+        self._lock = Lock()
+        self._reason: Optional[str] = None
+
+        # Set by signal handlers, which mustn't take locks that the thread they
+        # interrupt might already hold:
+        self._signalled: Optional[str] = None
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Adds a function to call whenever the deadline changes.
+        """
+
+        self._listeners.append(listener)
+
+    def cancel(self, reason: str = CANCELLED) -> None:
+        """
+        Cancels the token. Only the first reason is kept.
+        """
+
+        with self._lock:
+            if self._reason is None:
+                self._reason = self._signalled or reason
+        self._event.set()
+
+    def cancel_after(self, seconds: float) -> None:
+        """
+        Cancels the token in `seconds` seconds, unless it's due to be
+        cancelled sooner.
+        """
+
+        deadline = monotonic() + seconds
+
+        with self._lock:
+            if self._deadline is not None and self._deadline <= deadline:
+                return
+            self._deadline = deadline
+
+        for listener in self._listeners:
+            listener()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Checks if the token has been cancelled or its deadline has passed.
+        """
+
+        if self._event.is_set():
+            return True
+
+        if self._signalled is not None:
+            # Wake any other waiters, which the signal handler couldn't:
+            self.cancel(self._signalled)
+            return True
+
+        if self._deadline is not None and monotonic() >= self._deadline:
+            self.cancel(TIMED_OUT)
+            return True
+
+        return False
+
+    def check(self) -> None:
+        """
+        Raises `Cancelled` if the token has been cancelled or its deadline has
+        passed.
+        """
+
+        if self.cancelled:
+            raise Cancelled(self.reason or CANCELLED)
+
+    def remove_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Removes a function added by `add_listener()`.
+        """
+
+        self._listeners.remove(listener)
+
+    @property
+    def reason(self) -> Optional[str]:
+        """
+        Gets the reason the token was cancelled, or `None` if it hasn't been.
+        """
+
+        return self._reason or self._signalled
+
+    @property
+    def remaining(self) -> Optional[float]:
+        """
+        Gets the number of seconds until the deadline (which is negative if it
+        has passed), or `None` if there isn't one.
+        """
+
+        if self._deadline is None:
+            return None
+        return self._deadline - monotonic()
+
+    def wait(self, seconds: Optional[float] = None) -> bool:
+        """
+        Waits until the token is cancelled, its deadline passes or `seconds`
+        seconds pass, and returns `True` if the token has been cancelled.
+
+        Use this rather than `time.sleep()` to sleep in a cancellable task.
+        """
+
+        remaining = self.remaining
+        if remaining is not None:
+            seconds = remaining if seconds is None else min(seconds, remaining)
+
+        until = None if seconds is None else monotonic() + seconds
+
+        while not self.cancelled:
+            timeout = _POLL_SECONDS if until is None else until - monotonic()
+            if timeout <= 0:
+                return self.cancelled
+            if self._event.wait(min(timeout, _POLL_SECONDS)):
+                return True
+
+        return True
+
+    def _signal(self, reason: str) -> None:
+        # Safe to call from a signal handler since it takes no locks. Waiters
+        # notice within `_POLL_SECONDS`.
+        if self._signalled is None:
+            self._signalled = reason
+
+
+def install_handlers(
+    token: CancellationToken,
+    preempt: Callable[[], bool],
+) -> Callable[[], None]:
+    """
+    Cancels `token` when the process receives SIGTERM and when the token's
+    deadline passes, and returns a function that uninstalls the handlers.
+
+    Handlers are only installed on the main thread. Deadlines are enforced by
+    SIGALRM where available, and otherwise by a timer thread.
+
+    Arguments:
+        token:   Cancellation token.
+        preempt: Function that returns `True` to also raise `Cancelled` on the
+                 main thread when the token is cancelled, which interrupts
+                 even a task that never checks the token.
+    """
+
+    # signal is only needed by processes that enforce cancellation:
+    import signal
+    from threading import current_thread, main_thread
+
+    if current_thread() is not main_thread():
+        return lambda: None
+
+    def cancel(reason: str) -> None:
+        token._signal(reason)
+        if preempt():
+            raise Cancelled(reason)
+
+    def on_sigterm(signum: int, frame: object) -> None:
+        cancel(TERMINATED)
+
+    restore: List[Callable[[], object]] = []
+
+    previous_sigterm = signal.signal(signal.SIGTERM, on_sigterm)
+    restore.append(lambda: signal.signal(signal.SIGTERM, previous_sigterm))
+
+    if hasattr(signal, "setitimer"):
+
+        def on_alarm(signum: int, frame: object) -> None:
+            cancel(TIMED_OUT)
+
+        def arm() -> None:
+            if (remaining := token.remaining) is not None:
+                # A zero delay would disarm the timer:
+                signal.setitimer(signal.ITIMER_REAL, max(remaining, 1e-6))
+
+        previous_alarm = signal.signal(signal.SIGALRM, on_alarm)
+        restore.append(lambda: signal.signal(signal.SIGALRM, previous_alarm))
+        restore.append(lambda: signal.setitimer(signal.ITIMER_REAL, 0))
+
+    else:
+        timers: List[Timer] = []
+
+        def arm() -> None:
+            if (remaining := token.remaining) is not None:
+                for timer in timers:
+                    timer.cancel()
+                timer = Timer(max(remaining, 0), token.cancel, (TIMED_OUT,))
+                timer.daemon = True
+                timer.start()
+                timers.append(timer)
+
+        def cancel_timers() -> None:
+            for timer in timers:
+                timer.cancel()
+
+        restore.append(cancel_timers)
+
+    token.add_listener(arm)
+    arm()
+
+    def uninstall() -> None:
+        token.remove_listener(arm)
+        for undo in reversed(restore):
+            undo()
+
+    return uninstall
@@ -5,14 +5,24 @@ orchestrators of the host application.
 If you're happy using Python's baked-in `argparse.ArgumentParser` to parse
 arguments then create a CLI that inherits from `ArgumentParserCli`.
 
+To parse arguments faster against a declarative `ArgumentSpec` then create a CLI
+that inherits from `SpecCli`.
+
 To create a CLI with a custom argument parser then inherit from `Cli`.
 """
 
 from cline.cli.argument_parser_cli import ArgumentParserCli
 from cline.cli.cli import Cli, RegisteredTasks
+from cline.cli.spec import ArgumentSpec, Flag, Option, Positional
+from cline.cli.spec_cli import SpecCli
 
 __all__ = [
     "ArgumentParserCli",
+    "ArgumentSpec",
     "Cli",
+    "Flag",
+    "Option",
+    "Positional",
     "RegisteredTasks",
+    "SpecCli",
 ]
@@ -1,9 +1,21 @@
-from argparse import ArgumentParser
-from typing import List
+from argparse import SUPPRESS, ArgumentParser
+from os.path import basename
+from shutil import get_terminal_size
+from sys import argv
+from time import perf_counter_ns
+from typing import List, Tuple
 
+from cline.cache import cache_key, read_cache, write_cache
 from cline.cli.cli import Cli
+from cline.cli.parser_cache import dump_parser, load_parser, parser_key
 from cline.cli_args import CommandLineArguments
 
+_HELP_CACHE_SIZE = 8
+"""
+Number of renders of each CLI's help to cache, such as for several terminal
+widths.
+"""
+
 
 class ArgumentParserCli(Cli[ArgumentParser]):
     """
@@ -11,6 +23,48 @@ class ArgumentParserCli(Cli[ArgumentParser]):
     command line arguments.
     """
 
+    cache_help = False
+    """
+    `True` to cache the rendered help in the user's cache directory so that
+    later requests for help are written without making the argument parser or
+    formatting the help.
+
+    Help is cached for each terminal width and program name, up to a few of
+    them. The cache is invalidated whenever the argument parser's cache would
+    be.
+    """
+
+    cache_parser = False
+    """
+    `True` to cache the argument parser in the user's cache directory so that
+    later invocations don't need to make it again.
+
+    The cache is invalidated whenever the host application version, the Python
+    version, `parser_version`, `make_parser()` or the module of the CLI or any
+    of its base classes changes. If `make_parser()` calls code in any other
+    module, change `parser_version` whenever that code changes.
+    """
+
+    parser_version = ""
+    """
+    Version of the argument parser, to invalidate cached parsers and help when
+    changes to the parser aren't otherwise detected.
+    """
+
+    def list_options(self) -> List[Tuple[str, str]]:
+        """
+        Gets the command line flags of every option, and their help text.
+
+        Options with suppressed help are omitted.
+        """
+
+        return [
+            (flag, action.help or "")
+            for action in self.parser._actions
+            if action.help != SUPPRESS
+            for flag in action.option_strings
+        ]
+
     def make_cli_args(self, args: List[str]) -> CommandLineArguments:
         """
         Parses `args` to make and return `CommandLineArguments`.
@@ -31,9 +85,62 @@ class ArgumentParserCli(Cli[ArgumentParser]):
             unknown=unknown,
         )
 
+    @property
+    def parser(self) -> ArgumentParser:
+        """
+        Gets the argument parser.
+        """
+
+        if self._parser is None and self.cache_parser:
+            started = perf_counter_ns()
+            self._parser = self._make_cached_parser()
+            self._record("parser", started)
+        return super().parser
+
     def write_help(self) -> None:
         """
         Renders application help to the output writer.
         """
 
-        self.parser.print_help(self.out)
+        if not self.cache_help:
+            self.parser.print_help(self.out)
+            return
+
+        cls = type(self)
+        group = f"help/{cls.__module__}.{cls.__qualname__}"
+
+        # `ArgumentParser` wraps help to the terminal width and names the
+        # running program by default, so both shape the rendered help:
+        key = cache_key(
+            parser_key(cls, self.app_version),
+            str(get_terminal_size().columns),
+            basename(argv[0]),
+        )
+
+        if cached := read_cache(group, key):
+            self._logger.debug("Loaded cached help %s/%s", group, key)
+            self.out.write(cached.decode("utf-8"))
+            return
+
+        help = self.parser.format_help()
+        write_cache(group, key, help.encode("utf-8"), keep=_HELP_CACHE_SIZE)
+        self.out.write(help)
+
+    def _make_cached_parser(self) -> ArgumentParser:
+        cls = type(self)
+        group = f"parsers/{cls.__module__}.{cls.__qualname__}"
+        key = parser_key(cls, self.app_version)
+
+        if cached := read_cache(group, key):
+            if parser := load_parser(cached):
+                self._logger.debug("Loaded cached parser %s/%s", group, key)
+                return parser
+
+        parser = self.make_parser()
+
+        if value := dump_parser(parser):
+            write_cache(group, key, value)
+        else:
+            self._logger.debug("%s cannot be cached", parser)
+
+        return parser
@@ -0,0 +1,61 @@
+from dataclasses import asdict, dataclass
+from json import dumps, loads
+from shlex import split
+from typing import List
+
+
+@dataclass
+class InvocationResult:
+    """
+    The result of one invocation in a batch.
+
+    Arguments:
+        args:      Command line arguments.
+        exit_code: Shell exit code.
+        output:    Output written by the task.
+    """
+
+    args: List[str]
+    exit_code: int
+    output: str
+
+    def to_json(self) -> str:
+        """
+        Serialises the result as a single line of JSON.
+        """
+
+        return dumps(asdict(self), ensure_ascii=False)
+
+
+def _exit_code(ex: SystemExit) -> int:
+    # Like `exit()`, no code means success and any other code failure:
+    return ex.code if isinstance(ex.code, int) else int(bool(ex.code))
+
+
+BATCH_FORMATS = ("json", "shell")
+"""
+Supported batch line formats:
+
+- "json": each line is a JSON list of strings, like `["--sum", "1", "2"]`
+- "shell": each line is shell-quoted, like `--sum 1 2`
+"""
+
+
+def parse_batch_line(line: str, format: str) -> List[str]:
+    """
+    Parses one line of a batch into command line arguments.
+
+    Raises:
+        ValueError: If the line cannot be parsed.
+    """
+
+    if format == "shell":
+        return split(line)
+
+    if format == "json":
+        args = loads(line)
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise ValueError("expected a JSON list of strings")
+        return args
+
+    raise ValueError(f'"{format}" is not a batch format {BATCH_FORMATS}')
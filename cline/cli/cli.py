@@ -1,14 +1,102 @@
 from abc import ABC, abstractmethod
-from logging import basicConfig, getLogger
-from sys import argv, stdout
-from typing import IO, Callable, List, Optional, Union
+from contextlib import redirect_stderr, redirect_stdout
+from copy import copy
+from io import StringIO
+from logging import DEBUG, basicConfig, getLogger
+from os import environ
+from os.path import basename
+from pathlib import Path
+from sys import argv, stderr, stdin, stdout
+from time import perf_counter_ns
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
+from cline.cancellation import CancellationToken, exit_code, install_handlers
+from cline.cli.batch import InvocationResult, _exit_code, parse_batch_line
+from cline.cli.dispatch import DispatchIndex, RegisteredTask
 from cline.cli_args import CommandLineArguments
 from cline.cli_protocol import CliProtocol, TParser
-from cline.exceptions import CannotMakeArguments, UserNeedsHelp, UserNeedsVersion
-from cline.tasks import AnyTask, AnyTaskType, HelpTask, VersionTask
+from cline.exceptions import (
+    Cancelled,
+    CannotMakeArguments,
+    InvalidArguments,
+    UserNeedsHelp,
+    UserNeedsVersion,
+)
+from cline.tasks import (
+    NO_MATCH,
+    AnyTask,
+    AnyTaskType,
+    AsyncTask,
+    HelpTask,
+    Selector,
+    Task,
+    VersionTask,
+)
+from cline.tasks.help import HelpArgs
+from cline.timings import TIMINGS_ENV, Timings
+from cline.writers import make_binary_writer, make_buffered_writer
 
-RegisteredTasks = List[AnyTaskType]
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoopPolicy
+
+    from cline.cli.dispatch_memo import DispatchMemo
+
+RegisteredTasks = List[RegisteredTask]
+
+_DEFAULT_TRY_MAKE_ARGS = getattr(Task.try_make_args, "__func__")
+
+TCli = TypeVar("TCli", bound="Cli[Any]")
+
+
+def _run(
+    coroutine: Coroutine[Any, Any, int],
+    event_loop_policy: Optional["AbstractEventLoopPolicy"],
+) -> int:
+    # asyncio is expensive to import, and only asynchronous tasks need it:
+    from asyncio import get_event_loop_policy, run, set_event_loop_policy
+
+    if event_loop_policy is None:
+        return run(coroutine)
+
+    previous = get_event_loop_policy()
+    set_event_loop_policy(event_loop_policy)
+    try:
+        return run(coroutine)
+    finally:
+        set_event_loop_policy(previous)
+
+
+def _overrides_try_make_args(task: AnyTaskType) -> bool:
+    # Tasks that don't override `try_make_args()` are probed via `make_args()`
+    # so that any `InvalidArguments` they raise can be reported:
+    method = getattr(task.try_make_args, "__func__", None)
+    return method is not _DEFAULT_TRY_MAKE_ARGS
+
+
+def _configure_logging(
+    init_logging: bool,
+    log_level: Optional[Union[int, str]],
+) -> None:
+    if init_logging:
+        fmt = "%(levelname)s • %(name)s • %(pathname)s:%(lineno)d • %(message)s"
+        basicConfig(format=fmt)
+
+    if log_level is not None:
+        getLogger("cline").setLevel(log_level)
 
 
 class Cli(ABC, CliProtocol[TParser]):
@@ -19,6 +107,46 @@ class Cli(ABC, CliProtocol[TParser]):
         app_version: Host application version (defaults to empty)
         args:        Original command line arguments (defaults to argv)
         out:         stdout or equivalent output writer (defaults to stdout)
+
+    Keyword-only arguments:
+        cancellation: Cancellation token for tasks (defaults to a new token)
+        in_bytes:     Binary input reader for tasks (defaults to stdin)
+        out_bytes:    Binary output writer (defaults to a writer to the same
+                      destination as `out`)
+        timings:      Recorder of phase timings (defaults to no recording)
+    """
+
+    memo_dispatch = False
+    """
+    `True` to remember which task each shape of command line arguments (the
+    subcommand, and which arguments are set and their types) was dispatched
+    to, in the user's cache directory, and to try that task first next time.
+
+    Only enable this if every task that accepts one set of arguments accepts
+    any other set of the same shape, since a remembered task is tried before
+    tasks of higher priority. The memo is invalidated whenever the host
+    application version or the registered tasks change.
+    """
+
+    pipeline_separator: Optional[str] = None
+    """
+    Command line argument that separates the stages of a pipeline, like "+",
+    or `None` to disable pipelines on the command line.
+
+    For example, with a separator of "+", invoking "app extract + transform"
+    invokes `pipeline([["extract"], ["transform"]], threaded=True)`.
+    """
+
+    shortcut_flags: Sequence[str] = ()
+    """
+    Flags to answer before the argument parser is made or any tasks are
+    registered, when they're the only command line argument. Any of "-h",
+    "--help" and "--version" (if the host application version is known).
+
+    Only declare flags that the argument parser defines and that no registered
+    task handles itself. For example:
+
+        shortcut_flags = ("-h", "--help", "--version")
     """
 
     def __init__(
@@ -26,18 +154,55 @@ class Cli(ABC, CliProtocol[TParser]):
         app_version: str = "",
         args: Optional[List[str]] = None,
         out: Optional[IO[str]] = None,
+        *,
+        cancellation: Optional[CancellationToken] = None,
+        in_bytes: Optional[IO[bytes]] = None,
+        out_bytes: Optional[IO[bytes]] = None,
+        timings: Optional[Timings] = None,
     ) -> None:
         self._logger = getLogger("cline")
 
         self._app_version = app_version
+        self._cancellation = cancellation
         self._cli_args: Optional[CommandLineArguments] = None
+        self._dispatch: Optional[DispatchIndex] = None
+        self._dispatch_memo: Optional["DispatchMemo"] = None
+        self._in_bytes = in_bytes
+        self._invalid_arguments: Optional[InvalidArguments] = None
         self._out = out or stdout
+        self._out_bytes = out_bytes
         self._parser: Optional[TParser] = None
         self._raw_args = args or argv[1:]
-        self._tasks: Optional[List[AnyTaskType]] = None
+        self._task_cooperates = False
+        self._timings = timings
 
         self._logger.debug("%s initialised", self.__class__)
 
+    async def ainvoke(self) -> int:
+        """
+        Invokes the correct task for the command line arguments on the running
+        event loop and returns the shell exit code.
+
+        Asynchronous tasks are awaited. Synchronous tasks are invoked directly.
+
+        `KeyboardInterrupt` is not handled.
+        """
+
+        try:
+            task = self.task
+            self._start_task(task)
+            started = perf_counter_ns()
+            try:
+                if isinstance(task, AsyncTask):
+                    return await task.ainvoke()
+                return task.invoke()
+            finally:
+                self._record("invoke", started, task)
+        except Exception as ex:
+            return self.handle_exception(ex)
+        finally:
+            self.flush()
+
     @property
     def app_version(self) -> str:
         """
@@ -46,6 +211,16 @@ class Cli(ABC, CliProtocol[TParser]):
 
         return self._app_version
 
+    @property
+    def cancellation(self) -> CancellationToken:
+        """
+        Gets the cancellation token that tasks are made with.
+        """
+
+        if self._cancellation is None:
+            self._cancellation = CancellationToken()
+        return self._cancellation
+
     @property
     def cli_args(self) -> CommandLineArguments:
         """
@@ -53,9 +228,123 @@ class Cli(ABC, CliProtocol[TParser]):
         """
 
         if not self._cli_args:
-            self._cli_args = self.make_cli_args(args=self._raw_args)
+            # Subcommand words are routed rather than parsed:
+            routed = len(self.command)
+            args = self._raw_args[routed:]
+            started = perf_counter_ns()
+            self._cli_args = self.make_cli_args(args=args)
+            self._record("parse", started)
         return self._cli_args
 
+    @property
+    def command(self) -> Tuple[str, ...]:
+        """
+        Gets the registered subcommand that the command line arguments begin
+        with, or an empty tuple if they don't begin with one.
+        """
+
+        return self.dispatch.match_command(self._raw_args)
+
+    @property
+    def dispatch(self) -> DispatchIndex:
+        """
+        Gets the index of registered tasks.
+        """
+
+        if self._dispatch is None:
+            started = perf_counter_ns()
+            self._dispatch = DispatchIndex(self.register_tasks())
+            self._record("register", started)
+        return self._dispatch
+
+    @property
+    def dispatch_memo(self) -> Optional["DispatchMemo"]:
+        """
+        Gets the memo of dispatched tasks, if `memo_dispatch` is enabled.
+        """
+
+        if self._dispatch_memo is None and self.memo_dispatch:
+            # Imported here since most CLIs don't memoise dispatch:
+            from cline.cli.dispatch_memo import DispatchMemo
+
+            tasks = self.dispatch.tasks
+            self._dispatch_memo = DispatchMemo(type(self), self.app_version, tasks)
+        return self._dispatch_memo
+
+    def flush(self) -> None:
+        """
+        Flushes the output writers.
+        """
+
+        self._out.flush()
+        if self._out_bytes is not None:
+            self._out_bytes.flush()
+
+    def handle_exception(self, ex: Exception) -> int:
+        """
+        Handles an exception raised by a task and returns the shell exit code.
+        """
+
+        if isinstance(ex, UserNeedsHelp):
+            self.write_help()
+            return 0 if ex.explicit else 1
+
+        if isinstance(ex, UserNeedsVersion):
+            self.out.write(self.app_version)
+            self.out.write("\n")
+            return 0
+
+        if isinstance(ex, InvalidArguments):
+            self.out.write("🔥 ")
+            self.out.write(str(ex))
+            self.out.write("\n")
+            return 1
+
+        if isinstance(ex, Cancelled):
+            self.out.write("🔥 ")
+            self.out.write(ex.reason)
+            self.out.write("\n")
+            return exit_code(ex.reason)
+
+        self._logger.exception(ex)
+        self.out.write("🔥 ")
+        self.out.write(str(ex))
+        self.out.write("\n")
+        return 101
+
+    def invoke(
+        self,
+        event_loop_policy: Optional["AbstractEventLoopPolicy"] = None,
+    ) -> int:
+        """
+        Invokes the correct task for the command line arguments and returns the
+        shell exit code.
+
+        Asynchronous tasks are awaited on a new event loop.
+
+        `KeyboardInterrupt` is not handled.
+
+        Arguments:
+            event_loop_policy: Event loop policy (for example,
+            `uvloop.EventLoopPolicy()`) to run asynchronous tasks with. Defaults
+            to the current policy.
+        """
+
+        separator = self.pipeline_separator
+        if separator and separator in self._raw_args:
+            # Imported here since most invocations aren't pipelines:
+            from cline.cli.pipeline import split_pipeline
+
+            stages = split_pipeline(self._raw_args, separator)
+            return self.pipeline(stages, threaded=True)
+
+        try:
+            return self._invoke_task(event_loop_policy)
+        except Exception as ex:
+            return self.handle_exception(ex)
+        finally:
+            self.flush()
+
     @classmethod
     def invoke_and_exit(
         cls,
@@ -65,11 +354,26 @@ class Cli(ABC, CliProtocol[TParser]):
         init_logging: bool = True,
         log_level: Optional[Union[int, str]] = None,
         out: Optional[IO[str]] = None,
+        *,
+        buffer_size: Optional[int] = None,
+        event_loop_policy: Optional["AbstractEventLoopPolicy"] = None,
+        in_bytes: Optional[IO[bytes]] = None,
+        out_bytes: Optional[IO[bytes]] = None,
+        timings: Union[bool, Callable[[Timings], None]] = False,
+        timeout: Optional[float] = None,
     ) -> None:
         """
         Invokes the correct task for the given command line arguments then
         exits.
 
+        Output is flushed before exiting, whether the task succeeds, fails or
+        is interrupted.
+
+        SIGTERM and timeouts cancel the task. A task that sets
+        `cancel_cooperatively` is left to stop by itself, and any other task is
+        interrupted by a `Cancelled` exception. A task that times out exits
+        with 102, and a task that's terminated exits with 103.
+
         Arguments:
             app_version: Host application version.
 
@@ -83,37 +387,247 @@ class Cli(ABC, CliProtocol[TParser]):
             log_level: Log level.
 
             out: Output writer. Defaults to stdout.
+
+        Keyword-only arguments:
+            buffer_size: Size in bytes of the output buffer. Set a large size
+            (like 1 MB) for tasks that write a lot of output, and have them
+            flush explicitly whenever output must be seen immediately. Defaults
+            to the output writer's own buffering.
+
+            event_loop_policy: Event loop policy (for example,
+            `uvloop.EventLoopPolicy()`) to run asynchronous tasks with. Defaults
+            to the current policy.
+
+            in_bytes: Binary input reader for tasks. Defaults to stdin.
+
+            out_bytes: Binary output writer. Defaults to a writer to the same
+            destination as `out`.
+
+            timings: `True` to record the timing of each phase of the
+            invocation and print a summary to stderr, or a method to call with
+            the recorded `Timings`. Also enabled by setting the `CLINE_TIMINGS`
+            environment variable.
+
+            timeout: Number of seconds that the invocation may run for before
+            it's cancelled. A task's own `timeout` can only make this shorter.
         """
 
         callback = callback or exit
+        _configure_logging(init_logging, log_level)
+
+        if buffer_size is not None:
+            out = make_buffered_writer(out or stdout, buffer_size)
+
+        if not timings and environ.get(TIMINGS_ENV, "0") not in ("", "0"):
+            timings = True
+
+        recorder = Timings() if timings else None
 
-        if init_logging:
-            fmt = "%(levelname)s • %(name)s • %(pathname)s:%(lineno)d • %(message)s"
-            basicConfig(format=fmt)
+        cancellation = CancellationToken()
+        if timeout is not None:
+            cancellation.cancel_after(timeout)
 
-        if log_level is not None:
-            getLogger("cline").setLevel(log_level)
+        cli = cls(
+            app_version=app_version,
+            args=args,
+            cancellation=cancellation,
+            in_bytes=in_bytes,
+            out=out,
+            out_bytes=out_bytes,
+            timings=recorder,
+        )
+
+        uninstall = install_handlers(cancellation, lambda: not cli._task_cooperates)
 
-        cli = cls(app_version=app_version, args=args, out=out)
         try:
-            exit_code = cli.task.invoke()
+            code = cli.invoke(event_loop_policy=event_loop_policy)
         except KeyboardInterrupt:
-            exit_code = 100
-        except UserNeedsHelp as ex:
-            cli.write_help()
-            exit_code = 0 if ex.explicit else 1
-        except UserNeedsVersion:
-            cli.out.write(cli.app_version)
-            cli.out.write("\n")
-            exit_code = 0
-        except Exception as ex:
-            getLogger("cline").exception(ex)
-            cli.out.write("🔥 ")
-            cli.out.write(str(ex))
-            cli.out.write("\n")
-            exit_code = 101
+            code = 100
+        except Cancelled as ex:
+            # Cancelled outside of the task, so its output may not be flushed:
+            code = exit_code(ex.reason)
+            try:
+                cli.flush()
+            except Exception:
+                pass
+        finally:
+            uninstall()
+
+        if recorder:
+            if callable(timings):
+                timings(recorder)
+            else:
+                recorder.write_summary(stderr)
+
+        callback(code)
+
+    @classmethod
+    def invoke_batch(
+        cls,
+        app_version: str = "",
+        batch: Optional[Union[IO[str], str]] = None,
+        callback: Optional[Callable[[int], None]] = None,
+        format: str = "shell",
+        init_logging: bool = True,
+        log_level: Optional[Union[int, str]] = None,
+        out: Optional[IO[str]] = None,
+    ) -> None:
+        """
+        Invokes the correct task for each line of command line arguments in a
+        batch then exits.
+
+        The argument parser and registered tasks are made once and reused for
+        every line. The result of each line is written in order as a line of
+        JSON with "args", "exit_code" and "output" properties.
+
+        Arguments:
+            app_version: Host application version.
+
+            batch: Batch reader or path to a batch file. Defaults to stdin.
+
+            callback: Method to call on completion with the highest exit code
+            of any line. Defaults to `exit`.
+
+            format: Format of each line: "shell" for shell-quoted arguments or
+            "json" for a JSON list of strings.
+
+            init_logging: `True` to have Cline initialise logging. `False` to
+            initialise logging yourself.
+
+            log_level: Log level.
+
+            out: Output writer. Defaults to stdout.
+        """
+
+        callback = callback or exit
+        _configure_logging(init_logging, log_level)
+
+        cli = cls(app_version=app_version, args=[], out=out)
+        cli.warm()
+
+        if isinstance(batch, str):
+            try:
+                reader: IO[str] = open(batch, encoding="utf-8")
+            except OSError as ex:
+                callback(cli.handle_exception(ex))
+                return
+        else:
+            reader = batch or stdin
+
+        highest_exit_code = 0
+
+        try:
+            for number, line in enumerate(reader, start=1):
+                if not line.strip():
+                    continue
+
+                try:
+                    args = parse_batch_line(line, format)
+                except ValueError as ex:
+                    message = f"🔥 line {number}: {ex}\n"
+                    result = InvocationResult(args=[], exit_code=101, output=message)
+                else:
+                    result = cli.invoke_captured(args)
+
+                highest_exit_code = max(highest_exit_code, result.exit_code)
+                cli.out.write(result.to_json())
+                cli.out.write("\n")
+                cli.out.flush()
+
+        except KeyboardInterrupt:
+            highest_exit_code = 100
+
+        finally:
+            if isinstance(batch, str):
+                reader.close()
+
+        callback(highest_exit_code)
+
+    def invoke_captured(self, args: List[str]) -> InvocationResult:
+        """
+        Invokes the correct task for `args`, reusing this CLI's argument parser
+        and registered tasks, and captures its output.
+
+        An argument parser that exits (like `ArgumentParser` on invalid
+        arguments) exits only this invocation, and anything it writes to stdout
+        or stderr is captured too.
+
+        `KeyboardInterrupt` is not handled.
+        """
+
+        out = StringIO()
+        cli = self.with_args(args, out=out)
+
+        try:
+            with redirect_stderr(out), redirect_stdout(out):
+                exit_code = cli.invoke()
+        except SystemExit as ex:
+            exit_code = _exit_code(ex)
+
+        return InvocationResult(args=args, exit_code=exit_code, output=out.getvalue())
+
+    @classmethod
+    def invoke_many(
+        cls,
+        arg_lists: Iterable[List[str]],
+        app_version: str = "",
+        chunksize: int = 1,
+        ordered: bool = True,
+        workers: Optional[int] = None,
+    ) -> Iterator[Tuple[int, InvocationResult]]:
+        """
+        Invokes the correct task for each set of command line arguments across
+        a pool of worker processes.
+
+        Each worker makes its argument parser and registers tasks once, then
+        reuses them for every invocation it performs.
 
-        callback(exit_code)
+        Arguments:
+            arg_lists: Sets of command line arguments.
+
+            app_version: Host application version.
+
+            chunksize: Number of invocations to send to a worker at a time.
+            Only applies to ordered results.
+
+            ordered: `True` to yield results in the order of `arg_lists`.
+            `False` to yield results as they complete.
+
+            workers: Number of worker processes. Defaults to the number of
+            processors.
+
+        Returns:
+            Index of each set of command line arguments and its result.
+        """
+
+        # Imported here since most processes never need a pool:
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        from cline.cli.pool import init_worker, invoke_in_worker
+
+        with ProcessPoolExecutor(
+            initargs=(cls, app_version),
+            initializer=init_worker,
+            max_workers=workers,
+        ) as executor:
+            items = enumerate(arg_lists)
+
+            if ordered:
+                yield from executor.map(invoke_in_worker, items, chunksize=chunksize)
+                return
+
+            futures = [executor.submit(invoke_in_worker, item) for item in items]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def list_options(self) -> List[Tuple[str, str]]:
+        """
+        Gets the command line flags of every option, and their help text.
+
+        Used to make the completion index. Returns no options by default.
+        """
+
+        return []
 
     @abstractmethod
     def make_cli_args(self, args: List[str]) -> CommandLineArguments:
@@ -127,13 +641,26 @@ class Cli(ABC, CliProtocol[TParser]):
             Parsed command line arguments
         """
 
+    def make_completion_index(self) -> str:
+        """
+        Makes a shell completion index of the registered subcommands and the
+        argument parser's options.
+
+        Lazily-registered tasks are not imported.
+        """
+
+        # Imported here since only completion needs it:
+        from cline.completion.index import make_index
+
+        return make_index(self.dispatch.commands, self.list_options(), self.app_version)
+
     def make_help_task(self) -> HelpTask:
         """
         Gets an instance of the help task.
         """
 
         args = HelpTask.make_args(self.cli_args)
-        return HelpTask(args=args, out=self.out)
+        return HelpTask(args=args, out=self.out, out_bytes=self.out_bytes)
 
     @abstractmethod
     def make_parser(self) -> TParser:
@@ -141,26 +668,68 @@ class Cli(ABC, CliProtocol[TParser]):
         Creates and returns an argument parser.
         """
 
-    def make_task(self, task: AnyTaskType) -> Optional[AnyTask]:
+    def make_task(
+        self,
+        task: AnyTaskType,
+        selector: Optional[Selector] = None,
+    ) -> Optional[AnyTask]:
         """
         Attempts to make a task instance.
 
         Arguments:
-            task: Task class
+            task:     Task class
+            selector: Selector that the task was registered with, if it differs
+                      from the task's own (like a lazy task's)
 
         Returns
             Task or `None`
         """
 
+        # Parse before starting the clock so that parsing isn't counted as
+        # probing:
+        cli_args = self.cli_args
+
+        # Probing is the hot path of dispatch, so only pay for logging when
+        # it's enabled:
+        debug = self._logger.isEnabledFor(DEBUG)
+
+        started = perf_counter_ns()
         try:
-            self._logger.debug("Asking %s to make arguments", task)
-            args = task.make_args(self.cli_args)
-            self._logger.debug("%s made arguments", task)
-            return task(args=args, out=self.out)
-        except (CannotMakeArguments, CannotMakeArguments):
-            self._logger.debug("%s failed to make arguments", task)
+            if debug:
+                self._logger.debug("Asking %s to make arguments", task)
+            if _overrides_try_make_args(task):
+                args = task.try_make_args(cli_args)
+            else:
+                args = task.make_args(cli_args)
+        except CannotMakeArguments as ex:
+            # A task that was selected by these arguments but found them invalid
+            # can explain the problem better than help can:
+            selected = selector or task.selector
+            if isinstance(ex, InvalidArguments) and selected:
+                self._invalid_arguments = self._invalid_arguments or ex
+            args = NO_MATCH
+        finally:
+            self._record("probe", started, task)
+
+        if args is NO_MATCH:
+            if debug:
+                self._logger.debug("%s failed to make arguments", task)
             return None
 
+        if debug:
+            self._logger.debug("%s made arguments", task)
+
+        started = perf_counter_ns()
+        instance = task(args=args, out=self.out)
+
+        # Tasks that override `__init__(args, out)` don't accept the optional
+        # constructor arguments, so set them after construction:
+        instance._cancellation = self.cancellation
+        instance._in_bytes = self._in_bytes
+        instance._out_bytes = self.out_bytes
+        self._record("construct", started, task)
+        return instance
+
     @property
     def out(self) -> IO[str]:
         """
@@ -169,6 +738,16 @@ class Cli(ABC, CliProtocol[TParser]):
 
         return self._out
 
+    @property
+    def out_bytes(self) -> IO[bytes]:
+        """
+        Gets the binary output writer.
+        """
+
+        if self._out_bytes is None:
+            self._out_bytes = make_binary_writer(self._out)
+        return self._out_bytes
+
     @property
     def parser(self) -> TParser:
         """
@@ -176,40 +755,294 @@ class Cli(ABC, CliProtocol[TParser]):
         """
 
         if not self._parser:
+            started = perf_counter_ns()
             self._parser = self.make_parser()
+            self._record("parser", started)
         return self._parser
 
     @abstractmethod
     def register_tasks(self) -> RegisteredTasks:
         """
         Gets the host application tasks to consider for invocation.
+
+        Tasks can be registered as classes or, to avoid importing their modules
+        until they're needed, as `LazyTask` import paths.
+        """
+
+    @classmethod
+    def serve(
+        cls,
+        socket_path: str,
+        app_version: str = "",
+        init_logging: bool = True,
+        log_level: Optional[Union[int, str]] = None,
+    ) -> None:
+        """
+        Holds a warm CLI in this process and serves invocations on a Unix
+        socket until interrupted.
+
+        Invoke the application via the server by running:
+
+            python -m cline.daemon <socket_path> [ARG ...]
+
+        Arguments:
+            socket_path: Path to the Unix socket to listen on.
+
+            app_version: Host application version.
+
+            init_logging: `True` to have Cline initialise logging. `False` to
+            initialise logging yourself.
+
+            log_level: Log level.
+        """
+
+        # Imported here since most processes never serve:
+        from cline.daemon.server import serve
+
+        _configure_logging(init_logging, log_level)
+        serve(cls, socket_path, app_version)
+
+    def pipeline(
+        self,
+        arg_lists: Sequence[List[str]],
+        channel_size: int = 1_048_576,
+        threaded: bool = False,
+    ) -> int:
+        """
+        Invokes a pipeline of tasks in this process, where the output of each
+        task is the input of the next, and returns the shell exit code.
+
+        Each stage reuses this CLI's argument parser and registered tasks. The
+        first stage reads this CLI's input, and the last writes to this CLI's
+        output.
+
+        Like a shell with "pipefail" set, the exit code is that of the last
+        stage to fail, or 0 if every stage succeeds. A stage that fails because
+        the next stage stopped reading exits with 141, as if killed by SIGPIPE.
+
+        Arguments:
+            arg_lists: Command line arguments of each stage.
+
+            channel_size: Maximum number of bytes to hold between two threaded
+            stages before the writing stage waits for the reading stage.
+
+            threaded: `True` to invoke every stage concurrently on its own
+            thread, streaming through bounded channels. `False` to invoke the
+            stages one after another, holding each stage's entire output in
+            memory for the next.
+
+        Raises:
+            ValueError: If `arg_lists` is empty.
         """
 
+        # Imported here since most invocations aren't pipelines:
+        from cline.cli.pipeline import Channel, run_stages
+
+        if not arg_lists:
+            raise ValueError("a pipeline needs at least one stage")
+
+        max_bytes = channel_size if threaded else None
+        channels = [Channel(max_bytes) for _ in arg_lists[1:]]
+        stages: List[Cli[TParser]] = []
+
+        for index, args in enumerate(arg_lists):
+            into = channels[index].writer if index < len(channels) else None
+            stage = self.with_args(args, out=into)
+            if index:
+                stage._in_bytes = channels[index - 1].reader
+            # Cancelling the pipeline cancels every stage:
+            stage._cancellation = self.cancellation
+            stages.append(stage)
+
+        exit_codes = run_stages(stages, channels, threaded)
+        return next((c for c in reversed(exit_codes) if c), 0)
+
     @property
     def task(self) -> AnyTask:
         """
         Gets the task to perform.
+
+        Raises:
+            InvalidArguments: If no task can handle the command line arguments,
+            and a task with a matching selector found them invalid.
         """
 
-        if self._tasks is None:
-            self._tasks = self.register_tasks()
+        # A lone "--help" or "--version" can be answered before the arguments
+        # are parsed or any tasks are registered:
+        if len(self._raw_args) == 1 and self._raw_args[0] in self.shortcut_flags:
+            started = perf_counter_ns()
+            if shortcut := self._make_shortcut_task(self._raw_args[0]):
+                self._record("dispatch", started)
+                return shortcut
+
+        dispatch = self.dispatch
+        command = self.command
+        cli_args = self.cli_args
+
+        self._invalid_arguments = None
+
+        started = perf_counter_ns()
+        try:
+            # Walk through the candidate tasks in priority order, and use the
+            # first one that's able to make sense of the command line arguments:
+            positions = dispatch.positions(cli_args, command)
+            memo = self.dispatch_memo
+            shape = cli_args.shape if memo else ()
+
+            # Try the task that these arguments' shape was last dispatched to
+            # first, so that it's usually the only one probed:
+            if memo and (hinted := memo.get(command, shape)) in positions:
+                positions.remove(hinted)
+                positions.insert(0, hinted)
+
+            for position in positions:
+                task = dispatch.load(position)
+                selector = dispatch.selector(position)
+                if task_instance := self.make_task(task, selector):
+                    if memo:
+                        memo.put(command, shape, position)
+                        memo.save()
+                    return task_instance
 
-        # Walk through all the tasks in priority order, and use the first one
-        # that's able to make sense of the command line arguments:
-        for task in self._tasks:
-            if task_instance := self.make_task(task):
-                return task_instance
+            # If we know the host application's version then we can handle it:
+            if self._app_version:
+                if task_instance := self.make_task(VersionTask):
+                    return task_instance
 
-        # If we know the host application's version then we can handle it:
-        if self._app_version:
-            if task_instance := self.make_task(VersionTask):
-                return task_instance
+            # If a selected task found the arguments invalid then explain why:
+            if self._invalid_arguments:
+                raise self._invalid_arguments
 
-        # We know we can always make the help task:
-        return self.make_help_task()
+            # We know we can always make the help task:
+            return self.make_help_task()
+        finally:
+            self._record("dispatch", started)
+
+    @property
+    def timings(self) -> Optional[Timings]:
+        """
+        Gets the recorder of phase timings, if timings are enabled.
+        """
+
+        return self._timings
+
+    def warm(self, import_tasks: bool = False) -> None:
+        """
+        Makes the argument parser and registers tasks ahead of time, so that
+        CLIs made by `with_args()` don't need to.
+
+        Arguments:
+            import_tasks: `True` to also import every lazily-registered task.
+        """
+
+        # Both properties make and keep their values on first use:
+        self.parser
+        self.dispatch
+
+        if import_tasks:
+            for position in range(len(self.dispatch.tasks)):
+                self.dispatch.load(position)
+
+    def with_args(self: TCli, args: List[str], out: Optional[IO[str]] = None) -> TCli:
+        """
+        Makes a copy of this CLI for a different set of command line arguments.
+
+        The copy shares this CLI's argument parser and registered tasks, if
+        they have been made.
+
+        Arguments:
+            args: Command line arguments.
+            out:  Output writer. Defaults to this CLI's output writer.
+        """
+
+        cli = copy(self)
+        cli._cancellation = None
+        cli._cli_args = None
+        cli._out = out or self._out
+        cli._out_bytes = None if out else self._out_bytes
+        cli._raw_args = args
+        return cli
+
+    def write_completion(
+        self,
+        shell: str,
+        index_path: Optional[str] = None,
+        prog: Optional[str] = None,
+    ) -> None:
+        """
+        Writes the shell completion index to `index_path` then writes a shell
+        completion script that reads it to the output writer.
+
+        Arguments:
+            shell:      Shell to complete in: "bash", "fish" or "zsh".
+            index_path: Path to write the completion index to. Defaults to a
+                        path in Cline's cache directory.
+            prog:       Name of the program to complete. Defaults to the name
+                        of the running program.
+
+        Raises:
+            ValueError: If `shell` is not supported.
+        """
+
+        # Imported here since only completion needs them:
+        from cline.completion.index import default_index_path
+        from cline.completion.scripts import make_script
+
+        prog = prog or basename(argv[0])
+        path = Path(index_path) if index_path else default_index_path(prog)
+        script = make_script(shell, prog, str(path.absolute()))
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.make_completion_index(), encoding="utf-8")
+
+        self.out.write(script)
 
     @abstractmethod
     def write_help(self) -> None:
         """
         Renders application help to the output writer.
         """
+
+    def _invoke_task(
+        self, event_loop_policy: Optional["AbstractEventLoopPolicy"]
+    ) -> int:
+        # Invokes the correct task without handling any exceptions:
+        task = self.task
+        self._start_task(task)
+        started = perf_counter_ns()
+        try:
+            if isinstance(task, AsyncTask):
+                return _run(task.ainvoke(), event_loop_policy)
+            return task.invoke()
+        finally:
+            self._record("invoke", started, task)
+
+    def _make_shortcut_task(self, flag: str) -> Optional[AnyTask]:
+        if flag in ("-h", "--help"):
+            args = HelpArgs(explicit=True)
+            return HelpTask(args=args, out=self.out, out_bytes=self.out_bytes)
+
+        if flag == "--version" and self._app_version:
+            return VersionTask(args=None, out=self.out, out_bytes=self.out_bytes)
+
+        return None
+
+    def _record(
+        self,
+        phase: str,
+        started_ns: int,
+        task: Optional[Union[AnyTask, AnyTaskType]] = None,
+    ) -> None:
+        if self._timings is None:
+            return
+
+        if task is not None and not isinstance(task, type):
+            task = type(task)
+
+        name = task.__name__ if task else None
+        self._timings.record(phase, started_ns, name)
+
+    def _start_task(self, task: AnyTask) -> None:
+        self._task_cooperates = task.cancel_cooperatively
+        if task.timeout is not None:
+            self.cancellation.cancel_after(task.timeout)
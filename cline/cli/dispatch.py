@@ -0,0 +1,165 @@
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from cline.cli_args import CommandLineArguments
+from cline.tasks import AnyTaskType, LazyTask
+from cline.tasks.selector import Selector, SelectorValue
+
+RegisteredTask = Union[AnyTaskType, LazyTask]
+
+
+class _CommandNode:
+    def __init__(self) -> None:
+        self.children: Dict[str, _CommandNode] = {}
+        self.positions: List[int] = []
+
+
+class DispatchIndex:
+    """
+    Index of registered tasks by their declared selectors.
+
+    Tasks that don't declare a selector are always candidates, and are probed
+    in the usual way. Tasks that declare a subcommand are held in a tree of
+    subcommand words and are candidates only for that exact subcommand. Lazy
+    tasks are imported only when they become candidates.
+
+    Arguments:
+        tasks: Registered tasks in priority order.
+    """
+
+    def __init__(self, tasks: Sequence[RegisteredTask]) -> None:
+        self._tasks = list(tasks)
+        self._always: List[int] = []
+        self._commands = _CommandNode()
+        self._index: Dict[str, Dict[SelectorValue, List[int]]] = {}
+        self._selectors = [task.selector for task in self._tasks]
+
+        for position, selector in enumerate(self._selectors):
+            if selector and selector.command:
+                node = self._commands
+                for word in selector.command:
+                    node = node.children.setdefault(word, _CommandNode())
+                node.positions.append(position)
+                continue
+
+            key = selector.key if selector else None
+
+            if key is None:
+                self._always.append(position)
+                continue
+
+            arg, values = key
+            by_value = self._index.setdefault(arg, {})
+            for value in values:
+                by_value.setdefault(value, []).append(position)
+
+    def candidates(
+        self,
+        args: CommandLineArguments,
+        command: Sequence[str] = (),
+    ) -> Iterator[AnyTaskType]:
+        """
+        Yields the tasks that could handle the subcommand `command` and parsed
+        command line arguments `args`, in priority order.
+        """
+
+        for position in self.positions(args, command):
+            yield self.load(position)
+
+    @property
+    def commands(self) -> List[Tuple[str, ...]]:
+        """
+        Gets every registered subcommand, depth-first in registration order.
+        """
+
+        commands: List[Tuple[str, ...]] = []
+        pending: List[Tuple[Tuple[str, ...], _CommandNode]] = [((), self._commands)]
+
+        while pending:
+            command, node = pending.pop()
+            if node.positions:
+                commands.append(command)
+            children = [((*command, w), c) for w, c in node.children.items()]
+            pending.extend(reversed(children))
+
+        return commands
+
+    def load(self, position: int) -> AnyTaskType:
+        """
+        Gets the task class at `position`, importing it if necessary.
+        """
+
+        task = self._tasks[position]
+        return task.load() if isinstance(task, LazyTask) else task
+
+    def match_command(self, args: Sequence[str]) -> Tuple[str, ...]:
+        """
+        Gets the longest registered subcommand that the leading words of the
+        unparsed command line arguments `args` match, or an empty tuple if they
+        don't match any.
+
+        Routing walks one tree node per word, so its cost depends only on the
+        length of the subcommand and not on the number of registered tasks.
+        """
+
+        matched = 0
+        node = self._commands
+
+        for length, word in enumerate(args, start=1):
+            child = node.children.get(word)
+            if child is None:
+                break
+            node = child
+            if node.positions:
+                matched = length
+
+        return tuple(args[:matched])
+
+    def positions(
+        self,
+        args: CommandLineArguments,
+        command: Sequence[str] = (),
+    ) -> List[int]:
+        """
+        Gets the positions of the tasks that could handle the subcommand
+        `command` and parsed command line arguments `args`, in priority order,
+        without importing any of them.
+        """
+
+        positions = list(self._always)
+
+        if command:
+            node = self._commands
+            for word in command:
+                node = node.children[word]
+            for position in node.positions:
+                selector = self._selectors[position]
+                if selector is None or selector.matches(args):
+                    positions.append(position)
+
+        for arg, by_value in self._index.items():
+            value = args.get_raw(arg)
+            if not isinstance(value, (bool, str)):
+                continue
+            for position in by_value.get(value, []):
+                selector = self._selectors[position]
+                if selector is None or selector.matches(args):
+                    positions.append(position)
+
+        positions.sort()
+        return positions
+
+    def selector(self, position: int) -> Optional[Selector]:
+        """
+        Gets the selector that the task at `position` was registered with,
+        without importing it.
+        """
+
+        return self._selectors[position]
+
+    @property
+    def tasks(self) -> List[RegisteredTask]:
+        """
+        Gets all the registered tasks in priority order.
+        """
+
+        return self._tasks
@@ -0,0 +1,91 @@
+from json import dumps, loads
+from typing import Any, Dict, Optional, Sequence, Tuple, Type
+
+from cline.cache import cache_key, read_cache, write_cache
+from cline.cli.dispatch import RegisteredTask
+from cline.tasks import LazyTask
+
+MEMO_SIZE = 64
+"""
+Maximum number of argument shapes to remember the dispatched task of.
+"""
+
+
+def _describe(task: RegisteredTask) -> str:
+    path = task.path if isinstance(task, LazyTask) else task.__qualname__
+    module = "" if isinstance(task, LazyTask) else task.__module__
+    return f"{module}:{path} {task.selector!r}"
+
+
+class DispatchMemo:
+    """
+    A least-recently-used record of the task that each shape of command line
+    arguments was dispatched to, persisted in the user's cache directory.
+
+    The memo is invalidated whenever the host application version or the
+    registered tasks (or their selectors) change.
+
+    Arguments:
+        cli_type:    CLI class.
+        app_version: Host application version.
+        tasks:       Registered tasks in priority order.
+    """
+
+    def __init__(
+        self,
+        cli_type: Type[Any],
+        app_version: str,
+        tasks: Sequence[RegisteredTask],
+    ) -> None:
+        self._changed = False
+        self._group = f"dispatch/{cli_type.__module__}.{cli_type.__qualname__}"
+        self._key = cache_key(app_version, *[_describe(t) for t in tasks])
+        self._positions: Dict[str, int] = {}
+
+        if cached := read_cache(self._group, self._key):
+            try:
+                self._positions = dict(loads(cached))
+            except (TypeError, ValueError):
+                pass
+
+    def get(self, command: Sequence[str], shape: Tuple[Any, ...]) -> Optional[int]:
+        """
+        Gets the position of the task that the subcommand `command` and
+        argument shape `shape` were last dispatched to, if remembered.
+        """
+
+        return self._positions.get(dumps([list(command), shape]))
+
+    def put(
+        self, command: Sequence[str], shape: Tuple[Any, ...], position: int
+    ) -> None:
+        """
+        Remembers that the subcommand `command` and argument shape `shape` were
+        dispatched to the task at `position`, forgetting the least-recently
+        used shape if the memo is full.
+        """
+
+        shape_key = dumps([list(command), shape])
+
+        # Remembering the most-recently used shape again changes nothing:
+        if self._positions and next(reversed(self._positions)) == shape_key:
+            if self._positions[shape_key] == position:
+                return
+
+        self._positions.pop(shape_key, None)
+        self._positions[shape_key] = position
+
+        while len(self._positions) > MEMO_SIZE:
+            del self._positions[next(iter(self._positions))]
+
+        self._changed = True
+
+    def save(self) -> None:
+        """
+        Writes the memo to the cache, if it changed.
+        """
+
+        if self._changed:
+            value = dumps(list(self._positions.items()))
+            write_cache(self._group, self._key, value.encode("utf-8"))
+            self._changed = False
@@ -0,0 +1,130 @@
+from argparse import SUPPRESS, ArgumentParser, _SubParsersAction
+from io import BytesIO
+from marshal import dumps
+from os import stat
+from os.path import basename
+from pickle import HIGHEST_PROTOCOL, PickleError, Pickler, Unpickler
+from sys import argv, modules, version
+from typing import Any, List, Optional, Type
+
+from cline.cache import cache_key
+
+# `ArgumentParser` registers a local function as the default argument type, and
+# local functions can't be pickled:
+_IDENTITY_QUALNAME = "ArgumentParser.__init__.<locals>.identity"
+_IDENTITY_ID = "argparse-identity"
+
+# `ArgumentParser` compares values to `SUPPRESS` by identity, so unpickling must
+# restore the very same string:
+_SUPPRESS_ID = "argparse-suppress"
+
+
+def _identity(string: str) -> str:
+    return string
+
+
+def _modified(module_name: str) -> str:
+    path = getattr(modules.get(module_name), "__file__", None)
+    try:
+        return str(stat(path).st_mtime_ns) if path else ""
+    except OSError:
+        return ""
+
+
+def _rename(parser: ArgumentParser, old: str, new: str) -> None:
+    length = len(old)
+
+    # Subcommand parsers are named after their parent, like "app sub":
+    if parser.prog == old or parser.prog.startswith(f"{old} "):
+        parser.prog = new + parser.prog[length:]
+
+    for action in parser._actions:
+        if isinstance(action, _SubParsersAction):
+            if action._prog_prefix.startswith(old):
+                action._prog_prefix = new + action._prog_prefix[length:]
+            # Aliases map more than one name to the same parser:
+            for subparser in {id(p): p for p in action.choices.values()}.values():
+                _rename(subparser, old, new)
+
+
+class _ParserPickler(Pickler):
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is SUPPRESS:
+            return _SUPPRESS_ID
+        if getattr(obj, "__qualname__", None) == _IDENTITY_QUALNAME:
+            return _IDENTITY_ID
+        return None
+
+
+class _ParserUnpickler(Unpickler):
+    def persistent_load(self, pid: Any) -> Any:
+        if pid == _IDENTITY_ID:
+            return _identity
+        if pid == _SUPPRESS_ID:
+            return SUPPRESS
+        raise PickleError(f"unknown persistent ID {pid!r}")
+
+
+def dump_parser(parser: ArgumentParser) -> Optional[bytes]:
+    """
+    Serialises `parser`, or returns `None` if the parser cannot be serialised
+    (for example, if it references lambdas).
+    """
+
+    buffer = BytesIO()
+    try:
+        # `ArgumentParser` names the program after the running script by
+        # default, so remember that name to update it when loading:
+        value = (parser, basename(argv[0]))
+        _ParserPickler(buffer, protocol=HIGHEST_PROTOCOL).dump(value)
+    except (AttributeError, PickleError, TypeError):
+        return None
+    return buffer.getvalue()
+
+
+def load_parser(value: bytes) -> Optional[ArgumentParser]:
+    """
+    Deserialises a parser serialised by `dump_parser()`, or returns `None` if
+    the value is not a valid parser.
+
+    A program name taken from the script that made the parser is updated to
+    the name of the running script.
+    """
+
+    try:
+        parser, prog = _ParserUnpickler(BytesIO(value)).load()
+    except Exception:
+        return None
+
+    if not isinstance(parser, ArgumentParser):
+        return None
+
+    if (running := basename(argv[0])) != prog:
+        _rename(parser, prog, running)
+
+    return parser
+
+
+def parser_key(cli_type: Type[Any], app_version: str) -> str:
+    """
+    Makes a cache key that changes whenever the host application version, the
+    Python version, the CLI's `parser_version`, the CLI's `make_parser()`
+    implementation or the module of the CLI or any of its base classes changes.
+    """
+
+    code = getattr(cli_type.make_parser, "__code__", None)
+
+    # Base classes can add arguments too:
+    module_names: List[str] = []
+    for base in cli_type.__mro__:
+        if base.__module__ not in module_names:
+            module_names.append(base.__module__)
+
+    return cache_key(
+        app_version,
+        version,
+        str(getattr(cli_type, "parser_version", "")),
+        f"{cli_type.__module__}.{cli_type.__qualname__}",
+        dumps(code) if code else b"",
+        *[f"{name} {_modified(name)}" for name in module_names],
+    )
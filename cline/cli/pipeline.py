@@ -0,0 +1,245 @@
+from collections import deque
+from io import BufferedReader, BufferedWriter, RawIOBase, TextIOWrapper
+from threading import Condition, Thread
+from typing import TYPE_CHECKING, Any, Deque, List, Optional, Sequence
+
+from cline.cancellation import exit_code
+from cline.cli.batch import _exit_code
+from cline.exceptions import Cancelled
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer, WriteableBuffer
+
+    from cline.cli.cli import Cli
+
+
+class Channel:
+    """
+    An in-memory byte stream from one pipeline stage to the next.
+
+    A bounded channel blocks its writer while it holds `max_bytes` or more
+    unread bytes, so a fast stage can't run arbitrarily far ahead of a slow
+    one. Writing to a channel whose reader has closed raises
+    `BrokenPipeError`.
+
+    Arguments:
+        max_bytes: Maximum number of unread bytes to hold, or `None` for no
+                   limit.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = 1_048_576) -> None:
+        self._chunks: Deque[bytes] = deque()
+        self._condition = Condition()
+        self._max_bytes = max_bytes
+        self._reader_closed = False
+        self._size = 0
+        self._writer_closed = False
+
+        self.reader = BufferedReader(_ChannelReader(self))
+        """
+        Binary reader of the channel.
+        """
+
+        self.writer = TextIOWrapper(
+            BufferedWriter(_ChannelWriter(self)),
+            encoding="utf-8",
+            write_through=True,
+        )
+        """
+        Text writer to the channel. Its `buffer` is the binary writer.
+        """
+
+    def close_reader(self) -> None:
+        """
+        Closes the reader and discards any unread bytes.
+        """
+
+        with self._condition:
+            self._reader_closed = True
+            self._chunks.clear()
+            self._size = 0
+            self._condition.notify_all()
+
+    def close_writer(self) -> None:
+        """
+        Flushes and closes the writer, so that the reader reaches the end of
+        the stream once it has read every byte.
+        """
+
+        try:
+            self.writer.close()
+        except (BrokenPipeError, ValueError):
+            # The reader closed before reading everything:
+            pass
+
+        with self._condition:
+            self._writer_closed = True
+            self._condition.notify_all()
+
+    def get(self, size: int) -> bytes:
+        """
+        Takes at most `size` bytes, waiting for any to be written. Returns no
+        bytes at the end of the stream.
+        """
+
+        with self._condition:
+            while not self._chunks and not self._writer_closed:
+                self._condition.wait()
+
+            if not self._chunks:
+                return b""
+
+            chunk = self._chunks.popleft()
+            if len(chunk) > size:
+                self._chunks.appendleft(chunk[size:])
+                chunk = chunk[:size]
+
+            self._size -= len(chunk)
+            self._condition.notify_all()
+            return chunk
+
+    def put(self, data: bytes) -> None:
+        """
+        Adds `data`, waiting for room if the channel is full.
+
+        Raises:
+            BrokenPipeError: If the reader has closed.
+        """
+
+        with self._condition:
+            while self._is_full() and not self._reader_closed:
+                self._condition.wait()
+
+            if self._reader_closed:
+                raise BrokenPipeError("pipeline stage stopped reading")
+
+            self._chunks.append(data)
+            self._size += len(data)
+            self._condition.notify_all()
+
+    def _is_full(self) -> bool:
+        # A chunk larger than the limit is still accepted into an empty
+        # channel, since it could never fit otherwise:
+        limit = self._max_bytes
+        return limit is not None and self._size > 0 and self._size >= limit
+
+
+class _ChannelReader(RawIOBase):
+    def __init__(self, channel: Channel) -> None:
+        self._channel = channel
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        view = memoryview(buffer).cast("B")
+        data = self._channel.get(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+
+class _ChannelWriter(RawIOBase):
+    def __init__(self, channel: Channel) -> None:
+        self._channel = channel
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: "ReadableBuffer") -> int:
+        data = bytes(buffer)
+        if data:
+            self._channel.put(data)
+        return len(data)
+
+
+def invoke_stage(stage: "Cli[Any]") -> int:
+    """
+    Invokes a pipeline stage and returns its exit code.
+
+    A stage that stops because the next stage stopped reading, or because the
+    pipeline was cancelled, exits without logging or writing anything, since
+    its output has nowhere to go.
+    """
+
+    try:
+        try:
+            return stage._invoke_task(None)
+        except (BrokenPipeError, Cancelled):
+            raise
+        except Exception as ex:
+            return stage.handle_exception(ex)
+        finally:
+            stage.flush()
+    except BrokenPipeError:
+        # Like a shell reports a process killed by SIGPIPE:
+        return 141
+    except Cancelled as ex:
+        return exit_code(ex.reason)
+
+
+def run_stages(
+    stages: Sequence["Cli[Any]"],
+    channels: Sequence[Channel],
+    threaded: bool = False,
+) -> List[int]:
+    """
+    Invokes each pipeline stage and returns their exit codes.
+
+    Each stage but the last writes into the channel at its position, and each
+    stage but the first reads from the channel before it.
+
+    Arguments:
+        stages:   CLIs to invoke, wired to the channels.
+        channels: Channels between the stages.
+        threaded: `True` to invoke every stage concurrently on its own thread.
+                  `False` to invoke them one after another on this thread.
+    """
+
+    exit_codes = [0] * len(stages)
+
+    def target(index: int) -> None:
+        try:
+            exit_codes[index] = invoke_stage(stages[index])
+        except SystemExit as ex:
+            # Like `ArgumentParser` exiting on invalid arguments:
+            exit_codes[index] = _exit_code(ex)
+        finally:
+            if index < len(channels):
+                channels[index].close_writer()
+            if index:
+                channels[index - 1].close_reader()
+
+    if not threaded:
+        for index in range(len(stages)):
+            target(index)
+        return exit_codes
+
+    # Daemon threads can't keep the process alive if the pipeline is cancelled
+    # while they're still running:
+    threads = [
+        Thread(target=target, args=(i,), daemon=True) for i in range(len(stages))
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    return exit_codes
+
+
+def split_pipeline(args: Sequence[str], separator: str) -> List[List[str]]:
+    """
+    Splits command line arguments into the arguments of each pipeline stage.
+    """
+
+    stages: List[List[str]] = [[]]
+
+    for arg in args:
+        if arg == separator:
+            stages.append([])
+        else:
+            stages[-1].append(arg)
+
+    return stages
@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Type
+
+from cline.cli.batch import InvocationResult, _exit_code
+
+if TYPE_CHECKING:
+    from cline.cli.cli import Cli
+
+_worker_cli: Optional["Cli[Any]"] = None
+"""
+Warm CLI of this worker process.
+"""
+
+
+def init_worker(cli_type: Type["Cli[Any]"], app_version: str) -> None:
+    """
+    Makes this worker process's warm CLI.
+    """
+
+    global _worker_cli
+    _worker_cli = cli_type(app_version=app_version, args=[])
+    _worker_cli.warm()
+
+
+def invoke_in_worker(item: Tuple[int, List[str]]) -> Tuple[int, InvocationResult]:
+    """
+    Invokes the correct task for one indexed set of command line arguments on
+    this worker process's warm CLI.
+    """
+
+    if _worker_cli is None:
+        raise RuntimeError("worker process has not been initialised")
+
+    index, args = item
+
+    try:
+        return index, _worker_cli.invoke_captured(args)
+    except KeyboardInterrupt:
+        return index, InvocationResult(args=args, exit_code=100, output="")
+    except SystemExit as ex:
+        # An exit must never escape a worker, or the pool's results would
+        # raise it in the parent:
+        code = _exit_code(ex)
+        return index, InvocationResult(args=args, exit_code=code, output="")
@@ -0,0 +1,268 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from cline.cli_args import ArgumentsType, CommandLineArguments
+
+
+@dataclass(frozen=True)
+class Flag:
+    """
+    A boolean flag that is `True` when present and `False` otherwise.
+
+    Arguments:
+        name:  Argument name.
+        help:  Help text.
+        flags: Command line flags. Defaults to "--name" (with underscores
+               replaced by hyphens).
+    """
+
+    name: str
+    help: str = ""
+    flags: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Option:
+    """
+    An option that takes a value, either as "--option value" or
+    "--option=value".
+
+    Arguments:
+        name:     Argument name.
+        help:     Help text.
+        flags:    Command line flags. Defaults to "--name" (with underscores
+                  replaced by hyphens).
+        multiple: `True` to collect every occurrence into a list.
+    """
+
+    name: str
+    help: str = ""
+    flags: Tuple[str, ...] = ()
+    multiple: bool = False
+
+
+@dataclass(frozen=True)
+class Positional:
+    """
+    A positional argument. Positional arguments are optional, and are `None`
+    when not present.
+
+    Arguments:
+        name:     Argument name.
+        help:     Help text.
+        multiple: `True` to collect every remaining positional argument into a
+                  list.
+    """
+
+    name: str
+    help: str = ""
+    multiple: bool = False
+
+
+SpecArgument = Union[Flag, Option, Positional]
+
+_FLAG = 0
+_OPTION = 1
+_MULTIPLE = 2
+
+
+def _flags(argument: Union[Flag, Option]) -> Tuple[str, ...]:
+    return argument.flags or ("--" + argument.name.replace("_", "-"),)
+
+
+def _is_negative_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+class ArgumentSpec:
+    """
+    A declarative specification of command line arguments, compiled once into
+    lookup tables so that parsing is a single pass over the arguments.
+
+    Arguments:
+        arguments:   Flags, options and positional arguments.
+        description: Description to include in the help.
+        prog:        Program name to include in the help.
+        add_help:    `True` to add a "-h/--help" flag named "help".
+    """
+
+    def __init__(
+        self,
+        arguments: Sequence[SpecArgument],
+        description: str = "",
+        prog: str = "",
+        add_help: bool = True,
+    ) -> None:
+        if add_help:
+            arguments = [*arguments, Flag("help", "show this help", ("-h", "--help"))]
+
+        self._arguments = list(arguments)
+        self._description = description
+        self._prog = prog
+
+        self._defaults: ArgumentsType = {}
+        self._lists: List[str] = []
+        self._lookup: Dict[str, Tuple[int, str]] = {}
+        self._positionals: List[Tuple[str, bool]] = []
+
+        for argument in self._arguments:
+            if argument.name in self._defaults or argument.name in self._lists:
+                raise ValueError(f'argument "{argument.name}" is declared twice')
+
+            if isinstance(argument, Positional):
+                self._positionals.append((argument.name, argument.multiple))
+                if argument.multiple:
+                    self._lists.append(argument.name)
+                else:
+                    self._defaults[argument.name] = None
+                continue
+
+            if isinstance(argument, Flag):
+                kind = _FLAG
+                self._defaults[argument.name] = False
+            elif argument.multiple:
+                kind = _MULTIPLE
+                self._lists.append(argument.name)
+            else:
+                kind = _OPTION
+                self._defaults[argument.name] = None
+
+            for flag in _flags(argument):
+                if flag in self._lookup:
+                    raise ValueError(f'flag "{flag}" is declared twice')
+                self._lookup[flag] = (kind, argument.name)
+
+    def format_help(self, prog: Optional[str] = None) -> str:
+        """
+        Renders the help.
+
+        Arguments:
+            prog: Program name to use if none was given at initialisation.
+        """
+
+        prog = self._prog or prog
+        usage = [f"usage: {prog}"] if prog else ["usage:"]
+        rows: List[Tuple[str, str]] = []
+        positionals: List[Tuple[str, str]] = []
+
+        for argument in self._arguments:
+            if isinstance(argument, Positional):
+                label = argument.name + (" ..." if argument.multiple else "")
+                usage.append(f"[{label}]")
+                positionals.append((argument.name, argument.help))
+            elif isinstance(argument, Flag):
+                flags = _flags(argument)
+                usage.append(f"[{flags[0]}]")
+                rows.append((", ".join(flags), argument.help))
+            else:
+                flags = _flags(argument)
+                metavar = argument.name.upper()
+                usage.append(f"[{flags[0]} {metavar}]")
+                label = ", ".join(f"{flag} {metavar}" for flag in flags)
+                rows.append((label, argument.help))
+
+        width = max([len(label) for label, _ in positionals + rows] + [0]) + 2
+        lines = [" ".join(usage), ""]
+
+        if self._description:
+            lines.extend([self._description, ""])
+
+        sections = [("positional arguments", positionals), ("options", rows)]
+
+        for title, section in sections:
+            if section:
+                lines.append(f"{title}:")
+                for label, text in section:
+                    lines.append(f"  {label.ljust(width)}{text}".rstrip())
+                lines.append("")
+
+        return "\n".join(lines)
+
+    @property
+    def options(self) -> List[Tuple[str, str]]:
+        """
+        Gets every flag and option's command line flags and help text.
+        """
+
+        return [
+            (flag, argument.help)
+            for argument in self._arguments
+            if not isinstance(argument, Positional)
+            for flag in _flags(argument)
+        ]
+
+    def parse(self, args: List[str]) -> CommandLineArguments:
+        """
+        Parses `args` in a single pass.
+
+        Unrecognised flags, options without values and surplus positional
+        arguments are collected as unknown arguments.
+        """
+
+        known = dict(self._defaults)
+        lists: Dict[str, List[str]] = {name: [] for name in self._lists}
+
+        unknown: List[str] = []
+        lookup = self._lookup
+        positionals = self._positionals
+        positional = 0
+        options_ended = False
+        count = len(args)
+        index = 0
+
+        while index < count:
+            token = args[index]
+            index += 1
+
+            if not options_ended and len(token) > 1 and token[0] == "-":
+                if token == "--":
+                    options_ended = True
+                    continue
+
+                flag, equals, value = token.partition("=")
+                entry = lookup.get(flag)
+
+                if entry is not None:
+                    kind, name = entry
+
+                    if kind == _FLAG:
+                        if equals:
+                            unknown.append(token)
+                        else:
+                            known[name] = True
+                        continue
+
+                    if not equals:
+                        if index == count:
+                            unknown.append(token)
+                            continue
+                        value = args[index]
+                        index += 1
+
+                    if kind == _OPTION:
+                        known[name] = value
+                    else:
+                        lists[name].append(value)
+                    continue
+
+                if not _is_negative_number(token):
+                    unknown.append(token)
+                    continue
+
+            if positional == len(positionals):
+                unknown.append(token)
+                continue
+
+            name, multiple = positionals[positional]
+            if multiple:
+                lists[name].append(token)
+            else:
+                known[name] = token
+                positional += 1
+
+        known.update(lists)
+        return CommandLineArguments(known=known, unknown=unknown)
@@ -0,0 +1,48 @@
+from os.path import basename
+from sys import argv
+from typing import List, Tuple
+
+from cline.cli.cli import Cli
+from cline.cli.spec import ArgumentSpec
+from cline.cli_args import CommandLineArguments
+
+
+class SpecCli(Cli[ArgumentSpec]):
+    """
+    A command line interface that parses command line arguments against a
+    declarative `ArgumentSpec`.
+
+    Parsing is a single pass over the arguments, which is considerably faster
+    than `argparse.ArgumentParser` for long argument lists and large numbers of
+    options.
+    """
+
+    def make_cli_args(self, args: List[str]) -> CommandLineArguments:
+        """
+        Parses `args` to make and return `CommandLineArguments`.
+
+        To refer to this `CommandLineArguments` instance later, get
+        `self.cli_args` rather than call this function multiple times.
+
+        Arguments:
+            args: Command line arguments
+
+        Returns:
+            Parsed command line arguments
+        """
+
+        return self.parser.parse(args)
+
+    def list_options(self) -> List[Tuple[str, str]]:
+        """
+        Gets the command line flags of every option, and their help text.
+        """
+
+        return self.parser.options
+
+    def write_help(self) -> None:
+        """
+        Renders application help to the output writer.
+        """
+
+        self.out.write(self.parser.format_help(prog=basename(argv[0])))
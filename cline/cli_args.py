@@ -1,26 +1,76 @@
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
-from cline.exceptions import CannotMakeArguments
+from cline.exceptions import CannotMakeArguments, InvalidArguments
 
-ArgumentsType = Dict[str, Union[bool, List[str], str, None]]
+ArgumentValue = Union[bool, List[str], str, None]
+ArgumentsType = Dict[str, ArgumentValue]
+
+Schema = Mapping[str, Type[Any]]
+"""
+Argument names mapped to the type to extract them as: `bool`, `int`, `str` or
+`list` (of strings).
+"""
+
+_DESCRIPTIONS: Dict[Type[Any], str] = {
+    bool: "a flag",
+    int: "an integer",
+    list: "a list",
+    str: "a string",
+}
+
+
+def _copy(value: ArgumentValue) -> ArgumentValue:
+    # Lists are the only mutable values, so copying them is a deep copy:
+    return list(value) if isinstance(value, list) else value
 
 
 class CommandLineArguments:
     """
     Parsed command line arguments.
 
+    Instances are read-only: the arguments (including any lists) are copied on
+    construction, lists are copied again whenever they're returned, and typed
+    conversions (and failures to convert) are remembered per argument so
+    that every task probing the same argument doesn't convert it again.
+
     Arguments:
         known:   Dictionary of known arguments.
         unknown: List of unknown arguments.
     """
 
+    __slots__ = ("_integers", "_known", "_unknown")
+
+    _integers: Dict[str, Optional[int]]
+    _known: ArgumentsType
+    _unknown: List[str]
+
     def __init__(
         self,
         known: Optional[ArgumentsType] = None,
         unknown: Optional[List[str]] = None,
     ) -> None:
-        self._known = known or {}
-        self._unknown = unknown or []
+        init = super().__setattr__
+        init("_integers", {})
+        init("_known", {k: _copy(v) for k, v in known.items()} if known else {})
+        init("_unknown", list(unknown) if unknown else [])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return self.__class__, (self._known, self._unknown)
+
+    def __repr__(self) -> str:
+        return f"CommandLineArguments(known={self._known}, unknown={self._unknown})"
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{self.__class__.__name__} is read-only")
+
+    def _convert_integer(self, arg: str) -> Optional[int]:
+        value = self._known.get(arg, None)
+        if not isinstance(value, str):
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            return None
 
     def assert_string(self, arg: str, value: Union[List[str], str]) -> None:
         """
@@ -50,6 +100,62 @@ class CommandLineArguments:
         if not self.get_bool(arg):
             raise CannotMakeArguments()
 
+    def extract(
+        self,
+        schema: Schema,
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Gets every argument in `schema` as its type in one pass.
+
+        Arguments:
+            schema:   Argument names mapped to the type to get them as.
+            defaults: Values of arguments that are optional. Arguments that are
+                      not set take these values.
+
+        Raises:
+            InvalidArguments: Listing every argument that is missing or cannot
+            be converted.
+
+            TypeError: If the schema includes an unsupported type.
+
+        Returns:
+            Argument names mapped to their values.
+        """
+
+        values: Dict[str, Any] = {}
+        problems: List[str] = []
+
+        for arg, kind in schema.items():
+            if kind not in _DESCRIPTIONS:
+                raise TypeError(f'"{arg}" has an unsupported type ({kind})')
+
+            value = self._known.get(arg, None)
+
+            if value is None:
+                if defaults is not None and arg in defaults:
+                    values[arg] = defaults[arg]
+                else:
+                    problems.append(f'"{arg}" is required')
+
+            elif kind is int:
+                integer = self.try_get_integer(arg)
+                if integer is None:
+                    problems.append(f'"{arg}" must be an integer (not {value!r})')
+                else:
+                    values[arg] = integer
+
+            elif isinstance(value, kind):
+                values[arg] = _copy(value)
+
+            else:
+                problems.append(f'"{arg}" must be {_DESCRIPTIONS[kind]}')
+
+        if problems:
+            raise InvalidArguments(problems)
+
+        return values
+
     def get_bool(self, arg: str, default: Optional[bool] = None) -> bool:
         """
         Gets the command line argument `arg` as a boolean.
@@ -61,11 +167,8 @@ class CommandLineArguments:
             is not set.
         """
 
-        value = self._known.get(arg, None)
-
-        if value is None and default is not None:
-            return default
-        if not isinstance(value, bool):
+        value = self.try_get_bool(arg, default)
+        if value is None:
             raise CannotMakeArguments()
         return value
 
@@ -74,13 +177,13 @@ class CommandLineArguments:
         Gets the command line argument `arg` as an integer.
 
         Raises:
-            CannotMakeArguments: f the argument is not an integer.
+            CannotMakeArguments: If the argument is not an integer.
         """
 
-        try:
-            return int(self.get_string(arg))
-        except ValueError:
+        value = self.try_get_integer(arg)
+        if value is None:
             raise CannotMakeArguments()
+        return value
 
     def get_list(self, arg: str, default: Optional[List[str]] = None) -> List[str]:
         """
@@ -97,15 +200,20 @@ class CommandLineArguments:
             Argument value if set, otherwise default if set.
         """
 
-        value = self._known.get(arg, None)
+        value = self.try_get_list(arg, default)
+        if value is None:
+            raise CannotMakeArguments()
+        return value
 
-        if value is None and default is not None:
-            return default
+    def get_raw(self, arg: str) -> ArgumentValue:
+        """
+        Gets the command line argument `arg` exactly as parsed, without any
+        validation.
 
-        if not isinstance(value, list):
-            raise CannotMakeArguments()
+        Returns `None` if the argument is not set.
+        """
 
-        return value
+        return _copy(self._known.get(arg, None))
 
     def get_string(self, arg: str, default: Optional[str] = None) -> str:
         """
@@ -122,12 +230,88 @@ class CommandLineArguments:
             Argument value if set, otherwise default if set.
         """
 
+        value = self.try_get_string(arg, default)
+        if value is None:
+            raise CannotMakeArguments()
+        return value
+
+    @property
+    def shape(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Gets the name and type of each argument that is set, sorted by name.
+
+        Arguments that are `None`, `False` or empty lists are not set. Values
+        are not included, so invocations that set the same arguments to
+        different values have the same shape.
+        """
+
+        return tuple(
+            (arg, type(value).__name__)
+            for arg, value in sorted(self._known.items())
+            if value is not None and value is not False and value != []
+        )
+
+    def try_get_bool(self, arg: str, default: Optional[bool] = None) -> Optional[bool]:
+        """
+        Gets the command line argument `arg` as a boolean, like `get_bool()`,
+        but returns `None` rather than raising `CannotMakeArguments`.
+        """
+
         value = self._known.get(arg, None)
 
-        if value is None and default is not None:
+        if value is None:
             return default
 
-        if not isinstance(value, str):
-            raise CannotMakeArguments()
+        return value if isinstance(value, bool) else None
 
-        return value
+    def try_get_integer(self, arg: str) -> Optional[int]:
+        """
+        Gets the command line argument `arg` as an integer, like
+        `get_integer()`, but returns `None` rather than raising
+        `CannotMakeArguments`.
+        """
+
+        try:
+            return self._integers[arg]
+        except KeyError:
+            value = self._integers[arg] = self._convert_integer(arg)
+            return value
+
+    def try_get_list(
+        self,
+        arg: str,
+        default: Optional[List[str]] = None,
+    ) -> Optional[List[str]]:
+        """
+        Gets the command line argument `arg` as a list of strings, like
+        `get_list()`, but returns `None` rather than raising
+        `CannotMakeArguments`.
+        """
+
+        value = self._known.get(arg, None)
+
+        if value is None:
+            return default
+
+        return list(value) if isinstance(value, list) else None
+
+    def try_get_string(self, arg: str, default: Optional[str] = None) -> Optional[str]:
+        """
+        Gets the command line argument `arg` as a string, like `get_string()`,
+        but returns `None` rather than raising `CannotMakeArguments`.
+        """
+
+        value = self._known.get(arg, None)
+
+        if value is None:
+            return default
+
+        return value if isinstance(value, str) else None
+
+    @property
+    def unknown(self) -> List[str]:
+        """
+        Gets the arguments that the parser did not recognise.
+        """
+
+        return list(self._unknown)
@@ -16,6 +16,12 @@ class CliProtocol(Protocol, Generic[TParser]):
         Gets `stdout` or equivalent output writer.
         """
 
+    @property
+    def out_bytes(self) -> IO[bytes]:
+        """
+        Gets the binary output writer.
+        """
+
     @property
     def parser(self) -> TParser:
         """
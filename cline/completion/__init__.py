@@ -0,0 +1,14 @@
+"""
+`cline.completion` generates shell completion scripts for Cline applications.
+
+Completion must respond on every keypress, which is far too often to start
+Python, import every task and make the argument parser. Instead, the commands
+and options are written once to a text index file, and the generated script
+answers each query by filtering the index with `awk`.
+
+Generate a script and index by running:
+
+    python -m cline.completion bash myapp myapp.cli:MyCli
+
+Generate them again whenever the application's commands or options change.
+"""
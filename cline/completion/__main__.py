@@ -0,0 +1,9 @@
+from cline.completion.cli import CompletionCli
+
+
+def entry() -> None:
+    CompletionCli.invoke_and_exit()
+
+
+if __name__ == "__main__":
+    entry()
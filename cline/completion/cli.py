@@ -0,0 +1,54 @@
+from argparse import ArgumentParser
+
+from cline.cli import ArgumentParserCli, RegisteredTasks
+from cline.completion.scripts import SHELLS
+from cline.completion.tasks import ScriptTask
+
+
+class CompletionCli(ArgumentParserCli):
+    """
+    Command line interface for `python -m cline.completion`.
+    """
+
+    def make_parser(self) -> ArgumentParser:
+        parser = ArgumentParser(
+            description=(
+                "Writes a Cline application's completion index and prints a "
+                "completion script that reads it."
+            ),
+            epilog=(
+                'For example, "python -m cline.completion bash myapp '
+                'myapp.cli:MyCli >> ~/.bashrc".'
+            ),
+            prog="python -m cline.completion",
+        )
+
+        parser.add_argument(
+            "shell",
+            choices=SHELLS,
+            help="shell to complete in",
+            nargs="?",
+        )
+
+        parser.add_argument(
+            "prog",
+            help="name of the program to complete",
+            nargs="?",
+        )
+
+        parser.add_argument(
+            "cli",
+            help='import path of the application\'s CLI class ("module:Cli")',
+            nargs="?",
+        )
+
+        parser.add_argument(
+            "--index",
+            help="path to write the index to (default: in the cache directory)",
+            metavar="PATH",
+        )
+
+        return parser
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [ScriptTask]
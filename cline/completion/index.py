@@ -0,0 +1,101 @@
+from pathlib import Path
+from re import sub
+from typing import Iterable, List, Sequence, Set, Tuple
+
+from cline.cache import cache_dir
+
+INDEX_HEADER = "# cline completion index"
+"""
+First line of every completion index. Lines that begin with "#" are comments.
+"""
+
+
+def _clean(text: str) -> str:
+    # Tabs and newlines delimit the index, so they can't appear in values:
+    return " ".join(text.split())
+
+
+def complete(index: str, words: Sequence[str], current: str) -> List[str]:
+    """
+    Gets the completions of a partially-typed command line.
+
+    This is the reference implementation of the query that each generated
+    shell script performs with `awk`:
+
+    - Subcommand words are offered if the preceding words are exactly a
+      subcommand (or the start of one).
+    - Options are offered only if the current word begins with "-".
+
+    Arguments:
+        index:   Completion index made by `make_index()`.
+        words:   Words between the program name and the current word.
+        current: Word being completed, which may be empty.
+
+    Returns:
+        Completions in index order.
+    """
+
+    context = " ".join(words)
+    completions: List[str] = []
+
+    for line in index.splitlines():
+        if not line or line.startswith("#"):
+            continue
+
+        kind, parent, word, *_ = line.split("\t")
+
+        if not word.startswith(current):
+            continue
+
+        if kind == "c" and parent == context:
+            completions.append(word)
+        elif kind == "o" and current.startswith("-"):
+            completions.append(word)
+
+    return completions
+
+
+def default_index_path(prog: str) -> Path:
+    """
+    Gets the default path of the completion index of the program `prog`, in
+    Cline's cache directory.
+    """
+
+    name = sub(r"[^\w.-]", "_", prog)
+    return cache_dir() / "completion" / f"{name}.index"
+
+
+def make_index(
+    commands: Iterable[Sequence[str]],
+    options: Iterable[Tuple[str, str]],
+    app_version: str = "",
+) -> str:
+    """
+    Makes a completion index.
+
+    Each line describes one completion as tab-separated fields:
+
+    - "c", the preceding subcommand words and the subcommand word.
+    - "o", an empty field, the option's flag and its help text.
+
+    Arguments:
+        commands:    Registered subcommands.
+        options:     Flags of every option, and their help text.
+        app_version: Host application version to record in the header.
+    """
+
+    lines = [f"{INDEX_HEADER} {_clean(app_version)}".rstrip()]
+    seen: Set[Tuple[str, ...]] = set()
+
+    for command in commands:
+        for length in range(1, len(command) + 1):
+            prefix = tuple(_clean(word) for word in command[:length])
+            if prefix not in seen:
+                seen.add(prefix)
+                *parent, word = prefix
+                lines.append(f"c\t{' '.join(parent)}\t{word}")
+
+    for flag, help in options:
+        lines.append(f"o\t\t{_clean(flag)}\t{_clean(help)}")
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,87 @@
+from re import sub
+from shlex import quote
+
+SHELLS = ("bash", "fish", "zsh")
+"""
+Shells that completion scripts can be generated for.
+"""
+
+AWK_PROGRAM = """
+BEGIN { FS = "\\t" }
+/^#/ { next }
+cur != "" && index($3, cur) != 1 { next }
+$1 == "c" && $2 == ctx { print $3 }
+$1 == "o" && index(cur, "-") == 1 {
+    if (fish && $4 != "") print $3 "\\t" $4; else print $3
+}
+""".strip()
+"""
+Query that each completion script runs against the completion index. Mirrors
+`cline.completion.index.complete()`.
+
+Expects the variables `ctx` (the words between the program name and the current
+word, joined by spaces), `cur` (the current word) and `fish` (1 to include
+option help as fish descriptions).
+
+The program is embedded in single quotes in every shell, so it must contain
+neither single quotes nor escaped backslashes.
+"""
+
+_BASH = """# bash completion for {prog}, generated by Cline.
+_cline_complete_{name}() {{
+    local ctx="${{COMP_WORDS[*]:1:COMP_CWORD-1}}"
+    local IFS=$'\\n'
+    COMPREPLY=($(awk -v ctx="$ctx" -v cur="${{COMP_WORDS[COMP_CWORD]}}" -v fish=0 \\
+        '{awk}' {index}))
+}}
+complete -o default -F _cline_complete_{name} {prog}
+"""
+
+_FISH = """# fish completion for {prog}, generated by Cline.
+function __cline_complete_{name}
+    set -l words (commandline -opc)
+    set -e words[1]
+    set -l cur (commandline -ct)
+    awk -v ctx="$words" -v cur="$cur" -v fish=1 \\
+        '{awk}' {index}
+end
+complete -c {prog} -a "(__cline_complete_{name})"
+"""
+
+_ZSH = """#compdef {prog}
+# zsh completion for {prog}, generated by Cline.
+_cline_complete_{name}() {{
+    local ctx="${{(j: :)words[2,CURRENT-1]}}"
+    local -a completions
+    completions=(${{(f)"$(awk -v ctx="$ctx" -v cur="${{words[CURRENT]}}" -v fish=0 \\
+        '{awk}' {index})"}})
+    compadd -a completions || _files
+}}
+compdef _cline_complete_{name} {prog}
+"""
+
+
+def make_script(shell: str, prog: str, index_path: str) -> str:
+    """
+    Makes a completion script.
+
+    Arguments:
+        shell:      Shell to complete in: "bash", "fish" or "zsh".
+        prog:       Name of the program to complete.
+        index_path: Path to the program's completion index.
+
+    Raises:
+        ValueError: If `shell` is not supported.
+    """
+
+    templates = {"bash": _BASH, "fish": _FISH, "zsh": _ZSH}
+
+    if shell not in templates:
+        raise ValueError(f'"{shell}" is not a supported shell ({", ".join(SHELLS)})')
+
+    return templates[shell].format(
+        awk=AWK_PROGRAM,
+        index=quote(index_path),
+        name=sub(r"\W", "_", prog),
+        prog=quote(prog),
+    )
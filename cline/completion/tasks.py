@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Optional
+
+from cline.tasks import DataclassTask
+
+
+@dataclass
+class ScriptArgs:
+    cli: str
+    prog: str
+    shell: str
+    index: Optional[str] = None
+
+
+class ScriptTask(DataclassTask[ScriptArgs]):
+    """
+    Writes a host application's completion index and completion script.
+    """
+
+    def invoke(self) -> int:
+        module, _, name = self.args.cli.partition(":")
+
+        if not module or not name:
+            self.out.write(f'🔥 "{self.args.cli}" is not in the form "module:Cli"\n')
+            return 1
+
+        cli_type: Any = import_module(module)
+        for attribute in name.split("."):
+            cli_type = getattr(cli_type, attribute)
+
+        cli = cli_type(args=[], out=self.out)
+        cli.write_completion(
+            self.args.shell,
+            index_path=self.args.index,
+            prog=self.args.prog,
+        )
+        return 0
@@ -0,0 +1,27 @@
+"""
+`cline.daemon` runs a Cline application as a resident process that listens on a
+Unix socket, so that invocations cost a socket round trip rather than starting
+Python and importing the application.
+
+Start the server with `Cli.serve()`, then invoke the application with the thin
+client:
+
+    python -m cline.daemon /path/to/socket [ARG ...]
+
+The client forwards its arguments, working directory, environment variables and
+stdin, then streams back the output and exits with the task's exit code.
+
+The Python client still has to start Python, so for the fastest invocations
+generate a shell script that speaks the plain protocol (see
+`cline.daemon.protocol.PLAIN`) with `socat` or `nc` instead:
+
+    python -m cline.daemon --shim /path/to/socket > ~/bin/app
+    chmod +x ~/bin/app
+    app [ARG ...]
+
+The script forwards arguments, the working directory and stdin, but not
+environment variables, and its output must be text.
+
+The server forks a child process per invocation, so it requires a Unix-like
+operating system.
+"""
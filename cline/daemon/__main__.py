@@ -0,0 +1,30 @@
+from sys import argv, stderr, stdin, stdout
+
+from cline.daemon.client import invoke
+from cline.daemon.shim import make_shim
+
+
+def entry() -> None:
+    if len(argv) < 2 or (argv[1] == "--shim" and len(argv) != 3):
+        stderr.write("usage: python -m cline.daemon SOCKET [ARG ...]\n")
+        stderr.write("       python -m cline.daemon --shim SOCKET\n")
+        exit(2)
+
+    if argv[1] == "--shim":
+        stdout.write(make_shim(argv[2]))
+        exit(0)
+
+    # Don't wait for input that a person at a terminal will never type:
+    forward = None if stdin.isatty() else stdin.buffer
+
+    try:
+        exit_code = invoke(argv[1], argv[2:], forward, stdout.buffer, stderr.buffer)
+    except (ConnectionError, FileNotFoundError) as ex:
+        stderr.write(f"🔥 {ex}\n")
+        exit_code = 101
+
+    exit(exit_code)
+
+
+if __name__ == "__main__":
+    entry()
@@ -0,0 +1,77 @@
+from json import dumps
+from os import environ, getcwd
+from socket import AF_UNIX, SOCK_STREAM, socket
+from threading import Thread
+from typing import BinaryIO, List, Optional
+
+from cline.daemon.protocol import (
+    ERROR,
+    EXIT,
+    HEADER,
+    OUTPUT,
+    STDIN,
+    read_frame,
+    send_frame,
+)
+
+
+def _forward_stdin(sock: socket, stdin: Optional[BinaryIO]) -> None:
+    try:
+        if stdin is not None:
+            # Prefer `read1()` to forward input as soon as it's available rather
+            # than waiting to fill the chunk:
+            read = getattr(stdin, "read1", stdin.read)
+            while chunk := read(65536):
+                send_frame(sock, STDIN, chunk)
+        send_frame(sock, STDIN)
+    except OSError:
+        # The server closes the connection as soon as the task completes, which
+        # might be before we reach the end of stdin.
+        pass
+
+
+def invoke(
+    socket_path: str,
+    args: List[str],
+    stdin: Optional[BinaryIO],
+    stdout: BinaryIO,
+    stderr: Optional[BinaryIO] = None,
+) -> int:
+    """
+    Forwards an invocation to the server listening on `socket_path`, streams
+    the output to `stdout` and returns the exit code.
+
+    Arguments:
+        socket_path: Path to the server's Unix socket.
+        args:        Command line arguments.
+        stdin:       Input to forward, or `None` to forward no input.
+        stdout:      Output writer.
+        stderr:      Error output writer. Defaults to `stdout`.
+
+    Raises:
+        ConnectionError: If the server closes the connection unexpectedly.
+    """
+
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+
+        header = {"args": args, "cwd": getcwd(), "env": dict(environ)}
+        send_frame(sock, HEADER, dumps(header).encode("utf-8"))
+
+        Thread(target=_forward_stdin, args=(sock, stdin), daemon=True).start()
+
+        errors = stdout if stderr is None else stderr
+
+        with sock.makefile("rb") as reader:
+            while frame := read_frame(reader):
+                kind, payload = frame
+                if kind == OUTPUT:
+                    stdout.write(payload)
+                    stdout.flush()
+                elif kind == ERROR:
+                    errors.write(payload)
+                    errors.flush()
+                elif kind == EXIT:
+                    return int(payload)
+
+    raise ConnectionError("the server closed the connection unexpectedly")
@@ -0,0 +1,192 @@
+from io import BufferedIOBase, RawIOBase
+from socket import socket
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer, WriteableBuffer
+
+SocketReader = Union[BinaryIO, BufferedIOBase]
+
+HEADER = b"H"
+"""
+Client-to-server frame with the JSON-encoded arguments, working directory and
+environment variables.
+"""
+
+STDIN = b"I"
+"""
+Client-to-server frame with a chunk of stdin. An empty chunk marks the end.
+"""
+
+OUTPUT = b"O"
+"""
+Server-to-client frame with a chunk of output.
+"""
+
+ERROR = b"E"
+"""
+Server-to-client frame with a chunk of error output, like an argument parser's
+usage message.
+"""
+
+EXIT = b"X"
+"""
+Server-to-client frame with the exit code. This is always the final frame.
+"""
+
+
+PLAIN = b"cline\0"
+"""
+Prefix of a request in the plain protocol, which clients without a Python
+interpreter can speak with tools like `socat`.
+
+A plain request is made of NUL-terminated fields: "cline", the working
+directory, the number of arguments and then each argument. Every byte after the
+request is stdin, up to the client shutting down its side of the connection.
+
+The server responds with lines of text, each beginning with a kind and a
+space:
+
+- "o": a line of output.
+- "O": a final line of output that has no newline.
+- "e": a line of error output.
+- "E": a final line of error output that has no newline.
+- "x": the exit code. This is always the final line.
+"""
+
+
+def read_fields(reader: SocketReader, count: int) -> Optional[List[str]]:
+    """
+    Reads `count` NUL-terminated fields of a plain request, or returns `None` if
+    the connection closed.
+    """
+
+    fields: List[str] = []
+
+    for _ in range(count):
+        field = b""
+        while (byte := reader.read(1)) != b"\0":
+            if not byte:
+                return None
+            field += byte
+        fields.append(field.decode("utf-8"))
+
+    return fields
+
+
+def read_frame(reader: SocketReader) -> Optional[Tuple[bytes, bytes]]:
+    """
+    Reads a frame's kind and payload, or returns `None` if the connection
+    closed.
+    """
+
+    head = reader.read(5)
+    if len(head) < 5:
+        return None
+
+    length = int.from_bytes(head[1:], "big")
+    payload = reader.read(length)
+    if len(payload) < length:
+        return None
+
+    return head[:1], payload
+
+
+def send_frame(sock: socket, kind: bytes, payload: bytes = b"") -> None:
+    """
+    Sends a frame.
+    """
+
+    sock.sendall(kind + len(payload).to_bytes(4, "big") + payload)
+
+
+class FrameReader(RawIOBase):
+    """
+    Reads the payloads of consecutive frames of one kind as a stream.
+
+    Arguments:
+        reader: Socket reader.
+        kind:   Frame kind.
+    """
+
+    def __init__(self, reader: SocketReader, kind: bytes) -> None:
+        self._buffer = b""
+        self._ended = False
+        self._kind = kind
+        self._reader = reader
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: "WriteableBuffer") -> int:
+        while not self._buffer and not self._ended:
+            frame = read_frame(self._reader)
+            if frame is None or frame[0] != self._kind or not frame[1]:
+                self._ended = True
+            else:
+                self._buffer = frame[1]
+
+        view = memoryview(buffer).cast("B")
+        count = min(len(view), len(self._buffer))
+        view[:count] = self._buffer[:count]
+        self._buffer = self._buffer[count:]
+        return count
+
+
+class FrameWriter(RawIOBase):
+    """
+    Writes a stream as frames of one kind.
+
+    Arguments:
+        sock: Socket.
+        kind: Frame kind.
+    """
+
+    def __init__(self, sock: socket, kind: bytes) -> None:
+        self._kind = kind
+        self._sock = sock
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: "ReadableBuffer") -> int:
+        data = bytes(buffer)
+        if data:
+            send_frame(self._sock, self._kind, data)
+        return len(data)
+
+
+class LineWriter(RawIOBase):
+    """
+    Writes a stream as lines of a plain response.
+
+    Output is sent a line at a time, and any final line without a newline is
+    sent by `close()`.
+
+    Arguments:
+        sock: Socket.
+        kind: Line kind: b"o" for output or b"e" for error output.
+    """
+
+    def __init__(self, sock: socket, kind: bytes) -> None:
+        self._kind = kind
+        self._pending = b""
+        self._sock = sock
+
+    def close(self) -> None:
+        if not self.closed and self._pending:
+            self._sock.sendall(self._kind.upper() + b" " + self._pending + b"\n")
+            self._pending = b""
+        super().close()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: "ReadableBuffer") -> int:
+        data = bytes(buffer)
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+        prefix = self._kind + b" "
+        if lines:
+            self._sock.sendall(b"".join(prefix + line + b"\n" for line in lines))
+        return len(data)
@@ -0,0 +1,190 @@
+import sys
+from contextlib import redirect_stderr, redirect_stdout
+from io import BufferedReader, BufferedWriter, RawIOBase, TextIOWrapper
+from json import loads
+from logging import getLogger
+from os import chdir, environ, lstat, umask
+from pathlib import Path
+from socketserver import ForkingMixIn, StreamRequestHandler, UnixStreamServer
+from stat import S_ISSOCK
+from typing import Any, List, Type, cast
+
+from cline.cli import Cli
+from cline.cli.batch import _exit_code
+from cline.daemon.protocol import (
+    ERROR,
+    EXIT,
+    HEADER,
+    OUTPUT,
+    PLAIN,
+    STDIN,
+    FrameReader,
+    FrameWriter,
+    LineWriter,
+    read_fields,
+    read_frame,
+    send_frame,
+)
+
+AnyCli = Cli[Any]
+
+
+def _make_writer(raw: RawIOBase) -> TextIOWrapper:
+    return TextIOWrapper(BufferedWriter(raw), encoding="utf-8", line_buffering=True)
+
+
+class DaemonServer(ForkingMixIn, UnixStreamServer):
+    """
+    A forking Unix socket server that holds a warm CLI.
+
+    Arguments:
+        cli:         Warm CLI to copy for each invocation.
+        socket_path: Path to the Unix socket to listen on.
+    """
+
+    def __init__(self, cli: AnyCli, socket_path: str) -> None:
+        self.cli = cli
+        super().__init__(socket_path, DaemonRequestHandler)
+
+
+class DaemonRequestHandler(StreamRequestHandler):
+    """
+    Handles one invocation in a forked child process.
+    """
+
+    server: DaemonServer
+
+    def handle(self) -> None:
+        # Buffered readers can always peek, whatever `rfile` is annotated as:
+        reader = cast(BufferedReader, self.rfile)
+
+        if reader.peek(1)[:1] == PLAIN[:1]:
+            self._handle_plain(reader)
+        else:
+            self._handle_framed()
+
+    def _handle_framed(self) -> None:
+        frame = read_frame(self.rfile)
+        if frame is None or frame[0] != HEADER:
+            return
+
+        header = loads(frame[1])
+
+        # This is a forked child, so changing the process's state doesn't
+        # affect the server or any other invocation:
+        chdir(header["cwd"])
+        environ.clear()
+        environ.update(header["env"])
+
+        stdin = BufferedReader(FrameReader(self.rfile, STDIN))
+        sys.stdin = TextIOWrapper(stdin, encoding="utf-8")
+
+        out = _make_writer(FrameWriter(self.connection, OUTPUT))
+        err = _make_writer(FrameWriter(self.connection, ERROR))
+
+        exit_code = self._invoke(header["args"], out, err)
+        send_frame(self.connection, EXIT, str(exit_code).encode("ascii"))
+
+    def _handle_plain(self, reader: BufferedReader) -> None:
+        head = read_fields(reader, 3)
+        if head is None or head[0] != "cline" or not head[2].isdigit():
+            return
+
+        args = read_fields(reader, int(head[2]))
+        if args is None:
+            return
+
+        # This is a forked child, so changing the process's state doesn't
+        # affect the server or any other invocation:
+        chdir(head[1])
+
+        sys.stdin = TextIOWrapper(reader, encoding="utf-8")
+
+        out = _make_writer(LineWriter(self.connection, b"o"))
+        err = _make_writer(LineWriter(self.connection, b"e"))
+
+        exit_code = self._invoke(args, out, err)
+        self.connection.sendall(f"x {exit_code}\n".encode("ascii"))
+
+    def _invoke(self, args: List[str], out: TextIOWrapper, err: TextIOWrapper) -> int:
+        cli = self.server.cli.with_args(args, out=out)
+
+        try:
+            # An argument parser writes usage errors to stderr and help to
+            # stdout, which belong to the client rather than the server:
+            with redirect_stderr(err), redirect_stdout(out):
+                exit_code = cli.invoke()
+        except KeyboardInterrupt:
+            exit_code = 100
+        except SystemExit as ex:
+            # Like `ArgumentParser` exiting on invalid arguments:
+            exit_code = _exit_code(ex)
+
+        # Closing sends any final line that has no newline:
+        err.close()
+        out.close()
+        return exit_code
+
+
+def make_server(
+    cli_type: Type[AnyCli],
+    socket_path: str,
+    app_version: str = "",
+) -> DaemonServer:
+    """
+    Makes a warm CLI and a server to listen on `socket_path`.
+
+    Any socket already at `socket_path` is replaced. The new socket can only be
+    connected to by the current user, since clients choose the arguments,
+    environment variables and working directory of each invocation.
+
+    Arguments:
+        cli_type:    CLI class.
+        socket_path: Path to the Unix socket to listen on.
+        app_version: Host application version.
+
+    Raises:
+        FileExistsError: If something other than a socket is at `socket_path`.
+    """
+
+    try:
+        mode = lstat(socket_path).st_mode
+    except FileNotFoundError:
+        pass
+    else:
+        if not S_ISSOCK(mode):
+            raise FileExistsError(f'"{socket_path}" exists and is not a socket')
+        Path(socket_path).unlink()
+
+    cli = cli_type(app_version=app_version, args=[])
+    cli.warm(import_tasks=True)
+
+    # Create the socket without any permissions for the group or others, rather
+    # than change them after it's already listening:
+    previous_umask = umask(0o177)
+    try:
+        return DaemonServer(cli, socket_path)
+    finally:
+        umask(previous_umask)
+
+
+def serve(cli_type: Type[AnyCli], socket_path: str, app_version: str = "") -> None:
+    """
+    Serves invocations on `socket_path` until interrupted.
+
+    Arguments:
+        cli_type:    CLI class.
+        socket_path: Path to the Unix socket to listen on.
+        app_version: Host application version.
+    """
+
+    server = make_server(cli_type, socket_path, app_version)
+    getLogger("cline").debug("Serving %s on %s", cli_type, socket_path)
+
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        Path(socket_path).unlink(missing_ok=True)
@@ -0,0 +1,58 @@
+from shlex import quote
+
+AWK_PROGRAM = """
+$1 == "x" { code = $2; next }
+{ text = substr($0, 3) }
+$1 == "o" { print text; fflush(); next }
+$1 == "O" { printf "%s", text; fflush(); next }
+$1 == "e" { print text > "/dev/stderr"; next }
+$1 == "E" { printf "%s", text > "/dev/stderr"; next }
+END { exit (code == "" ? 101 : code) }
+""".strip()
+"""
+Program that each shim runs over a plain response to write the output and exit
+with the exit code. Exits with 101 if the response ends without an exit code.
+
+The program is embedded in single quotes, so it must not contain any.
+"""
+
+_SHIM = """#!/bin/sh
+# Invokes the Cline application served on {socket} without starting Python.
+# Generated by Cline.
+
+socket={socket}
+
+connect() {{
+    if command -v socat >/dev/null 2>&1; then
+        socat -t 86400 - "UNIX-CONNECT:$socket"
+    else
+        nc -N -U "$socket"
+    fi
+}}
+
+# Don't wait for input that a person at a terminal will never type:
+[ -t 0 ] && exec </dev/null
+
+{{
+    printf 'cline\\0%s\\0%s\\0' "$PWD" "$#"
+    [ "$#" -eq 0 ] || printf '%s\\0' "$@"
+    cat
+}} | connect | awk '{awk}'
+"""
+
+
+def make_shim(socket_path: str) -> str:
+    """
+    Makes a shell script that invokes the application served on `socket_path`
+    via the plain protocol, like `python -m cline.daemon` does but without the
+    cost of starting Python.
+
+    The script needs `socat` or OpenBSD `nc`, and `awk`. It forwards the
+    arguments, working directory and stdin, but not environment variables, and
+    streams the output a line at a time. The output must be text.
+
+    Arguments:
+        socket_path: Path to the server's Unix socket.
+    """
+
+    return _SHIM.format(awk=AWK_PROGRAM, socket=quote(socket_path))
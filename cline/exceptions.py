@@ -1,3 +1,6 @@
+from typing import List
+
+
 class ClineError(Exception):
     pass
 
@@ -6,6 +9,32 @@ class CannotMakeArguments(ClineError):
     pass
 
 
+class Cancelled(ClineError):
+    """
+    Raised when a task is cancelled, like by a timeout or SIGTERM.
+
+    Arguments:
+        reason: Reason for the cancellation, like "timed out".
+    """
+
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
+
+
+class InvalidArguments(CannotMakeArguments):
+    """
+    Raised when command line arguments are missing or invalid.
+
+    Arguments:
+        problems: Description of every missing or invalid argument.
+    """
+
+    def __init__(self, problems: List[str]) -> None:
+        super().__init__(", ".join(problems))
+        self.problems = problems
+
+
 class UserNeedsHelp(ClineError):
     def __init__(self, explicit: bool) -> None:
         super().__init__("user needs help")
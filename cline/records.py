@@ -0,0 +1,143 @@
+"""
+`cline.records` reads and writes streams of records in constant memory.
+
+Records can be framed as:
+
+- "lines": each record ends with a newline.
+- "nul": each record ends with a NUL byte (like `find -print0`).
+- "length": each record follows its length as a 4-byte big-endian integer.
+
+The delimiters and length prefixes are not included in the records.
+"""
+
+from typing import IO, Iterator
+
+FRAMINGS = ("length", "lines", "nul")
+"""
+Supported record framings.
+"""
+
+_DELIMITERS = {"lines": b"\n", "nul": b"\0"}
+
+_PREFIX_SIZE = 4
+
+
+def _check_framing(framing: str) -> None:
+    if framing not in FRAMINGS:
+        raise ValueError(f'"{framing}" is not a record framing ({", ".join(FRAMINGS)})')
+
+
+def _read_delimited(
+    reader: IO[bytes],
+    delimiter: bytes,
+    chunk_size: int,
+    max_record_size: int,
+) -> Iterator[bytes]:
+    # Prefer `read1()` to process input as soon as it's available rather than
+    # waiting to fill the chunk:
+    read = getattr(reader, "read1", reader.read)
+    pending = bytearray()
+
+    while chunk := read(chunk_size):
+        # Only the new chunk can hold a delimiter that hasn't been found yet, so
+        # a record spanning many chunks is appended to rather than copied again
+        # for every chunk:
+        last = chunk.rfind(delimiter)
+
+        if last < 0:
+            pending += chunk
+        else:
+            for record in b"".join((pending, chunk[:last])).split(delimiter):
+                if len(record) > max_record_size:
+                    raise ValueError(f"record exceeds {max_record_size:,} bytes")
+                yield record
+
+            after = last + len(delimiter)
+            pending = bytearray(chunk[after:])
+
+        if len(pending) > max_record_size:
+            raise ValueError(f"record exceeds {max_record_size:,} bytes")
+
+    # The final record doesn't need to be terminated:
+    if pending:
+        yield bytes(pending)
+
+
+def _read_exactly(reader: IO[bytes], size: int) -> bytes:
+    data = reader.read(size)
+
+    while len(data) < size:
+        if not (more := reader.read(size - len(data))):
+            break
+        data += more
+
+    return data
+
+
+def _read_length_prefixed(reader: IO[bytes], max_record_size: int) -> Iterator[bytes]:
+    while prefix := _read_exactly(reader, _PREFIX_SIZE):
+        if len(prefix) < _PREFIX_SIZE:
+            raise ValueError("record length is truncated")
+
+        size = int.from_bytes(prefix, "big")
+
+        if size > max_record_size:
+            raise ValueError(f"record exceeds {max_record_size:,} bytes")
+
+        record = _read_exactly(reader, size)
+
+        if len(record) < size:
+            raise ValueError(f"record is truncated ({len(record):,} of {size:,} bytes)")
+
+        yield record
+
+
+def read_records(
+    reader: IO[bytes],
+    framing: str = "lines",
+    chunk_size: int = 65536,
+    max_record_size: int = 16_777_216,
+) -> Iterator[bytes]:
+    """
+    Yields records from `reader` as they become available.
+
+    At most one chunk and one record are held in memory at a time, so streams
+    of any length are read in constant memory.
+
+    Arguments:
+        reader:          Binary reader.
+        framing:         Record framing: "length", "lines" or "nul".
+        chunk_size:      Maximum number of bytes to read at a time.
+        max_record_size: Maximum size of a record in bytes.
+
+    Raises:
+        ValueError: If `framing` is not supported, a record exceeds
+        `max_record_size` or a length-prefixed record is truncated.
+    """
+
+    _check_framing(framing)
+
+    if framing == "length":
+        return _read_length_prefixed(reader, max_record_size)
+
+    delimiter = _DELIMITERS[framing]
+    return _read_delimited(reader, delimiter, chunk_size, max_record_size)
+
+
+def write_record(writer: IO[bytes], record: bytes, framing: str = "lines") -> None:
+    """
+    Writes `record` to `writer` with the given framing.
+
+    Raises:
+        ValueError: If `framing` is not supported.
+    """
+
+    _check_framing(framing)
+
+    if framing == "length":
+        writer.write(len(record).to_bytes(_PREFIX_SIZE, "big"))
+        writer.write(record)
+        return
+
+    writer.write(record)
+    writer.write(_DELIMITERS[framing])
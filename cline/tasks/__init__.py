@@ -2,17 +2,36 @@
 `cline.tasks` contains task implementations, which are the units of work that a
 Cline-enabled application can invoke.
 
-All tasks must inherit from `Task`.
+All tasks must inherit from `Task`. Asynchronous tasks must inherit from
+`AsyncTask`. Tasks that process a stream of records from stdin can inherit from
+`StreamTask`. Tasks can inherit from `DataclassTask` to have their arguments made
+from their arguments dataclass.
 """
 
+from cline.tasks.async_task import AnyAsyncTask, AnyAsyncTaskType, AsyncTask
+from cline.tasks.dataclass_task import DataclassTask
 from cline.tasks.help import HelpTask
-from cline.tasks.task import AnyTask, AnyTaskType, Task
+from cline.tasks.lazy import LazyTask
+from cline.tasks.selector import Selector
+from cline.tasks.stream_task import AnyStreamTask, AnyStreamTaskType, StreamTask
+from cline.tasks.task import NO_MATCH, AnyTask, AnyTaskType, NoMatch, Task
 from cline.tasks.version import VersionTask
 
 __all__ = [
+    "NO_MATCH",
+    "AnyAsyncTask",
+    "AnyAsyncTaskType",
+    "AnyStreamTask",
+    "AnyStreamTaskType",
     "AnyTask",
     "AnyTaskType",
+    "AsyncTask",
+    "DataclassTask",
     "HelpTask",
+    "LazyTask",
+    "NoMatch",
+    "Selector",
+    "StreamTask",
     "Task",
     "VersionTask",
 ]
@@ -0,0 +1,42 @@
+from abc import abstractmethod
+from typing import Any, Type
+
+from cline.tasks.task import Task, TTaskArgs
+
+
+class AsyncTask(Task[TTaskArgs]):
+    """
+    Abstract base asynchronous task. Asynchronous tasks must inherit from this
+    and implement `ainvoke()` rather than `invoke()`.
+
+    Cline awaits `ainvoke()` on an event loop that it runs for the duration of
+    the task.
+
+    See `Task` for the constructor arguments.
+    """
+
+    @abstractmethod
+    async def ainvoke(self) -> int:
+        """
+        Invokes the task asynchronously.
+
+        Reads arguments from `self.args`. Writes output to `self.out`.
+
+        Returns the shell exit code.
+        """
+
+    def invoke(self) -> int:
+        """
+        Invokes the task on a new event loop.
+
+        Returns the shell exit code.
+        """
+
+        # asyncio is expensive to import, and only asynchronous tasks need it:
+        from asyncio import run
+
+        return run(self.ainvoke())
+
+
+AnyAsyncTask = AsyncTask[Any]
+AnyAsyncTaskType = Type[AnyAsyncTask]
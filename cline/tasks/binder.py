@@ -0,0 +1,107 @@
+from dataclasses import MISSING, Field, fields, is_dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from cline.cli_args import CommandLineArguments
+
+T = TypeVar("T")
+
+Binder = Callable[[CommandLineArguments], T]
+"""
+Function that binds parsed command line arguments to task arguments.
+"""
+
+_FACTORY = object()
+"""
+Default that marks a field's value to be made by its default factory.
+"""
+
+
+def _get_kind(field: "Field[Any]", field_type: Any) -> Tuple[Type[Any], bool]:
+    optional = False
+
+    if get_origin(field_type) is Union:
+        members = [t for t in get_args(field_type) if t is not type(None)]
+        if len(members) != 1:
+            raise TypeError(f'"{field.name}" is a union of types ({field_type})')
+        field_type = members[0]
+        optional = True
+
+    if field_type in (bool, int, str):
+        return field_type, optional
+
+    if get_origin(field_type) is list and get_args(field_type) == (str,):
+        return list, optional
+
+    raise TypeError(f'"{field.name}" has an unsupported type ({field_type})')
+
+
+def make_binder(args_type: Type[T]) -> Binder[T]:
+    """
+    Makes a function that binds parsed command line arguments to a new instance
+    of the dataclass `args_type`.
+
+    Each field is bound to the command line argument of the same name, by the
+    field's type:
+
+    - `bool`: as per `get_bool()`
+    - `int`: as per `get_integer()`
+    - `str`: as per `get_string()`
+    - `List[str]`: as per `get_list()`
+
+    Fields that are `Optional` or have defaults take their default when the
+    argument isn't set. Fields that aren't initialised aren't bound.
+
+    The field types are inspected once, here, so binding is a single
+    `CommandLineArguments.extract()` with a precomputed schema. The binder
+    raises `InvalidArguments` listing every missing or invalid field.
+
+    Raises:
+        TypeError: If `args_type` is not a dataclass or a field's type is not
+        supported.
+    """
+
+    if not is_dataclass(args_type) or not isinstance(args_type, type):
+        raise TypeError(f"{args_type} is not a dataclass")
+
+    hints = get_type_hints(args_type)
+
+    schema: Dict[str, Type[Any]] = {}
+    defaults: Dict[str, Any] = {}
+    factories: Dict[str, Callable[[], Any]] = {}
+
+    for field in fields(args_type):
+        if not field.init:
+            continue
+
+        kind, optional = _get_kind(field, hints[field.name])
+        schema[field.name] = kind
+
+        if field.default is not MISSING:
+            defaults[field.name] = field.default
+        elif field.default_factory is not MISSING:
+            defaults[field.name] = _FACTORY
+            factories[field.name] = field.default_factory
+        elif optional:
+            defaults[field.name] = None
+
+    def bind(args: CommandLineArguments) -> T:
+        values = args.extract(schema, defaults)
+
+        for name, factory in factories.items():
+            if values[name] is _FACTORY:
+                values[name] = factory()
+
+        return args_type(**values)
+
+    return bind
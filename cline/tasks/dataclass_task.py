@@ -0,0 +1,74 @@
+from typing import Any, ClassVar, Dict, Optional, Type, get_args, get_origin
+
+from cline.cli_args import CommandLineArguments
+from cline.exceptions import CannotMakeArguments
+from cline.tasks.binder import Binder, make_binder
+from cline.tasks.task import Task, TTaskArgs
+
+
+class DataclassTask(Task[TTaskArgs]):
+    """
+    Abstract base task that makes its arguments from the fields of its
+    arguments dataclass rather than a hand-written `make_args()`.
+
+    Each field is bound to the command line argument of the same name, by the
+    field's type. See `cline.tasks.binder.make_binder()` for the supported
+    types.
+
+    If the task declares a selector then the command line arguments must
+    satisfy it before any field is bound.
+
+    The binder is made on first use and kept for the lifetime of the task
+    class.
+
+    See `Task` for the constructor arguments.
+    """
+
+    _binders: ClassVar[Dict[Type[Any], Binder[Any]]] = {}
+
+    @classmethod
+    def args_type(cls) -> Type[TTaskArgs]:
+        """
+        Gets the arguments dataclass that this task was declared with.
+
+        Raises:
+            TypeError: If the task wasn't declared with a concrete arguments
+            type.
+        """
+
+        for klass in cls.__mro__:
+            for base in klass.__dict__.get("__orig_bases__", ()):
+                origin = get_origin(base)
+                if isinstance(origin, type) and issubclass(origin, Task):
+                    args_type = get_args(base)[0]
+                    if isinstance(args_type, type):
+                        return args_type
+
+        raise TypeError(f"{cls} does not declare a concrete arguments type")
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> TTaskArgs:
+        """
+        Makes and returns strongly-typed arguments for this task based on the
+        parsed command line arguments `args`.
+
+        Arguments:
+            args: Parsed command line arguments
+
+        Raises:
+            CannotMakeArguments: If the given arguments are not relevant to this
+            task
+
+        Returns:
+            Task arguments
+        """
+
+        if cls.selector and not cls.selector.matches(args):
+            raise CannotMakeArguments()
+
+        binder: Optional[Binder[TTaskArgs]] = cls._binders.get(cls)
+        if binder is None:
+            binder = make_binder(cls.args_type())
+            cls._binders[cls] = binder
+
+        return binder(args)
@@ -0,0 +1,74 @@
+from importlib import import_module
+from typing import Any, Optional
+
+from cline.tasks.selector import Selector
+from cline.tasks.task import AnyTaskType, Task
+
+
+class LazyTask:
+    """
+    A task registered by its import path rather than its class, so that the
+    task's module (and all its dependencies) are imported only if the task
+    needs to be asked to make its arguments.
+
+    Declare a `selector` to avoid importing the task at all when the command
+    line arguments don't select it.
+
+    Arguments:
+        path:     Import path in the form "package.module:TaskClass".
+        selector: Optional selector to describe the arguments the task needs.
+    """
+
+    def __init__(self, path: str, selector: Optional[Selector] = None) -> None:
+        module, _, name = path.partition(":")
+
+        if not module or not name:
+            raise ValueError(f'"{path}" is not in the form "package.module:Task"')
+
+        self._module = module
+        self._name = name
+        self._selector = selector
+        self._task: Optional[AnyTaskType] = None
+
+    def __repr__(self) -> str:
+        return f'LazyTask("{self.path}")'
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Checks if the task's module has been imported.
+        """
+
+        return self._task is not None
+
+    def load(self) -> AnyTaskType:
+        """
+        Imports and returns the task class.
+        """
+
+        if self._task is None:
+            task: Any = import_module(self._module)
+            for attribute in self._name.split("."):
+                task = getattr(task, attribute)
+
+            if not isinstance(task, type) or not issubclass(task, Task):
+                raise TypeError(f"{self.path} is not a task")
+
+            self._task = task
+        return self._task
+
+    @property
+    def path(self) -> str:
+        """
+        Gets the import path.
+        """
+
+        return f"{self._module}:{self._name}"
+
+    @property
+    def selector(self) -> Optional[Selector]:
+        """
+        Gets the selector.
+        """
+
+        return self._selector
@@ -0,0 +1,95 @@
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
+
+from cline.cli_args import CommandLineArguments
+
+SelectorValue = Union[bool, str]
+
+
+class Selector:
+    """
+    Declares the command line arguments that a task requires before it will
+    even consider making its arguments.
+
+    A CLI uses selectors to index its registered tasks once, then jump straight
+    to the tasks that could possibly handle the command line arguments rather
+    than asking every task to make its arguments.
+
+    A selector can also declare the subcommand that a task handles, like
+    "db migrate up". The CLI routes the leading command line arguments through a
+    tree of every registered subcommand, so only the tasks registered for that
+    exact subcommand are considered. The subcommand's words are removed from the
+    command line arguments before they are parsed.
+
+    Arguments:
+        command: Subcommand words, as a list or a space-separated string.
+        flags:   Names of flags that must be truthy (as per `assert_true()`).
+        values:  Argument names mapped to the string or list of strings that the
+                 argument must match (as per `assert_string()`).
+    """
+
+    def __init__(
+        self,
+        flags: Optional[Sequence[str]] = None,
+        values: Optional[Mapping[str, Union[List[str], str]]] = None,
+        command: Optional[Union[Sequence[str], str]] = None,
+    ) -> None:
+        if isinstance(command, str):
+            command = command.split()
+
+        self._command = tuple(command or [])
+        self._flags = tuple(flags or [])
+        self._values: Dict[str, FrozenSet[str]] = {
+            arg: frozenset([value] if isinstance(value, str) else value)
+            for arg, value in (values or {}).items()
+        }
+
+    def __repr__(self) -> str:
+        command = list(self._command)
+        values = {arg: sorted(value) for arg, value in self._values.items()}
+        return (
+            f"Selector(command={command}, flags={list(self._flags)}, values={values})"
+        )
+
+    @property
+    def command(self) -> Tuple[str, ...]:
+        """
+        Gets the subcommand words, or an empty tuple if the selector doesn't
+        declare a subcommand.
+        """
+
+        return self._command
+
+    @property
+    def key(self) -> Optional[Tuple[str, List[SelectorValue]]]:
+        """
+        Gets the argument name and acceptable values to index this selector by,
+        or `None` if the selector has no requirements.
+        """
+
+        if self._flags:
+            return self._flags[0], [True]
+
+        for arg, values in self._values.items():
+            return arg, sorted(values)
+
+        return None
+
+    def matches(self, args: CommandLineArguments) -> bool:
+        """
+        Checks if the parsed command line arguments `args` satisfy this
+        selector.
+
+        The subcommand isn't checked, since the CLI routes subcommands before
+        parsing.
+        """
+
+        for flag in self._flags:
+            if args.get_raw(flag) is not True:
+                return False
+
+        for arg, values in self._values.items():
+            value = args.get_raw(arg)
+            if not isinstance(value, str) or value not in values:
+                return False
+
+        return True
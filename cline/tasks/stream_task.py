@@ -0,0 +1,75 @@
+from abc import abstractmethod
+from typing import Any, ClassVar, Iterator, Type
+
+from cline.records import read_records, write_record
+from cline.tasks.task import Task, TTaskArgs
+
+
+class StreamTask(Task[TTaskArgs]):
+    """
+    Abstract base task that processes a stream of records from its input and
+    writes a stream of records to its binary output. Streaming tasks must
+    inherit from this and implement `process()` rather than `invoke()`.
+
+    Records are read and written one at a time, so inputs of any size are
+    processed in constant memory.
+
+    See `Task` for the constructor arguments.
+    """
+
+    chunk_size: ClassVar[int] = 65536
+    """
+    Maximum number of bytes to read from the input at a time.
+    """
+
+    framing: ClassVar[str] = "lines"
+    """
+    Framing of the input and output records: "length", "lines" or "nul". See
+    `cline.records`.
+    """
+
+    max_record_size: ClassVar[int] = 16_777_216
+    """
+    Maximum size of an input record in bytes.
+    """
+
+    def invoke(self) -> int:
+        """
+        Writes each record yielded by `process()` to the binary output.
+
+        Returns the shell exit code.
+        """
+
+        out_bytes = self.out_bytes
+        framing = self.framing
+
+        for record in self.process(self.records()):
+            write_record(out_bytes, record, framing)
+
+        return 0
+
+    @abstractmethod
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        """
+        Processes the input records and yields the output records.
+
+        Reads arguments from `self.args`. Implement as a generator that yields
+        each output record as soon as it's ready to process the stream in
+        constant memory.
+        """
+
+    def records(self) -> Iterator[bytes]:
+        """
+        Gets an iterator of the input records.
+        """
+
+        return read_records(
+            self.in_bytes,
+            self.framing,
+            chunk_size=self.chunk_size,
+            max_record_size=self.max_record_size,
+        )
+
+
+AnyStreamTask = StreamTask[Any]
+AnyStreamTaskType = Type[AnyStreamTask]
@@ -1,23 +1,85 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import IO, Any, Generic, Type, TypeVar
+from enum import Enum
+from typing import IO, Any, ClassVar, Generic, Optional, Type, TypeVar, Union
 
+from cline.cancellation import CancellationToken
 from cline.cli_args import CommandLineArguments
+from cline.exceptions import CannotMakeArguments
+from cline.tasks.selector import Selector
+from cline.writers import make_binary_writer
 
 TTaskArgs = TypeVar("TTaskArgs")
 
 
+class NoMatch(Enum):
+    """
+    Type of the `NO_MATCH` sentinel.
+    """
+
+    NO_MATCH = "NO_MATCH"
+
+
+NO_MATCH = NoMatch.NO_MATCH
+"""
+Returned by `Task.try_make_args()` when a task cannot handle the command line
+arguments.
+"""
+
+
 class Task(ABC, Generic[TTaskArgs]):
     """
     Abstract base task. All tasks must inherit from this.
 
     Arguments:
-        args: Strongly-typed task arguments.
-        out:  Output writer.
+        args:         Strongly-typed task arguments.
+        out:          Output writer.
+        out_bytes:    Binary output writer. Defaults to a writer to the same
+                      destination as `out`.
+        in_bytes:     Binary input reader. Defaults to stdin.
+        cancellation: Cancellation token. Defaults to a token that is only
+                      cancelled by the task itself.
+
+    CLIs make tasks with `args` and `out` only, and set the other arguments
+    after construction, so subclasses that override `__init__()` need only
+    accept `args` and `out`.
+    """
+
+    cancel_cooperatively: ClassVar[bool] = False
+    """
+    `True` if the task checks `self.cancellation` often enough to stop by
+    itself when it's cancelled.
+
+    Otherwise, when the task is invoked by `invoke_and_exit()`, a timeout or
+    SIGTERM also raises `Cancelled` wherever the task happens to be.
+    """
+
+    selector: ClassVar[Optional[Selector]] = None
+    """
+    Optional declaration of the command line arguments that this task requires.
+    CLIs use selectors to skip tasks that cannot possibly handle the arguments.
+    Tasks without a selector are always asked to make their arguments.
+    """
+
+    timeout: ClassVar[Optional[float]] = None
+    """
+    Optional number of seconds that the task may run for before it's cancelled
+    as timed out.
     """
 
-    def __init__(self, args: TTaskArgs, out: IO[str]) -> None:
+    def __init__(
+        self,
+        args: TTaskArgs,
+        out: IO[str],
+        out_bytes: Optional[IO[bytes]] = None,
+        in_bytes: Optional[IO[bytes]] = None,
+        cancellation: Optional[CancellationToken] = None,
+    ) -> None:
         self._args = args
+        self._cancellation = cancellation
+        self._in_bytes = in_bytes
         self._out = out
+        self._out_bytes = out_bytes
 
     @property
     def args(self) -> TTaskArgs:
@@ -27,6 +89,38 @@ class Task(ABC, Generic[TTaskArgs]):
 
         return self._args
 
+    @property
+    def cancellation(self) -> CancellationToken:
+        """
+        Gets the cancellation token.
+
+        Call `self.cancellation.check()` at convenient points to stop when the
+        task is cancelled.
+        """
+
+        if self._cancellation is None:
+            self._cancellation = CancellationToken()
+        return self._cancellation
+
+    def flush(self) -> None:
+        """
+        Flushes the output writers.
+        """
+
+        self._out.flush()
+        if self._out_bytes is not None:
+            self._out_bytes.flush()
+
+    @property
+    def in_bytes(self) -> IO[bytes]:
+        """
+        Gets the binary input reader.
+        """
+
+        # Get stdin when it's needed rather than when the task is made, in case
+        # it has been replaced (like by the daemon server):
+        return self._in_bytes or sys.stdin.buffer
+
     @abstractmethod
     def invoke(self) -> int:
         """
@@ -63,6 +157,45 @@ class Task(ABC, Generic[TTaskArgs]):
 
         return self._out
 
+    @property
+    def out_bytes(self) -> IO[bytes]:
+        """
+        Gets the binary output writer.
+
+        Text and binary output are buffered independently, so call
+        `self.out.flush()` before switching from writing text to writing bytes.
+        """
+
+        if self._out_bytes is None:
+            self._out_bytes = make_binary_writer(self._out)
+        return self._out_bytes
+
+    @classmethod
+    def try_make_args(cls, args: CommandLineArguments) -> Union[TTaskArgs, NoMatch]:
+        """
+        Makes and returns strongly-typed arguments for this task based on the
+        parsed command line arguments `args`, or returns `NO_MATCH` if the
+        arguments are not relevant to this task.
+
+        CLIs probe tasks via this method when it's overridden, so a task that
+        rejects arguments doesn't cost a raised exception. Use the
+        `CommandLineArguments.try_get_*()` getters to implement it. Tasks that
+        override this must still implement `make_args()`.
+
+        The default implementation calls `make_args()`.
+
+        Arguments:
+            args: Parsed command line arguments
+
+        Returns:
+            Task arguments or `NO_MATCH`
+        """
+
+        try:
+            return cls.make_args(args)
+        except CannotMakeArguments:
+            return NO_MATCH
+
 
 AnyTask = Task[Any]
 AnyTaskType = Type[AnyTask]
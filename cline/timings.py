@@ -0,0 +1,113 @@
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import IO, List, Optional
+
+TIMINGS_ENV = "CLINE_TIMINGS"
+"""
+Name of the environment variable that enables timings. Any value other than
+empty or "0" prints a summary to stderr when the invocation completes.
+"""
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """
+    The timing of one phase of an invocation.
+
+    Phases can be nested; for example, "parser" (making the argument parser)
+    happens within "parse" (parsing the command line arguments), and each
+    "probe" and "construct" happens within "dispatch".
+
+    Arguments:
+        ended_ns:   Performance counter at the end of the phase.
+        phase:      Phase name.
+        started_ns: Performance counter at the start of the phase.
+        task:       Name of the task the phase concerned, if any.
+    """
+
+    ended_ns: int
+    phase: str
+    started_ns: int
+    task: Optional[str] = None
+
+    @property
+    def duration_ns(self) -> int:
+        """
+        Gets the duration of the phase in nanoseconds.
+        """
+
+        return self.ended_ns - self.started_ns
+
+
+class Timings:
+    """
+    Records high-resolution timings of the phases of an invocation.
+    """
+
+    def __init__(self) -> None:
+        self._phases: List[PhaseTiming] = []
+
+    @property
+    def phases(self) -> List[PhaseTiming]:
+        """
+        Gets the recorded phases in the order they started.
+        """
+
+        return sorted(self._phases, key=lambda p: p.started_ns)
+
+    def record(self, phase: str, started_ns: int, task: Optional[str] = None) -> None:
+        """
+        Records a phase that started at `started_ns` and has just ended.
+
+        Arguments:
+            phase:      Phase name.
+            started_ns: Value of `perf_counter_ns()` at the start of the phase.
+            task:       Name of the task the phase concerned, if any.
+        """
+
+        timing = PhaseTiming(
+            ended_ns=perf_counter_ns(),
+            phase=phase,
+            started_ns=started_ns,
+            task=task,
+        )
+
+        self._phases.append(timing)
+
+    @property
+    def total_ns(self) -> int:
+        """
+        Gets the time in nanoseconds from the start of the first phase to the
+        end of the last.
+        """
+
+        if not self._phases:
+            return 0
+
+        started = min(p.started_ns for p in self._phases)
+        ended = max(p.ended_ns for p in self._phases)
+        return ended - started
+
+    def write_summary(self, out: IO[str]) -> None:
+        """
+        Writes a human-readable summary of the recorded phases.
+
+        Nested phases are indented beneath the phase they happened within.
+        """
+
+        out.write(f"{'phase':<24} {'ms':>9}\n")
+
+        enclosing: List[PhaseTiming] = []
+
+        for timing in self.phases:
+            while enclosing and enclosing[-1].ended_ns <= timing.started_ns:
+                enclosing.pop()
+
+            name = "  " * len(enclosing) + timing.phase
+            if timing.task:
+                name += f" {timing.task}"
+
+            out.write(f"{name:<24} {timing.duration_ns / 1_000_000:>9.3f}\n")
+            enclosing.append(timing)
+
+        out.write(f"{'total':<24} {self.total_ns / 1_000_000:>9.3f}\n")
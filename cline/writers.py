@@ -0,0 +1,77 @@
+"""
+`cline.writers` makes output writers for CLIs and tasks.
+"""
+
+from codecs import getincrementaldecoder
+from io import BufferedWriter, RawIOBase, TextIOWrapper, UnsupportedOperation
+from typing import IO, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+
+class _TextRaw(RawIOBase):
+    def __init__(self, out: IO[str], encoding: str) -> None:
+        self._decoder = getincrementaldecoder(encoding)(errors="replace")
+        self._out = out
+
+    def flush(self) -> None:
+        self._out.flush()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, buffer: "ReadableBuffer") -> int:
+        data = bytes(buffer)
+        self._out.write(self._decoder.decode(data))
+        return len(data)
+
+
+def make_binary_writer(out: IO[str]) -> IO[bytes]:
+    """
+    Makes a binary writer that writes to the same destination as the text
+    writer `out`.
+
+    If `out` is backed by a binary buffer (like `sys.stdout`) then the buffer
+    is returned. Otherwise, bytes are decoded and written to `out` as text.
+
+    Note that text and binary writers buffer independently, so flush `out`
+    before switching from writing text to writing bytes.
+    """
+
+    buffer = getattr(out, "buffer", None)
+    if buffer is not None:
+        return cast(IO[bytes], buffer)
+
+    encoding = getattr(out, "encoding", None) or "utf-8"
+    return BufferedWriter(_TextRaw(out, encoding))
+
+
+def make_buffered_writer(out: IO[str], buffer_size: int) -> IO[str]:
+    """
+    Makes a text writer that buffers up to `buffer_size` bytes before writing
+    to the same file as `out`, to reduce the cost of writing many small pieces
+    of text.
+
+    Returns `out` if it isn't backed by a file.
+
+    Output is written only when the buffer fills or the writer is flushed, so
+    flush explicitly whenever output must be seen immediately.
+    """
+
+    try:
+        fileno = out.fileno()
+    except (AttributeError, OSError, UnsupportedOperation):
+        return out
+
+    # Anything already written to `out` must be written before anything we
+    # write to our own buffer:
+    out.flush()
+
+    binary = open(fileno, "wb", buffering=buffer_size, closefd=False)
+
+    return TextIOWrapper(
+        binary,
+        encoding=getattr(out, "encoding", None) or "utf-8",
+        errors=getattr(out, "errors", None),
+    )
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 
-import examples.example03.tasks
+from cline import LazyTask, Selector
 from cline.cli import ArgumentParserCli, RegisteredTasks
 
 
@@ -15,7 +15,15 @@ class ExampleCli(ArgumentParserCli):
         return parser
 
     def register_tasks(self) -> RegisteredTasks:
+        # Registering tasks by their import paths means that only the modules of
+        # selected tasks get imported:
         return [
-            examples.example03.tasks.SubtractTask,
-            examples.example03.tasks.SumTask,
+            LazyTask(
+                "examples.example03.tasks.subtract:SubtractTask",
+                selector=Selector(flags=["sub"]),
+            ),
+            LazyTask(
+                "examples.example03.tasks.sum:SumTask",
+                selector=Selector(flags=["sum"]),
+            ),
         ]
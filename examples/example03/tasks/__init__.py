@@ -1,7 +0,0 @@
-from examples.example03.tasks.subtract import SubtractTask
-from examples.example03.tasks.sum import SumTask
-
-__all__ = [
-    "SubtractTask",
-    "SumTask",
-]
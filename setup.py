@@ -41,12 +41,18 @@ setup(
     name="cline",
     packages=[
         "cline",
+        "cline.bench",
         "cline.cli",
+        "cline.completion",
+        "cline.daemon",
         "cline.tasks",
     ],
     package_data={
         "cline": ["py.typed"],
+        "cline.bench": ["py.typed"],
         "cline.cli": ["py.typed"],
+        "cline.completion": ["py.typed"],
+        "cline.daemon": ["py.typed"],
         "cline.tasks": ["py.typed"],
     },
     python_requires=">=3.8",
@@ -0,0 +1,117 @@
+from contextlib import redirect_stderr
+from io import StringIO
+from json import loads
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from mock import patch
+from pytest import mark, raises
+
+from cline.bench.cli import BenchCli
+from cline.bench.suite import BenchmarkResult
+
+
+def invoke(args: List[str], expect_exit_code: int = 0) -> str:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    BenchCli.invoke_and_exit(args=args, callback=done, init_logging=False, out=out)
+    assert result["exit_code"] == expect_exit_code
+    return out.getvalue()
+
+
+def test_json() -> None:
+    output = invoke(["--group", "getters", "--json", "--repeat", "1"])
+    results = loads(output)["results"]
+    assert [r["name"] for r in results] == [
+        "getters/get_bool",
+        "getters/get_integer",
+        "getters/get_list",
+        "getters/get_raw",
+        "getters/get_string",
+    ]
+    assert all(r["rounds"] == 1 for r in results)
+
+
+def fake_benchmark_parsers(sizes: List[int]) -> List[Dict[str, float]]:
+    return [{"arguments": size, "argparse": 0.002, "spec": 0.001} for size in sizes]
+
+
+def test_parsers() -> None:
+    with patch("cline.bench.tasks.benchmark_parsers", fake_benchmark_parsers):
+        output = invoke(["--parsers"])
+
+    assert output == (
+        " arguments     argparse         spec  speed-up\n"
+        + "        10      2.000ms      1.000ms      2.0x\n"
+        + "     1,000      2.000ms      1.000ms      2.0x\n"
+        + "    10,000      2.000ms      1.000ms      2.0x\n"
+    )
+
+
+def test_parsers__sizes() -> None:
+    with patch("cline.bench.tasks.benchmark_parsers", fake_benchmark_parsers):
+        output = invoke(["--parsers", "--size", "5", "--size", "7"])
+
+    assert output == (
+        " arguments     argparse         spec  speed-up\n"
+        + "         5      2.000ms      1.000ms      2.0x\n"
+        + "         7      2.000ms      1.000ms      2.0x\n"
+    )
+
+
+@mark.parametrize("repeat", ["0", "-1", "one"])
+def test_repeat__invalid(repeat: str) -> None:
+    out = StringIO()
+    with redirect_stderr(out), raises(SystemExit) as ex:
+        BenchCli(args=["--repeat", repeat]).invoke()
+
+    assert ex.value.code == 2
+    assert f'--repeat: "{repeat}" is not a whole number of at least 1' in out.getvalue()
+
+
+def test_table() -> None:
+    output = invoke(["--group", "getters", "--repeat", "1"])
+    assert output.startswith("benchmark ")
+    assert "getters/get_string" in output
+
+
+def test_compare(tmp_path: Path) -> None:
+    baseline = str(tmp_path / "baseline.json")
+    fast = [BenchmarkResult("dispatch", "dispatch/probe/1", [1.0])]
+    slow = [BenchmarkResult("dispatch", "dispatch/probe/1", [1.5])]
+    results = [fast, slow, slow]
+    groups: List[Sequence[str]] = []
+
+    def run_suite(**kwargs: Any) -> List[BenchmarkResult]:
+        groups.append(kwargs["groups"])
+        return results.pop(0)
+
+    with patch("cline.bench.tasks.run_suite", run_suite):
+        # Saves the baseline since it doesn't exist:
+        output = invoke(["compare", "--baseline", baseline])
+        assert output.endswith(f"Saved baseline to {baseline}\n")
+        assert loads(Path(baseline).read_text())["results"][0]["fastest"] == 1.0
+
+        # Within the threshold:
+        output = invoke(["compare", "--baseline", baseline, "--threshold", "60"])
+        assert "regressed" not in output
+
+        # Beyond the threshold:
+        output = invoke(["compare", "--baseline", baseline], expect_exit_code=1)
+
+    assert output == (
+        "benchmark           baseline     current   change\n"
+        + "dispatch/probe/1      1.000s      1.500s   +50.0% regressed\n"
+        + "🔥 1 of 1 benchmarks regressed by more than 10%\n"
+    )
+
+    assert groups == [("dispatch", "imports", "make_cli_args")] * 3
+
+
+def test_compare__invalid_threshold() -> None:
+    output = invoke(["compare", "--threshold", "foo"], expect_exit_code=1)
+    assert output.startswith("usage: ")
@@ -0,0 +1,87 @@
+from io import StringIO
+from typing import Optional
+
+from pytest import mark, raises
+
+from cline.bench.compare import (
+    Comparison,
+    compare_results,
+    read_baseline,
+    write_comparisons,
+)
+from cline.bench.suite import BenchmarkResult, dump_results
+
+
+@mark.parametrize(
+    "baseline, current, expect",
+    [
+        (None, 1.0, None),
+        (0.0, 1.0, None),
+        (1.0, None, None),
+        (1.0, 1.5, 0.5),
+        (2.0, 1.0, -0.5),
+    ],
+)
+def test_change(
+    baseline: Optional[float],
+    current: Optional[float],
+    expect: Optional[float],
+) -> None:
+    comparison = Comparison(baseline=baseline, current=current, name="foo")
+    assert comparison.change == expect
+
+
+@mark.parametrize(
+    "current, expect",
+    [
+        (1.0, False),
+        (1.05, False),
+        (1.2, True),
+    ],
+)
+def test_regressed(current: float, expect: bool) -> None:
+    comparison = Comparison(baseline=1.0, current=current, name="foo")
+    assert comparison.regressed(0.1) == expect
+
+
+def test_compare_results() -> None:
+    baseline = {"foo/1": 1.0, "foo/3": 3.0}
+    current = [
+        BenchmarkResult("foo", "foo/1", [1.5, 2.0]),
+        BenchmarkResult("foo", "foo/2", [2.0]),
+    ]
+
+    assert compare_results(baseline, current) == [
+        Comparison(baseline=1.0, current=1.5, name="foo/1"),
+        Comparison(baseline=None, current=2.0, name="foo/2"),
+    ]
+
+
+def test_read_baseline() -> None:
+    results = [BenchmarkResult("foo", "foo/1", [3.0, 1.0, 2.0])]
+    reader = StringIO(dump_results(results))
+    assert read_baseline(reader) == {"foo/1": 1.0}
+
+
+@mark.parametrize("content", ["{}", '{"results": [{}]}', "[]", "nope"])
+def test_read_baseline__invalid(content: str) -> None:
+    with raises(ValueError):
+        read_baseline(StringIO(content))
+
+
+def test_write_comparisons() -> None:
+    comparisons = [
+        Comparison(baseline=0.001, current=0.0011, name="foo/1"),
+        Comparison(baseline=0.001, current=0.002, name="foo/2"),
+        Comparison(baseline=None, current=0.002, name="foo/new"),
+    ]
+
+    out = StringIO()
+    write_comparisons(comparisons, 0.2, out)
+
+    assert out.getvalue() == (
+        "benchmark    baseline     current   change\n"
+        + "foo/1         1.000ms     1.100ms   +10.0%\n"
+        + "foo/2         1.000ms     2.000ms  +100.0% regressed\n"
+        + "foo/new             -     2.000ms      new\n"
+    )
@@ -0,0 +1,47 @@
+from pytest import mark
+
+from cline.bench.parsers import (
+    benchmark_parsers,
+    make_args,
+    make_argument_parser,
+    make_argument_spec,
+    sample,
+)
+
+
+@mark.parametrize("count", [0, 1, 3, 10, 11])
+def test_make_args(count: int) -> None:
+    assert len(make_args(count)) == count
+
+
+def test_parsers_agree() -> None:
+    args = make_args(20)
+    known, _ = make_argument_parser().parse_known_args(args)
+    cli_args = make_argument_spec().parse(args)
+
+    for name in ["name", "opt_1", "tag", "verbose"]:
+        assert cli_args.get_raw(name) == getattr(known, name)
+
+
+def test_benchmark_parsers() -> None:
+    results = benchmark_parsers([10], repeat=1)
+    assert len(results) == 1
+    assert results[0]["arguments"] == 10
+    assert results[0]["argparse"] > 0
+    assert results[0]["spec"] > 0
+
+
+def test_sample() -> None:
+    calls = {"count": 0}
+
+    def func() -> None:
+        calls["count"] += 1
+
+    samples = sample(func, repeat=3, number=10)
+    assert len(samples) == 3
+    assert calls["count"] == 30
+
+
+def test_sample__budget() -> None:
+    samples = sample(lambda: None, repeat=100, budget=0)
+    assert len(samples) == 1
@@ -0,0 +1,135 @@
+from io import StringIO
+from json import loads
+from typing import List
+
+from pytest import mark
+
+from cline.bench.suite import (
+    BenchmarkResult,
+    benchmark_dispatch,
+    benchmark_examples,
+    benchmark_getters,
+    benchmark_imports,
+    benchmark_make_cli_args,
+    dump_results,
+    format_seconds,
+    make_dispatch_cli,
+    make_numbered_task,
+    run_suite,
+    write_results,
+)
+from cline.cli import RegisteredTasks
+from cline.tasks import HelpTask
+
+
+def test_benchmark_dispatch() -> None:
+    results = benchmark_dispatch([1, 3], repeat=1)
+    assert [r.name for r in results] == [
+        "dispatch/probe/1",
+        "dispatch/probe/3",
+        "dispatch/try/1",
+        "dispatch/try/3",
+        "dispatch/selector/1",
+        "dispatch/selector/3",
+        "dispatch/command/1",
+        "dispatch/command/3",
+    ]
+
+
+def test_benchmark_examples() -> None:
+    results = benchmark_examples(repeat=1)
+    assert [r.name for r in results] == [
+        "examples/example01",
+        "examples/example02",
+        "examples/example03",
+    ]
+
+
+def test_benchmark_getters() -> None:
+    results = benchmark_getters(repeat=1)
+    assert len(results) == 5
+    assert all(r.group == "getters" for r in results)
+
+
+def test_benchmark_imports() -> None:
+    results = benchmark_imports(["cline"], repeat=2)
+    assert len(results) == 1
+    assert results[0].name == "imports/cline"
+    assert len(results[0].samples) == 2
+    assert results[0].fastest > 0
+
+
+def test_benchmark_make_cli_args() -> None:
+    results = benchmark_make_cli_args([10], repeat=1)
+    assert [r.name for r in results] == ["make_cli_args/10"]
+
+
+def test_dump_results() -> None:
+    results = [BenchmarkResult("foo", "foo/1", [3.0, 1.0, 2.0])]
+    dumped = loads(dump_results(results, "1.2.3"))
+    assert dumped["cline"] == "1.2.3"
+    assert dumped["results"] == [
+        {
+            "fastest": 1.0,
+            "group": "foo",
+            "median": 2.0,
+            "name": "foo/1",
+            "rounds": 3,
+            "stdev": 1.0,
+        }
+    ]
+
+
+@mark.parametrize(
+    "seconds, expect",
+    [
+        (2.5, "2.500s"),
+        (0.0025, "2.500ms"),
+        (0.0000025, "2.500µs"),
+        (0.0000000025, "2.500ns"),
+    ],
+)
+def test_format_seconds(seconds: float, expect: str) -> None:
+    assert format_seconds(seconds) == expect
+
+
+@mark.parametrize(
+    "mode, args",
+    [
+        ("command", ["run", "1"]),
+        ("probe", ["1"]),
+        ("selector", ["1"]),
+        ("try", ["1"]),
+    ],
+)
+def test_make_numbered_task(mode: str, args: List[str]) -> None:
+    tasks: RegisteredTasks = [make_numbered_task(i, mode) for i in range(3)]
+    cli = make_dispatch_cli(tasks, args)
+    assert type(cli.task).__name__ == "NumberedTask1"
+    assert cli.task.invoke() == 0
+
+
+def test_make_numbered_task__no_match() -> None:
+    cli = make_dispatch_cli([make_numbered_task(0)], ["1"])
+    assert isinstance(cli.task, HelpTask)
+
+
+def test_run_suite() -> None:
+    results = run_suite(groups=["getters"], repeat=1)
+    assert {r.group for r in results} == {"getters"}
+
+
+def test_write_results() -> None:
+    results = [
+        BenchmarkResult("foo", "foo/1", [0.001]),
+        BenchmarkResult("foo", "foo/long-name", [0.002, 0.004]),
+    ]
+
+    out = StringIO()
+    write_results(results, out)
+
+    assert out.getvalue() == (
+        "benchmark         fastest      median rounds\n"
+        + "foo/1             1.000ms     1.000ms      1\n"
+        + "foo/long-name     2.000ms     3.000ms      2\n"
+    )
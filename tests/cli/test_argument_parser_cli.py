@@ -1,6 +1,11 @@
-from argparse import ArgumentParser
+from argparse import SUPPRESS, ArgumentParser
 from io import StringIO
+from json import loads
+from pathlib import Path
 
+from pytest import MonkeyPatch
+
+from cline import CommandLineArguments, Task
 from cline.cli import ArgumentParserCli, RegisteredTasks
 
 
@@ -14,8 +19,218 @@ class FooCli(ArgumentParserCli):
         return []
 
 
+class CachedCli(FooCli):
+    cache_parser = True
+    made = 0
+
+    def make_parser(self) -> ArgumentParser:
+        CachedCli.made += 1
+        return super().make_parser()
+
+
+class HelpCachedCli(FooCli):
+    cache_help = True
+    made = 0
+
+    def make_parser(self) -> ArgumentParser:
+        HelpCachedCli.made += 1
+        return super().make_parser()
+
+
+class ModeTask(Task[str]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> str:
+        return args.get_string("mode")
+
+    def invoke(self) -> int:
+        self.out.write(f"mode {self.args}\n")
+        return 0
+
+
+class ModeCli(ArgumentParserCli):
+    def make_parser(self) -> ArgumentParser:
+        parser = ArgumentParser(prog="mode")
+        parser.add_argument("--mode", choices=["a", "b"])
+        return parser
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [ModeTask]
+
+
+class ModeVersionCli(ModeCli):
+    shortcut_flags = ("--version",)
+
+    def make_parser(self) -> ArgumentParser:
+        parser = super().make_parser()
+        parser.add_argument("--version", action="store_true")
+        return parser
+
+
+class UncacheableCli(CachedCli):
+    def make_parser(self) -> ArgumentParser:
+        parser = ArgumentParser()
+        parser.add_argument("foo", type=lambda s: s)
+        return parser
+
+
+def test_invoke__version_defined() -> None:
+    out = StringIO()
+    cli = ModeVersionCli(app_version="1.2.3", args=["--version"], out=out)
+    assert cli.invoke() == 0
+    assert out.getvalue() == "1.2.3\n"
+    assert cli._parser is None
+
+
+def test_invoke__version_undefined() -> None:
+    out = StringIO()
+    cli = ModeCli(app_version="1.2.3", args=["--version"], out=out)
+    assert cli.invoke() == 1
+    assert out.getvalue().startswith("usage: mode [-h]")
+
+
+def test_invoke_batch__usage_error() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    batch = StringIO("--mode a\n--mode zzz\n--mode b --help\n--mode b\n")
+    out = StringIO()
+
+    ModeCli.invoke_batch(batch=batch, callback=done, out=out)
+
+    results = [loads(line) for line in out.getvalue().splitlines()]
+    assert [r["exit_code"] for r in results] == [0, 2, 0, 0]
+    assert results[0]["output"] == "mode a\n"
+    assert "invalid choice: 'zzz'" in results[1]["output"]
+    assert results[2]["output"].startswith("usage: mode [-h]")
+    assert results[3]["output"] == "mode b\n"
+    assert result["exit_code"] == 2
+
+
+def test_invoke_many__usage_error() -> None:
+    arg_lists = [["--mode", "a"], ["--mode", "zzz"], ["--mode", "b"]]
+    results = list(ModeCli.invoke_many(arg_lists, workers=2))
+
+    assert [result.exit_code for _, result in results] == [0, 2, 0]
+    assert "invalid choice: 'zzz'" in results[1][1].output
+
+
+def test_list_options() -> None:
+    class OptionsCli(FooCli):
+        def make_parser(self) -> ArgumentParser:
+            parser = super().make_parser()
+            parser.add_argument("-n", "--name", help="name")
+            parser.add_argument("--hidden", help=SUPPRESS)
+            parser.add_argument("--quiet", action="store_true")
+            return parser
+
+    cli = OptionsCli(args=[], out=StringIO())
+    assert cli.list_options() == [
+        ("-h", "show this help message and exit"),
+        ("--help", "show this help message and exit"),
+        ("-n", "name"),
+        ("--name", "name"),
+        ("--quiet", ""),
+    ]
+
+
+def test_parser__cached(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(CachedCli, "made", 0)
+
+    assert CachedCli(args=["a"]).cli_args.get_string("foo") == "a"
+    assert CachedCli(args=["b"]).cli_args.get_string("foo") == "b"
+    assert CachedCli.made == 1
+
+
+def test_parser__cache_invalidated(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(CachedCli, "made", 0)
+
+    assert CachedCli(app_version="1.0.0").parser
+    assert CachedCli(app_version="1.0.1").parser
+    assert CachedCli.made == 2
+
+
+def test_parser__not_cacheable(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    assert UncacheableCli(args=["a"]).cli_args.get_string("foo") == "a"
+    assert UncacheableCli(args=["b"]).cli_args.get_string("foo") == "b"
+
+
+def test_parser__not_cached(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    assert FooCli().parser
+    assert not list(tmp_path.iterdir())
+
+
 def test_write_help() -> None:
     out = StringIO()
     cli = FooCli(out=out)
     cli.write_help()
     assert "foo         bar" in out.getvalue()
+
+
+def test_write_help__cached(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+
+    fresh = StringIO()
+    CachedCli(out=fresh).write_help()
+
+    cached = StringIO()
+    CachedCli(out=cached).write_help()
+
+    assert cached.getvalue() == fresh.getvalue()
+
+
+def test_write_help__help_cached(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(HelpCachedCli, "made", 0)
+
+    fresh = StringIO()
+    HelpCachedCli(out=fresh).write_help()
+
+    cached = StringIO()
+    HelpCachedCli(out=cached).write_help()
+
+    uncached = StringIO()
+    FooCli(out=uncached).write_help()
+
+    assert cached.getvalue() == fresh.getvalue() == uncached.getvalue()
+    assert HelpCachedCli.made == 1
+
+
+def test_write_help__help_cache_invalidated(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(HelpCachedCli, "made", 0)
+
+    HelpCachedCli(app_version="1.0.0", out=StringIO()).write_help()
+    HelpCachedCli(app_version="1.0.1", out=StringIO()).write_help()
+    assert HelpCachedCli.made == 2
+
+    monkeypatch.setenv("COLUMNS", "40")
+    narrow = StringIO()
+    HelpCachedCli(app_version="1.0.1", out=narrow).write_help()
+    assert HelpCachedCli.made == 3
+
+    uncached = StringIO()
+    FooCli(out=uncached).write_help()
+    assert narrow.getvalue() == uncached.getvalue()
+
+
+def test_write_help__help_cached_per_width(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(HelpCachedCli, "made", 0)
+
+    for columns in ["40", "80", "40", "80"]:
+        monkeypatch.setenv("COLUMNS", columns)
+        HelpCachedCli(out=StringIO()).write_help()
+
+    assert HelpCachedCli.made == 2
@@ -0,0 +1,52 @@
+from typing import List, Optional, Union
+
+from pytest import mark, raises
+
+from cline.cli.batch import InvocationResult, _exit_code, parse_batch_line
+
+
+@mark.parametrize(
+    "code, expect",
+    [
+        (None, 0),
+        (0, 0),
+        (2, 2),
+        ("error", 1),
+        ("", 0),
+    ],
+)
+def test_exit_code(code: Optional[Union[int, str]], expect: int) -> None:
+    assert _exit_code(SystemExit(code)) == expect
+
+
+@mark.parametrize(
+    "line, format, expect",
+    [
+        ('--foo "bar woo"\n', "shell", ["--foo", "bar woo"]),
+        ('["--foo", "bar woo"]\n', "json", ["--foo", "bar woo"]),
+        ("[]", "json", []),
+    ],
+)
+def test_parse_batch_line(line: str, format: str, expect: List[str]) -> None:
+    assert parse_batch_line(line, format) == expect
+
+
+@mark.parametrize(
+    "line, format, expect",
+    [
+        ('--foo "bar', "shell", "No closing quotation"),
+        ('{"foo": "bar"}', "json", "expected a JSON list of strings"),
+        ("[1]", "json", "expected a JSON list of strings"),
+        ("[", "json", "Expecting value: line 1 column 2 (char 1)"),
+        ("--foo", "xml", "\"xml\" is not a batch format ('json', 'shell')"),
+    ],
+)
+def test_parse_batch_line__invalid(line: str, format: str, expect: str) -> None:
+    with raises(ValueError) as ex:
+        parse_batch_line(line, format)
+    assert str(ex.value) == expect
+
+
+def test_to_json() -> None:
+    result = InvocationResult(args=["--foo"], exit_code=0, output="🔥\n")
+    assert result.to_json() == '{"args": ["--foo"], "exit_code": 0, "output": "🔥\\n"}'
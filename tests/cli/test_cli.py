@@ -1,12 +1,148 @@
-from io import StringIO
+from asyncio import (
+    AbstractEventLoop,
+    DefaultEventLoopPolicy,
+    get_event_loop_policy,
+    run,
+    sleep,
+)
+from io import BytesIO, StringIO
 from logging import NOTSET, WARNING, getLogger
-from typing import List
+from os import getpid, kill
+from pathlib import Path
+from signal import SIG_DFL, SIGTERM, getsignal
+from time import sleep as sleep_sync
+from typing import IO, List, Optional, Union
 
 from mock import patch
+from pytest import MonkeyPatch, mark
 
-from cline import CommandLineArguments
+from cline import CancellationToken, CommandLineArguments
 from cline.cli import Cli, RegisteredTasks
-from cline.tasks import HelpTask, Task, VersionTask
+from cline.tasks import (
+    NO_MATCH,
+    AsyncTask,
+    HelpTask,
+    LazyTask,
+    NoMatch,
+    Selector,
+    Task,
+    VersionTask,
+)
+from cline.timings import Timings
+
+
+class AsyncValueTask(AsyncTask[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("async_value")
+        return True
+
+    async def ainvoke(self) -> int:
+        await sleep(0)
+        self.out.write("async\n")
+        return 7
+
+
+class AsyncValueErrorTask(AsyncTask[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("async_value_error")
+        return True
+
+    async def ainvoke(self) -> int:
+        raise ValueError("this is an async value error")
+
+
+class BinaryTask(Task[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("binary")
+        return True
+
+    def invoke(self) -> int:
+        self.out_bytes.write(b"binary\n")
+        return 0
+
+
+class CooperativeTask(Task[bool]):
+    cancel_cooperatively = True
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("cooperative")
+        return True
+
+    def invoke(self) -> int:
+        while not self.cancellation.wait(0.01):
+            pass
+        self.out.write("cleaned up\n")
+        self.cancellation.check()
+        return 0
+
+
+class ExtractTask(Task[int]):
+    selector = Selector(flags=["extract"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        values = args.extract({"count": int})
+        return int(values["count"])
+
+    def invoke(self) -> int:
+        self.out.write(f"{self.args}\n")
+        return 0
+
+
+class LazyExtractTask(Task[int]):
+    # Selected by its lazy registration rather than by itself:
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        values = args.extract({"count": int})
+        return int(values["count"])
+
+    def invoke(self) -> int:
+        return 0
+
+
+class LegacyInitTask(Task[bool]):
+    def __init__(self, args: bool, out: IO[str]) -> None:
+        super().__init__(args, out)
+        self.greeting = "legacy\n"
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("legacy")
+        return True
+
+    def invoke(self) -> int:
+        self.out.write(self.greeting)
+        self.cancellation.check()
+        return 0
+
+
+class UnselectedExtractTask(Task[int]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        values = args.extract({"unselected_count": int})
+        return int(values["unselected_count"])
+
+    def invoke(self) -> int:
+        return 0
+
+
+class TryTask(Task[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("try")
+        return True
+
+    @classmethod
+    def try_make_args(cls, args: CommandLineArguments) -> Union[bool, NoMatch]:
+        return True if args.try_get_bool("try") else NO_MATCH
+
+    def invoke(self) -> int:
+        self.out.write("tried\n")
+        return 0
 
 
 class RaiseKeyboardInterruptTask(Task[bool]):
@@ -16,6 +152,7 @@ class RaiseKeyboardInterruptTask(Task[bool]):
         return True
 
     def invoke(self) -> int:
+        self.out.write("interrupted\n")
         raise KeyboardInterrupt()
 
 
@@ -29,6 +166,56 @@ class RaiseValueErrorTask(Task[bool]):
         raise ValueError("this is a value error")
 
 
+class SleepTask(Task[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("sleep")
+        return True
+
+    def invoke(self) -> int:
+        self.out.write("sleeping\n")
+        sleep_sync(5)
+        return 0
+
+
+class TerminateTask(Task[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("terminate")
+        return True
+
+    def invoke(self) -> int:
+        self.out.write("terminating\n")
+        kill(getpid(), SIGTERM)
+        sleep_sync(5)
+        return 0
+
+
+class TimeoutTask(Task[bool]):
+    timeout = 0.05
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("timeout")
+        return True
+
+    def invoke(self) -> int:
+        sleep_sync(5)
+        return 0
+
+
+class SelectedTask(Task[bool]):
+    selector = Selector(flags=["selected"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("selected")
+        return True
+
+    def invoke(self) -> int:
+        return 0
+
+
 class FooParser:
     pass
 
@@ -36,15 +223,35 @@ class FooParser:
 class FooCli(Cli[FooParser]):
     def register_tasks(self) -> RegisteredTasks:
         return [
+            AsyncValueTask,
+            AsyncValueErrorTask,
+            BinaryTask,
+            ExtractTask,
+            UnselectedExtractTask,
             RaiseKeyboardInterruptTask,
             RaiseValueErrorTask,
+            SelectedTask,
+            TryTask,
         ]
 
     def make_cli_args(self, args: List[str]) -> CommandLineArguments:
         return CommandLineArguments(
             {
+                "async_value": "--async-value" in args,
+                "async_value_error": "--async-value-error" in args,
+                "binary": "--binary" in args,
+                "cooperative": "--cooperative" in args,
+                "count": args[args.index("--count") + 1] if "--count" in args else None,
+                "extract": "--extract" in args,
                 "keyboard_interrupt": "--keyboard-interrupt" in args,
+                "lazy_extract": "--lazy-extract" in args,
+                "legacy": "--legacy" in args,
                 "help": "--help" in args,
+                "selected": "--selected" in args,
+                "sleep": "--sleep" in args,
+                "terminate": "--terminate" in args,
+                "timeout": "--timeout" in args,
+                "try": "--try" in args,
                 "value_error": "--value-error" in args,
                 "version": "--version" in args,
             }
@@ -57,16 +264,73 @@ class FooCli(Cli[FooParser]):
         self.out.write("help\n")
 
 
+class ShortcutCli(FooCli):
+    shortcut_flags = ("-h", "--help", "--version")
+
+
+class CancelCli(FooCli):
+    def register_tasks(self) -> RegisteredTasks:
+        return [CooperativeTask, LegacyInitTask, SleepTask, TerminateTask, TimeoutTask]
+
+
+class RecordingEventLoopPolicy(DefaultEventLoopPolicy):
+    def __init__(self) -> None:
+        super().__init__()
+        self.loops = 0
+
+    def new_event_loop(self) -> AbstractEventLoop:
+        self.loops += 1
+        return super().new_event_loop()
+
+
+def test_ainvoke() -> None:
+    out = StringIO()
+    cli = FooCli(args=["--async-value"], out=out)
+    assert run(cli.ainvoke()) == 7
+    assert out.getvalue() == "async\n"
+
+
+def test_ainvoke__sync_task() -> None:
+    cli = FooCli(args=["--selected"])
+    assert run(cli.ainvoke()) == 0
+
+
+def test_ainvoke__value_error() -> None:
+    out = StringIO()
+    cli = FooCli(args=["--async-value-error"], out=out)
+    assert run(cli.ainvoke()) == 101
+    assert out.getvalue() == "🔥 this is an async value error\n"
+
+
 def test_app_version() -> None:
     cli = FooCli(app_version="1.0.1")
     assert cli.app_version == "1.0.1"
 
 
+def test_init__positional() -> None:
+    out = StringIO()
+    cli = FooCli("1.0.1", ["--version"], out)
+    assert cli.invoke() == 0
+    assert out.getvalue() == "1.0.1\n"
+
+
 def test_parser__make_once() -> None:
     cli = FooCli()
     assert cli.parser is cli.parser
 
 
+def test_task__selected() -> None:
+    cli = FooCli(args=["--selected"])
+    assert isinstance(cli.task, SelectedTask)
+
+
+def test_task__skips_unselected() -> None:
+    cli = FooCli(args=["--value-error"])
+    with patch.object(SelectedTask, "make_args") as make_args:
+        assert isinstance(cli.task, RaiseValueErrorTask)
+    make_args.assert_not_called()
+
+
 def test_task__falls_back_to_version() -> None:
     cli = FooCli(app_version="1.0.0", args=["--version"])
     assert isinstance(cli.task, VersionTask)
@@ -82,6 +346,39 @@ def test_task__falls_back_to_help_when_no_version_flag() -> None:
     assert isinstance(cli.task, HelpTask)
 
 
+@mark.parametrize("flag", ["-h", "--help"])
+def test_task__shortcut_help(flag: str) -> None:
+    out = StringIO()
+    cli = ShortcutCli(args=[flag], out=out)
+    with patch.object(ShortcutCli, "register_tasks") as register_tasks:
+        with patch.object(ShortcutCli, "make_cli_args") as make_cli_args:
+            assert cli.invoke() == 0
+    register_tasks.assert_not_called()
+    make_cli_args.assert_not_called()
+    assert out.getvalue() == "help\n"
+
+
+def test_task__shortcut_version() -> None:
+    out = StringIO()
+    cli = ShortcutCli(app_version="1.0.0", args=["--version"], out=out)
+    with patch.object(ShortcutCli, "register_tasks") as register_tasks:
+        assert cli.invoke() == 0
+    register_tasks.assert_not_called()
+    assert out.getvalue() == "1.0.0\n"
+
+
+def test_task__shortcut_not_declared() -> None:
+    cli = FooCli(app_version="1.0.0", args=["--version"])
+    with patch.object(VersionTask, "make_args") as make_args:
+        assert isinstance(cli.task, VersionTask)
+    make_args.assert_called_once()
+
+
+def test_task__shortcut_not_lone() -> None:
+    cli = ShortcutCli(args=["--help", "--selected"])
+    assert isinstance(cli.task, SelectedTask)
+
+
 def test_invoke_and_exit__with_init_logging() -> None:
     result = {"exit_code": -1}
 
@@ -214,3 +511,529 @@ def test_invoke_and_exit__version() -> None:
     )
     assert out.getvalue() == "1.1.1\n"
     assert result["exit_code"] == 0
+
+
+def test_invoke_and_exit__positional() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit("1.1.1", ["--version"], done, False, None, out)
+    assert out.getvalue() == "1.1.1\n"
+    assert result["exit_code"] == 0
+
+
+def test_invoke_batch() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    batch = StringIO("--help\n\n--selected\n--value-error\n")
+    out = StringIO()
+
+    with patch.object(FooCli, "make_parser", return_value=FooParser()) as make_parser:
+        FooCli.invoke_batch(batch=batch, callback=done, out=out)
+
+    make_parser.assert_called_once()
+    assert out.getvalue() == (
+        '{"args": ["--help"], "exit_code": 0, "output": "help\\n"}\n'
+        '{"args": ["--selected"], "exit_code": 0, "output": ""}\n'
+        '{"args": ["--value-error"], "exit_code": 101, '
+        '"output": "🔥 this is a value error\\n"}\n'
+    )
+    assert result["exit_code"] == 101
+
+
+def test_invoke_batch__file(tmp_path: Path) -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    path = tmp_path / "batch.jsonl"
+    path.write_text('["--selected"]\n["--selected"\n')
+    out = StringIO()
+
+    FooCli.invoke_batch(batch=str(path), callback=done, format="json", out=out)
+
+    assert out.getvalue() == (
+        '{"args": ["--selected"], "exit_code": 0, "output": ""}\n'
+        '{"args": [], "exit_code": 101, "output": "🔥 line 2: Expecting \',\' '
+        'delimiter: line 2 column 1 (char 14)\\n"}\n'
+    )
+    assert result["exit_code"] == 101
+
+
+def test_invoke_batch__file_missing(tmp_path: Path) -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    path = tmp_path / "missing.txt"
+    out = StringIO()
+
+    FooCli.invoke_batch(batch=str(path), callback=done, out=out)
+
+    assert out.getvalue() == f"🔥 [Errno 2] No such file or directory: '{path}'\n"
+    assert result["exit_code"] == 101
+
+
+def test_invoke_batch__keyboard_interrupt() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    batch = StringIO("--keyboard-interrupt\n--selected\n")
+    out = StringIO()
+
+    FooCli.invoke_batch(batch=batch, callback=done, out=out)
+
+    assert out.getvalue() == ""
+    assert result["exit_code"] == 100
+
+
+def test_with_args() -> None:
+    cli = FooCli(args=["--selected"])
+    cli.warm()
+
+    other = cli.with_args([])
+
+    assert other.parser is cli.parser
+    assert other.dispatch is cli.dispatch
+    assert other.out is cli.out
+    assert isinstance(other.task, HelpTask)
+    assert isinstance(cli.task, SelectedTask)
+
+
+def test_invoke_and_exit__async() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit(args=["--async-value"], callback=done, out=out)
+    assert out.getvalue() == "async\n"
+    assert result["exit_code"] == 7
+
+
+def test_invoke_and_exit__async_value_error() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit(args=["--async-value-error"], callback=done, out=out)
+    assert out.getvalue() == "🔥 this is an async value error\n"
+    assert result["exit_code"] == 101
+
+
+def test_invoke_and_exit__event_loop_policy() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    previous = get_event_loop_policy()
+    policy = RecordingEventLoopPolicy()
+
+    FooCli.invoke_and_exit(
+        args=["--async-value"],
+        callback=done,
+        event_loop_policy=policy,
+        out=StringIO(),
+    )
+
+    assert policy.loops == 1
+    assert get_event_loop_policy() is previous
+    assert result["exit_code"] == 7
+
+
+def test_invoke_many() -> None:
+    arg_lists = [["--selected"], ["--value-error"], ["--help"], ["--async-value"]]
+    results = list(FooCli.invoke_many(arg_lists, workers=2))
+
+    assert [index for index, _ in results] == [0, 1, 2, 3]
+    assert [result.args for _, result in results] == arg_lists
+    assert [result.exit_code for _, result in results] == [0, 101, 0, 7]
+    assert [result.output for _, result in results] == [
+        "",
+        "🔥 this is a value error\n",
+        "help\n",
+        "async\n",
+    ]
+
+
+def test_invoke_many__unordered() -> None:
+    arg_lists = [["--selected"], ["--value-error"], ["--keyboard-interrupt"]]
+    results = dict(FooCli.invoke_many(arg_lists, ordered=False, workers=2))
+
+    assert sorted(results) == [0, 1, 2]
+    assert results[0].exit_code == 0
+    assert results[1].exit_code == 101
+    assert results[2].exit_code == 100
+
+
+def test_invoke_and_exit__binary() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    out_bytes = BytesIO()
+
+    FooCli.invoke_and_exit(
+        args=["--binary"],
+        callback=done,
+        out=out,
+        out_bytes=out_bytes,
+    )
+
+    assert out.getvalue() == ""
+    assert out_bytes.getvalue() == b"binary\n"
+    assert result["exit_code"] == 0
+
+
+def test_invoke_and_exit__binary_to_text() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit(args=["--binary"], callback=done, out=out)
+    assert out.getvalue() == "binary\n"
+    assert result["exit_code"] == 0
+
+
+def test_invoke_and_exit__buffered_flushed_on_interrupt(tmp_path: Path) -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    path = tmp_path / "out.txt"
+
+    with open(path, "w", encoding="utf-8") as out:
+        FooCli.invoke_and_exit(
+            args=["--keyboard-interrupt"],
+            buffer_size=1024 * 1024,
+            callback=done,
+            out=out,
+        )
+
+        assert path.read_text() == "interrupted\n"
+
+    assert result["exit_code"] == 100
+
+
+def test_invoke_and_exit__buffered_flushed_on_error(tmp_path: Path) -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    path = tmp_path / "out.txt"
+
+    with open(path, "w", encoding="utf-8") as out:
+        FooCli.invoke_and_exit(
+            args=["--value-error"],
+            buffer_size=1024 * 1024,
+            callback=done,
+            out=out,
+        )
+
+        assert path.read_text() == "🔥 this is a value error\n"
+
+    assert result["exit_code"] == 101
+
+
+def test_invoke_and_exit__timeout(tmp_path: Path) -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    path = tmp_path / "out.txt"
+
+    with open(path, "w", encoding="utf-8") as out:
+        CancelCli.invoke_and_exit(
+            args=["--sleep"],
+            buffer_size=1024 * 1024,
+            callback=done,
+            out=out,
+            timeout=0.05,
+        )
+
+        assert path.read_text() == "sleeping\n🔥 timed out\n"
+
+    assert result["exit_code"] == 102
+
+
+def test_invoke_and_exit__task_timeout() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    CancelCli.invoke_and_exit(args=["--timeout"], callback=done, out=out)
+
+    assert out.getvalue() == "🔥 timed out\n"
+    assert result["exit_code"] == 102
+
+
+def test_invoke_and_exit__cooperative_timeout() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    CancelCli.invoke_and_exit(
+        args=["--cooperative"],
+        callback=done,
+        out=out,
+        timeout=0.05,
+    )
+
+    assert out.getvalue() == "cleaned up\n🔥 timed out\n"
+    assert result["exit_code"] == 102
+
+
+def test_invoke_and_exit__terminated() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    CancelCli.invoke_and_exit(args=["--terminate"], callback=done, out=out)
+
+    assert out.getvalue() == "terminating\n🔥 terminated\n"
+    assert result["exit_code"] == 103
+    assert getsignal(SIGTERM) is SIG_DFL
+
+
+def test_invoke__cancelled() -> None:
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    out = StringIO()
+    cli = CancelCli(args=["--cooperative"], cancellation=cancellation, out=out)
+
+    assert cli.invoke() == 103
+    assert out.getvalue() == "cleaned up\n🔥 cancelled\n"
+
+
+def test_invoke__legacy_init() -> None:
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    out = StringIO()
+    cli = CancelCli(args=["--legacy"], cancellation=cancellation, out=out)
+
+    task = cli.task
+    assert task.cancellation is cancellation
+    assert task.out_bytes is cli.out_bytes
+    assert cli.invoke() == 103
+    assert out.getvalue() == "legacy\n🔥 cancelled\n"
+
+
+def test_invoke_and_exit__timings() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    recorded: List[Timings] = []
+
+    FooCli.invoke_and_exit(
+        args=["--selected"],
+        callback=done,
+        init_logging=False,
+        out=StringIO(),
+        timings=recorded.append,
+    )
+
+    assert result["exit_code"] == 0
+    assert len(recorded) == 1
+
+    phases = [(p.phase, p.task) for p in recorded[0].phases]
+    assert phases == [
+        ("register", None),
+        ("parse", None),
+        ("dispatch", None),
+        ("probe", "AsyncValueTask"),
+        ("probe", "AsyncValueErrorTask"),
+        ("probe", "BinaryTask"),
+        ("probe", "UnselectedExtractTask"),
+        ("probe", "RaiseKeyboardInterruptTask"),
+        ("probe", "RaiseValueErrorTask"),
+        ("probe", "SelectedTask"),
+        ("construct", "SelectedTask"),
+        ("invoke", "SelectedTask"),
+    ]
+
+
+def test_invoke_and_exit__timings_env() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    with patch.dict("cline.cli.cli.environ", {"CLINE_TIMINGS": "1"}):
+        with patch("cline.cli.cli.stderr", new_callable=StringIO) as stderr:
+            FooCli.invoke_and_exit(
+                args=["--selected"],
+                callback=done,
+                init_logging=False,
+                out=StringIO(),
+            )
+
+    assert result["exit_code"] == 0
+    summary = stderr.getvalue()
+    assert summary.startswith("phase")
+    assert "  probe SelectedTask" in summary
+    assert "invoke SelectedTask" in summary
+    assert "\ntotal " in summary
+
+
+def test_invoke_and_exit__timings_env_disabled() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    with patch.dict("cline.cli.cli.environ", {"CLINE_TIMINGS": "0"}):
+        with patch("cline.cli.cli.stderr", new_callable=StringIO) as stderr:
+            FooCli.invoke_and_exit(
+                args=["--selected"],
+                callback=done,
+                init_logging=False,
+                out=StringIO(),
+            )
+
+    assert result["exit_code"] == 0
+    assert stderr.getvalue() == ""
+
+
+def test_task__memo_dispatch(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    class MemoCli(FooCli):
+        memo_dispatch = True
+
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+
+    def probed(args: List[str]) -> List[Optional[str]]:
+        timings = Timings()
+        cli = MemoCli(args=args, out=StringIO(), timings=timings)
+        assert isinstance(cli.task, SelectedTask)
+        return [p.task for p in timings.phases if p.phase == "probe"]
+
+    assert len(probed(["--selected"])) == 7
+    assert probed(["--selected"]) == ["SelectedTask"]
+
+
+def test_task__memo_dispatch_falls_back(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    class MemoCli(FooCli):
+        memo_dispatch = True
+
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+
+    cli = MemoCli(args=["--selected"], out=StringIO())
+    assert isinstance(cli.task, SelectedTask)
+
+    memo = cli.dispatch_memo
+    assert memo
+    shape = cli.cli_args.shape
+
+    # Remember a task that can't handle this shape:
+    memo.put((), shape, 0)
+    memo.save()
+
+    cli = MemoCli(args=["--selected"], out=StringIO())
+    assert isinstance(cli.task, SelectedTask)
+
+
+def test_task__memo_dispatch_disabled() -> None:
+    cli = FooCli(args=["--selected"], out=StringIO())
+    assert isinstance(cli.task, SelectedTask)
+    assert cli.dispatch_memo is None
+
+
+def test_timings__disabled() -> None:
+    cli = FooCli(args=["--selected"], out=StringIO())
+    assert cli.invoke() == 0
+    assert cli.timings is None
+
+
+def test_invoke__invalid_arguments() -> None:
+    out = StringIO()
+    cli = FooCli(args=["--extract", "--count", "foo"], out=out)
+    assert cli.invoke() == 1
+    assert out.getvalue() == "🔥 \"count\" must be an integer (not 'foo')\n"
+
+
+def test_invoke__invalid_arguments_selected() -> None:
+    out = StringIO()
+    cli = FooCli(args=["--extract", "--count", "3"], out=out)
+    assert cli.invoke() == 0
+    assert out.getvalue() == "3\n"
+
+
+def test_invoke__invalid_arguments_lazy_selected() -> None:
+    class LazyCli(FooCli):
+        def register_tasks(self) -> RegisteredTasks:
+            return [
+                LazyTask(
+                    "tests.cli.test_cli:LazyExtractTask",
+                    selector=Selector(flags=["lazy_extract"]),
+                ),
+            ]
+
+    out = StringIO()
+    cli = LazyCli(args=["--lazy-extract", "--count", "foo"], out=out)
+    assert cli.invoke() == 1
+    assert out.getvalue() == "🔥 \"count\" must be an integer (not 'foo')\n"
+
+
+def test_task__invalid_arguments_unselected() -> None:
+    # Tasks without selectors can't claim the arguments, so help is shown:
+    cli = FooCli(args=[], out=StringIO())
+    assert isinstance(cli.task, HelpTask)
+
+
+def test_make_task__try_make_args() -> None:
+    cli = FooCli(args=["--try"], out=StringIO())
+
+    with patch.object(TryTask, "make_args") as make_args:
+        assert isinstance(cli.make_task(TryTask), TryTask)
+
+    make_args.assert_not_called()
+
+
+def test_make_task__try_make_args_no_match() -> None:
+    cli = FooCli(args=[], out=StringIO())
+
+    with patch.object(TryTask, "make_args") as make_args:
+        assert cli.make_task(TryTask) is None
+
+    make_args.assert_not_called()
+
+
+def test_make_task__make_args() -> None:
+    cli = FooCli(args=["--selected"], out=StringIO())
+    make_args = SelectedTask.make_args
+
+    with patch.object(SelectedTask, "make_args", wraps=make_args) as wrapped:
+        assert isinstance(cli.make_task(SelectedTask), SelectedTask)
+
+    wrapped.assert_called_once()
@@ -0,0 +1,203 @@
+from typing import Any, Dict, List, Tuple, Type
+
+from pytest import mark
+
+from cline import AnyTask, CommandLineArguments, LazyTask, Selector, Task
+from cline.cli.dispatch import DispatchIndex, RegisteredTask
+
+
+class SumTask(Task[None]):
+    selector = Selector(flags=["sum"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("sum")
+
+    def invoke(self) -> int:
+        return 0
+
+
+class SubtractTask(Task[None]):
+    selector = Selector(flags=["sub"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("sub")
+
+    def invoke(self) -> int:
+        return 0
+
+
+class ListTask(Task[None]):
+    selector = Selector(values={"command": ["list", "ls"]})
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_string("command", ["list", "ls"])
+
+    def invoke(self) -> int:
+        return 0
+
+
+class DbTask(Task[None]):
+    selector = Selector(command="db")
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        pass
+
+    def invoke(self) -> int:
+        return 0
+
+
+class DbDumpTask(Task[None]):
+    selector = Selector(command=["db", "dump"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        pass
+
+    def invoke(self) -> int:
+        return 0
+
+
+class DbMigrateUpTask(Task[None]):
+    selector = Selector(command="db migrate up", flags=["force"])
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        pass
+
+    def invoke(self) -> int:
+        return 0
+
+
+class UndeclaredTask(Task[None]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("undeclared")
+
+    def invoke(self) -> int:
+        return 0
+
+
+@mark.parametrize(
+    "known, expect",
+    [
+        ({}, [UndeclaredTask]),
+        ({"sum": True}, [SumTask, UndeclaredTask]),
+        ({"sum": True, "sub": True}, [SumTask, SubtractTask, UndeclaredTask]),
+        ({"sub": False}, [UndeclaredTask]),
+        ({"command": "ls"}, [UndeclaredTask, ListTask]),
+        ({"command": "rm"}, [UndeclaredTask]),
+        ({"command": ["ls"]}, [UndeclaredTask]),
+    ],
+)
+def test_candidates(known: Dict[str, Any], expect: List[Type[AnyTask]]) -> None:
+    index = DispatchIndex([SumTask, SubtractTask, UndeclaredTask, ListTask])
+    assert list(index.candidates(CommandLineArguments(known))) == expect
+
+
+def test_candidates__lazy() -> None:
+    lazy_sum = LazyTask(
+        "tests.cli.test_dispatch:SumTask",
+        selector=Selector(flags=["sum"]),
+    )
+    lazy_sub = LazyTask(
+        "tests.cli.test_dispatch:SubtractTask",
+        selector=Selector(flags=["sub"]),
+    )
+
+    index = DispatchIndex([lazy_sum, lazy_sub])
+    candidates = index.candidates(CommandLineArguments({"sub": True}))
+
+    assert list(candidates) == [SubtractTask]
+    assert not lazy_sum.loaded
+    assert lazy_sub.loaded
+
+
+def test_candidates__lazy_without_selector() -> None:
+    lazy = LazyTask("tests.cli.test_dispatch:UndeclaredTask")
+    index = DispatchIndex([lazy])
+    assert list(index.candidates(CommandLineArguments())) == [UndeclaredTask]
+
+
+def test_selector() -> None:
+    selector = Selector(flags=["sum"])
+    lazy = LazyTask("tests.cli.test_dispatch:UndeclaredTask", selector=selector)
+    index = DispatchIndex([lazy, UndeclaredTask])
+
+    assert index.selector(0) is selector
+    assert index.selector(1) is None
+    assert not lazy.loaded
+
+
+@mark.parametrize(
+    "command, known, expect",
+    [
+        ((), {}, [UndeclaredTask]),
+        (("db",), {}, [DbTask, UndeclaredTask]),
+        (("db", "dump"), {}, [DbDumpTask, UndeclaredTask]),
+        (("db", "migrate", "up"), {}, [UndeclaredTask]),
+        (("db", "migrate", "up"), {"force": True}, [DbMigrateUpTask, UndeclaredTask]),
+    ],
+)
+def test_candidates__command(
+    command: Tuple[str, ...],
+    known: Dict[str, Any],
+    expect: List[Type[AnyTask]],
+) -> None:
+    index = DispatchIndex([DbTask, DbDumpTask, DbMigrateUpTask, UndeclaredTask])
+    args = CommandLineArguments(known)
+    assert list(index.candidates(args, command)) == expect
+
+
+def test_commands() -> None:
+    tasks: List[RegisteredTask] = [
+        DbMigrateUpTask,
+        UndeclaredTask,
+        LazyTask("tests.cli.test_dispatch:DbDumpTask", Selector(command="db dump")),
+        DbTask,
+    ]
+    index = DispatchIndex(tasks)
+    assert index.commands == [("db",), ("db", "migrate", "up"), ("db", "dump")]
+    assert not any(t.loaded for t in tasks if isinstance(t, LazyTask))
+
+
+@mark.parametrize(
+    "args, expect",
+    [
+        ([], ()),
+        (["foo"], ()),
+        (["--db"], ()),
+        (["db"], ("db",)),
+        (["db", "foo"], ("db",)),
+        (["db", "dump", "table"], ("db", "dump")),
+        (["db", "migrate"], ("db",)),
+        (["db", "migrate", "up", "--force"], ("db", "migrate", "up")),
+        (["db", "migrate", "down"], ("db",)),
+    ],
+)
+def test_match_command(args: List[str], expect: Tuple[str, ...]) -> None:
+    index = DispatchIndex([DbTask, DbDumpTask, DbMigrateUpTask, UndeclaredTask])
+    assert index.match_command(args) == expect
+
+
+def test_match_command__none_registered() -> None:
+    index = DispatchIndex([UndeclaredTask])
+    assert index.match_command(["db"]) == ()
+
+
+def test_positions() -> None:
+    lazy_sum = LazyTask(
+        "tests.cli.test_dispatch:SumTask",
+        selector=Selector(flags=["sum"]),
+    )
+    index = DispatchIndex([lazy_sum, SubtractTask, UndeclaredTask])
+    assert index.positions(CommandLineArguments({"sum": True})) == [0, 2]
+    assert not lazy_sum.loaded
+
+
+def test_tasks() -> None:
+    index = DispatchIndex([SumTask, SubtractTask])
+    assert index.tasks == [SumTask, SubtractTask]
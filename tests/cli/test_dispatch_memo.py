@@ -0,0 +1,99 @@
+from pathlib import Path
+from typing import List
+
+from mock import patch
+from pytest import MonkeyPatch, fixture
+
+from cline import Selector
+from cline.cache import cache_dir
+from cline.cli.dispatch import RegisteredTask
+from cline.cli.dispatch_memo import DispatchMemo
+from cline.tasks import LazyTask
+from tests.cli.test_dispatch import SubtractTask, SumTask
+
+
+@fixture(autouse=True)
+def cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+
+
+def test_get__empty() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    assert memo.get((), (("sum", "bool"),)) is None
+
+
+def test_put() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask, SubtractTask])
+    memo.put(("db",), (("sum", "bool"),), 1)
+    assert memo.get(("db",), (("sum", "bool"),)) == 1
+    assert memo.get((), (("sum", "bool"),)) is None
+
+
+def test_put__evicts_least_recently_used() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+
+    with patch("cline.cli.dispatch_memo.MEMO_SIZE", 2):
+        memo.put((), (("a", "str"),), 0)
+        memo.put((), (("b", "str"),), 0)
+        memo.put((), (("a", "str"),), 0)
+        memo.put((), (("c", "str"),), 0)
+
+    assert memo.get((), (("a", "str"),)) == 0
+    assert memo.get((), (("b", "str"),)) is None
+    assert memo.get((), (("c", "str"),)) == 0
+
+
+def test_save() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask, SubtractTask])
+    memo.put((), (("sub", "bool"),), 1)
+    memo.save()
+
+    loaded = DispatchMemo(DispatchMemo, "1.0.0", [SumTask, SubtractTask])
+    assert loaded.get((), (("sub", "bool"),)) == 1
+
+
+def test_save__unchanged() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    memo.put((), (("sum", "bool"),), 0)
+    memo.save()
+
+    with patch("cline.cli.dispatch_memo.write_cache") as write_cache:
+        memo.put((), (("sum", "bool"),), 0)
+        memo.save()
+
+    write_cache.assert_not_called()
+
+
+def test_invalidated_by_app_version() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    memo.put((), (("sum", "bool"),), 0)
+    memo.save()
+
+    loaded = DispatchMemo(DispatchMemo, "1.0.1", [SumTask])
+    assert loaded.get((), (("sum", "bool"),)) is None
+
+
+def test_invalidated_by_tasks() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    memo.put((), (("sum", "bool"),), 0)
+    memo.save()
+
+    lazy = LazyTask("tests.cli.test_dispatch:SumTask", Selector(flags=["add"]))
+
+    task_lists: List[List[RegisteredTask]] = [[SumTask, SubtractTask], [lazy]]
+
+    for tasks in task_lists:
+        loaded = DispatchMemo(DispatchMemo, "1.0.0", tasks)
+        assert loaded.get((), (("sum", "bool"),)) is None
+
+
+def test_invalid_cache() -> None:
+    memo = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    memo.put((), (("sum", "bool"),), 0)
+    memo.save()
+
+    for path in (cache_dir() / "dispatch").glob("*/*"):
+        path.write_text("nope")
+
+    loaded = DispatchMemo(DispatchMemo, "1.0.0", [SumTask])
+    assert loaded.get((), (("sum", "bool"),)) is None
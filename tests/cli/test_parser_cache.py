@@ -0,0 +1,106 @@
+import sys
+from argparse import ArgumentParser, _SubParsersAction
+from importlib import import_module
+from os import utime
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from cline.cli import parser_cache
+from cline.cli.parser_cache import dump_parser, load_parser, parser_key
+from tests.cli.test_argument_parser_cli import CachedCli, FooCli
+
+
+def set_program(monkeypatch: MonkeyPatch, path: str) -> None:
+    argv = [path]
+    monkeypatch.setattr(parser_cache, "argv", argv)
+    monkeypatch.setattr(sys, "argv", argv)
+
+
+def test_dump_parser__lambda() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("foo", type=lambda s: s)
+    assert dump_parser(parser) is None
+
+
+def test_load_parser() -> None:
+    parser = ArgumentParser()
+    parser.add_argument("foo")
+    parser.add_argument("--bar", type=int)
+
+    value = dump_parser(parser)
+    assert value
+
+    loaded = load_parser(value)
+    assert loaded
+    assert vars(loaded.parse_args(["a", "--bar", "2"])) == {"bar": 2, "foo": "a"}
+
+
+def test_load_parser__renames_program(monkeypatch: MonkeyPatch) -> None:
+    set_program(monkeypatch, "/usr/bin/old-app")
+    parser = ArgumentParser()
+    subparsers = parser.add_subparsers()
+    subparsers.add_parser("sub", aliases=["s"])
+    value = dump_parser(parser)
+    assert value
+
+    set_program(monkeypatch, "/usr/bin/new-app")
+    loaded = load_parser(value)
+    assert loaded
+    assert loaded.prog == "new-app"
+    assert loaded.format_help().startswith("usage: new-app [-h] {sub,s}")
+    assert subparsers.choices["sub"].prog == "old-app sub"
+
+    actions = loaded._actions
+    loaded_subparsers = next(a for a in actions if isinstance(a, _SubParsersAction))
+    assert loaded_subparsers.choices["sub"].prog == "new-app sub"
+    assert loaded_subparsers.choices["s"].prog == "new-app sub"
+
+
+def test_load_parser__keeps_explicit_program(monkeypatch: MonkeyPatch) -> None:
+    set_program(monkeypatch, "old-app")
+    value = dump_parser(ArgumentParser(prog="app"))
+    assert value
+
+    set_program(monkeypatch, "new-app")
+    loaded = load_parser(value)
+    assert loaded
+    assert loaded.prog == "app"
+
+
+def test_load_parser__invalid() -> None:
+    assert load_parser(b"foo") is None
+
+
+def test_parser_key() -> None:
+    assert parser_key(FooCli, "1.0.0") == parser_key(FooCli, "1.0.0")
+    assert parser_key(FooCli, "1.0.0") != parser_key(FooCli, "1.0.1")
+    assert parser_key(FooCli, "1.0.0") != parser_key(CachedCli, "1.0.0")
+
+
+def test_parser_key__base_module(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    base = tmp_path / "parser_cache_base.py"
+    base.write_text(
+        "from cline.cli import ArgumentParserCli\n"
+        "class BaseCli(ArgumentParserCli):\n"
+        "    pass\n"
+    )
+    (tmp_path / "parser_cache_derived.py").write_text(
+        "from parser_cache_base import BaseCli\n"
+        "class DerivedCli(BaseCli):\n"
+        "    pass\n"
+    )
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    derived = import_module("parser_cache_derived").DerivedCli
+
+    key = parser_key(derived, "1.0.0")
+    utime(base, ns=(0, 0))
+    assert parser_key(derived, "1.0.0") != key
+
+
+def test_parser_key__parser_version() -> None:
+    class VersionedCli(FooCli):
+        parser_version = "2"
+
+    assert parser_key(VersionedCli, "1.0.0") != parser_key(FooCli, "1.0.0")
@@ -0,0 +1,260 @@
+from io import BytesIO, StringIO
+from logging import DEBUG, WARNING
+from threading import Thread
+from time import sleep
+from typing import Iterator, List, Optional
+
+from pytest import LogCaptureFixture, mark, raises
+
+from cline import CommandLineArguments
+from cline.cancellation import TERMINATED
+from cline.cli import ArgumentSpec, Flag, Option, RegisteredTasks, SpecCli
+from cline.cli.pipeline import Channel, split_pipeline
+from cline.tasks import StreamTask, Task
+
+
+class GenerateTask(Task[int]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        return args.get_integer("generate")
+
+    def invoke(self) -> int:
+        for index in range(self.args):
+            self.out.write(f"line {index}\n")
+        return 0
+
+
+class UpperTask(StreamTask[None]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("upper")
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        for record in records:
+            yield record.upper()
+
+
+class HeadTask(StreamTask[int]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        return args.get_integer("head")
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        for index, record in enumerate(records):
+            if index == self.args:
+                return
+            yield record
+
+
+class FailTask(StreamTask[None]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("fail")
+
+    def invoke(self) -> int:
+        super().invoke()
+        return 3
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        yield from records
+
+
+class CancellableTask(StreamTask[None]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("cancellable")
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        for record in records:
+            self.cancellation.check()
+            yield record
+
+
+class ExitTask(Task[str]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> str:
+        return args.get_string("exit")
+
+    def invoke(self) -> int:
+        raise SystemExit(int(self.args) if self.args else None)
+
+
+class PipelineCli(SpecCli):
+    pipeline_separator: Optional[str] = "+"
+
+    def make_parser(self) -> ArgumentSpec:
+        return ArgumentSpec(
+            [
+                Flag("cancellable"),
+                Option("exit"),
+                Flag("fail"),
+                Option("generate"),
+                Option("head"),
+                Flag("upper"),
+            ]
+        )
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [
+            CancellableTask,
+            ExitTask,
+            FailTask,
+            GenerateTask,
+            HeadTask,
+            UpperTask,
+        ]
+
+
+def make_cli(out: StringIO, args: List[str]) -> PipelineCli:
+    return PipelineCli(args=args, in_bytes=BytesIO(b"a\nb\n"), out=out)
+
+
+@mark.parametrize("threaded", [False, True])
+def test_pipeline(threaded: bool) -> None:
+    out = StringIO()
+    cli = make_cli(out, ["--upper"])
+    stages = [["--generate", "3"], ["--upper"], ["--head", "2"]]
+    assert cli.pipeline(stages, threaded=threaded) == 0
+    assert out.getvalue() == "LINE 0\nLINE 1\n"
+
+
+def test_pipeline__reads_input() -> None:
+    out = StringIO()
+    cli = make_cli(out, ["--upper"])
+    assert cli.pipeline([["--upper"], ["--head", "1"]]) == 0
+    assert out.getvalue() == "A\n"
+
+
+def test_pipeline__bounded() -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    stages = [["--generate", "10000"], ["--upper"], ["--head", "10000"]]
+    assert cli.pipeline(stages, channel_size=64, threaded=True) == 0
+    assert len(out.getvalue().splitlines()) == 10_000
+
+
+def test_pipeline__broken_pipe() -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    stages = [["--generate", "100000"], ["--head", "1"]]
+    assert cli.pipeline(stages, channel_size=64, threaded=True) == 141
+    assert out.getvalue() == "line 0\n"
+
+
+def test_pipeline__broken_pipe_not_logged(caplog: LogCaptureFixture) -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    stages = [["--generate", "100000"], ["--head", "1"]]
+
+    with caplog.at_level(DEBUG, logger="cline"):
+        assert cli.pipeline(stages, channel_size=64, threaded=True) == 141
+
+    assert not [r for r in caplog.records if r.levelno >= WARNING]
+    assert out.getvalue() == "line 0\n"
+
+
+def test_pipeline__cancelled() -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    cli.cancellation.cancel(TERMINATED)
+    stages = [["--generate", "2"], ["--cancellable"], ["--upper"]]
+    assert cli.pipeline(stages) == 103
+    assert out.getvalue() == ""
+
+
+def test_pipeline__empty() -> None:
+    cli = make_cli(StringIO(), [])
+    with raises(ValueError, match="a pipeline needs at least one stage"):
+        cli.pipeline([])
+
+
+@mark.parametrize("threaded", [False, True])
+def test_pipeline__pipefail(threaded: bool) -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    stages = [["--generate", "2"], ["--fail"], ["--upper"]]
+    assert cli.pipeline(stages, threaded=threaded) == 3
+    assert out.getvalue() == "LINE 0\nLINE 1\n"
+
+
+@mark.parametrize(
+    "code, expect",
+    [
+        ("", 0),
+        ("4", 4),
+    ],
+)
+def test_pipeline__exit(code: str, expect: int) -> None:
+    out = StringIO()
+    cli = make_cli(out, [])
+    stages = [["--generate", "2"], ["--exit", code]]
+    assert cli.pipeline(stages, threaded=True) == expect
+
+
+def test_invoke__separator() -> None:
+    out = StringIO()
+    cli = make_cli(out, ["--generate", "2", "+", "--upper"])
+    assert cli.invoke() == 0
+    assert out.getvalue() == "LINE 0\nLINE 1\n"
+
+
+def test_invoke__separator_disabled() -> None:
+    class NoPipelineCli(PipelineCli):
+        pipeline_separator = None
+
+    out = StringIO()
+    cli = NoPipelineCli(args=["--generate", "2", "+", "--upper"], out=out)
+    assert cli.invoke() == 0
+    assert out.getvalue() == "line 0\nline 1\n"
+
+
+def test_channel() -> None:
+    channel = Channel()
+    channel.writer.write("foo")
+    channel.writer.buffer.write(b"bar")
+    channel.close_writer()
+    assert channel.reader.read() == b"foobar"
+
+
+def test_channel__bounded() -> None:
+    channel = Channel(max_bytes=4)
+    written: List[int] = []
+
+    def write() -> None:
+        for index in range(3):
+            channel.writer.buffer.write(b"abcd")
+            channel.writer.flush()
+            written.append(index)
+        channel.close_writer()
+
+    thread = Thread(target=write)
+    thread.start()
+    sleep(0.05)
+
+    # The writer waits for room after filling the channel:
+    assert written == [0]
+
+    assert channel.reader.read() == b"abcd" * 3
+    thread.join()
+    assert written == [0, 1, 2]
+
+
+def test_channel__reader_closed() -> None:
+    channel = Channel()
+    channel.close_reader()
+    with raises(BrokenPipeError):
+        channel.writer.write("foo")
+        channel.writer.flush()
+
+
+@mark.parametrize(
+    "args, expect",
+    [
+        ([], [[]]),
+        (["a"], [["a"]]),
+        (["a", "+", "b", "c"], [["a"], ["b", "c"]]),
+        (["+"], [[], []]),
+    ],
+)
+def test_split_pipeline(args: List[str], expect: List[List[str]]) -> None:
+    assert split_pipeline(args, "+") == expect
@@ -0,0 +1,28 @@
+from typing import List
+
+from pytest import MonkeyPatch, raises
+
+from cline.cli import pool
+from cline.cli.batch import InvocationResult
+from cline.cli.pool import init_worker, invoke_in_worker
+from tests.cli.test_argument_parser_cli import ModeCli
+
+
+class ExitingCli(ModeCli):
+    def invoke_captured(self, args: List[str]) -> InvocationResult:
+        raise SystemExit(3)
+
+
+def test_invoke_in_worker__exit(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(pool, "_worker_cli", None)
+    init_worker(ExitingCli, "")
+    assert invoke_in_worker((4, ["--mode", "a"])) == (
+        4,
+        InvocationResult(args=["--mode", "a"], exit_code=3, output=""),
+    )
+
+
+def test_invoke_in_worker__not_initialised() -> None:
+    with raises(RuntimeError) as ex:
+        invoke_in_worker((0, []))
+    assert str(ex.value) == "worker process has not been initialised"
@@ -0,0 +1,108 @@
+from typing import Any, Dict, List
+
+from pytest import mark, raises
+
+from cline.cli import ArgumentSpec, Flag, Option, Positional
+
+SPEC = ArgumentSpec(
+    [
+        Positional("a", help="first number"),
+        Positional("rest", help="other numbers", multiple=True),
+        Option("name", help="name"),
+        Option("tag", help="tag", flags=("-t", "--tag"), multiple=True),
+        Flag("dry_run", help="dry run"),
+    ],
+    description="Does things.",
+)
+
+DEFAULTS: Dict[str, Any] = {
+    "a": None,
+    "dry_run": False,
+    "help": False,
+    "name": None,
+    "rest": [],
+    "tag": [],
+}
+
+
+@mark.parametrize(
+    "args, known, unknown",
+    [
+        ([], {}, []),
+        (["1"], {"a": "1"}, []),
+        (["1", "2", "3"], {"a": "1", "rest": ["2", "3"]}, []),
+        (["-1", "-2.5"], {"a": "-1", "rest": ["-2.5"]}, []),
+        (["--dry-run"], {"dry_run": True}, []),
+        (["--dry-run=yes"], {}, ["--dry-run=yes"]),
+        (["-h"], {"help": True}, []),
+        (["--name", "foo"], {"name": "foo"}, []),
+        (["--name=foo=bar"], {"name": "foo=bar"}, []),
+        (["--name"], {}, ["--name"]),
+        (["-t", "a", "--tag=b"], {"tag": ["a", "b"]}, []),
+        (["--woo", "1"], {"a": "1"}, ["--woo"]),
+        (["--", "--name"], {"a": "--name"}, []),
+        (["-"], {"a": "-"}, []),
+    ],
+)
+def test_parse(args: List[str], known: Dict[str, Any], unknown: List[str]) -> None:
+    cli_args = SPEC.parse(args)
+    for name, value in {**DEFAULTS, **known}.items():
+        assert cli_args.get_raw(name) == value
+    assert cli_args.unknown == unknown
+
+
+def test_parse__surplus_positional() -> None:
+    spec = ArgumentSpec([Positional("a")])
+    assert spec.parse(["1", "2"]).unknown == ["2"]
+
+
+def test_parse__lists_not_shared() -> None:
+    SPEC.parse(["-t", "a"])
+    assert SPEC.parse([]).get_raw("tag") == []
+
+
+def test_init__duplicate_name() -> None:
+    with raises(ValueError) as ex:
+        ArgumentSpec([Flag("foo"), Option("foo", flags=("--bar",))])
+    assert str(ex.value) == 'argument "foo" is declared twice'
+
+
+def test_init__duplicate_flag() -> None:
+    with raises(ValueError) as ex:
+        ArgumentSpec([Flag("foo"), Option("bar", flags=("--foo",))])
+    assert str(ex.value) == 'flag "--foo" is declared twice'
+
+
+def test_options() -> None:
+    assert SPEC.options == [
+        ("--name", "name"),
+        ("-t", "tag"),
+        ("--tag", "tag"),
+        ("--dry-run", "dry run"),
+        ("-h", "show this help"),
+        ("--help", "show this help"),
+    ]
+
+
+def test_format_help() -> None:
+    expect = """usage: foo [a] [rest ...] [--name NAME] [-t TAG] [--dry-run] [-h]
+
+Does things.
+
+positional arguments:
+  a                  first number
+  rest               other numbers
+
+options:
+  --name NAME        name
+  -t TAG, --tag TAG  tag
+  --dry-run          dry run
+  -h, --help         show this help
+"""
+
+    assert SPEC.format_help(prog="foo") == expect
+
+
+def test_format_help__prog() -> None:
+    spec = ArgumentSpec([], prog="bar", add_help=False)
+    assert spec.format_help(prog="foo") == "usage: bar\n"
@@ -0,0 +1,137 @@
+from io import StringIO
+from pathlib import Path
+
+from pytest import MonkeyPatch, raises
+
+from cline import CommandLineArguments, Selector, Task
+from cline.cli import ArgumentSpec, Flag, Positional, RegisteredTasks, SpecCli
+
+
+class SumTask(Task[int]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        args.assert_true("sum")
+        return args.get_integer("a") + args.get_integer("b")
+
+    def invoke(self) -> int:
+        self.out.write(f"{self.args}\n")
+        return 0
+
+
+class FooCli(SpecCli):
+    def make_parser(self) -> ArgumentSpec:
+        return ArgumentSpec(
+            [
+                Positional("a", help="first number"),
+                Positional("b", help="second number"),
+                Flag("sum", help="sums numbers"),
+            ],
+            prog="foo",
+        )
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [SumTask]
+
+
+def test_invoke_and_exit() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit(args=["1", "2", "--sum"], callback=done, out=out)
+    assert out.getvalue() == "3\n"
+    assert result["exit_code"] == 0
+
+
+def test_invoke_and_exit__explicit_help() -> None:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    FooCli.invoke_and_exit(args=["--help"], callback=done, out=out)
+    assert out.getvalue().startswith("usage: foo [a] [b] [--sum] [-h]\n")
+    assert result["exit_code"] == 0
+
+
+def test_write_help() -> None:
+    out = StringIO()
+    FooCli(out=out).write_help()
+    assert "  --sum       sums numbers\n" in out.getvalue()
+
+
+class DumpTask(Task[str]):
+    selector = Selector(command="db dump")
+
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> str:
+        return args.get_string("a")
+
+    def invoke(self) -> int:
+        self.out.write(f"dump {self.args}\n")
+        return 0
+
+
+class DbCli(SpecCli):
+    def make_parser(self) -> ArgumentSpec:
+        return ArgumentSpec([Positional("a")], prog="db")
+
+    def register_tasks(self) -> RegisteredTasks:
+        return [DumpTask]
+
+
+def test_command() -> None:
+    out = StringIO()
+    cli = DbCli(args=["db", "dump", "users"], out=out)
+    assert cli.command == ("db", "dump")
+    assert cli.cli_args.get_string("a") == "users"
+    assert cli.invoke() == 0
+    assert out.getvalue() == "dump users\n"
+
+
+def test_invoke__version_undefined() -> None:
+    out = StringIO()
+    cli = DbCli(app_version="1.2.3", args=["--version"], out=out)
+    assert cli.invoke() == 1
+    assert out.getvalue().startswith("usage: db")
+
+
+def test_make_completion_index() -> None:
+    cli = DbCli(app_version="1.2.3", args=[], out=StringIO())
+    assert cli.make_completion_index() == (
+        "# cline completion index 1.2.3\n"
+        + "c\t\tdb\n"
+        + "c\tdb\tdump\n"
+        + "o\t\t-h\tshow this help\n"
+        + "o\t\t--help\tshow this help\n"
+    )
+
+
+def test_write_completion(tmp_path: Path) -> None:
+    out = StringIO()
+    cli = DbCli(args=[], out=out)
+    index = tmp_path / "completion" / "db.index"
+    cli.write_completion("bash", index_path=str(index), prog="db")
+    assert index.read_text() == cli.make_completion_index()
+    assert "complete -o default -F _cline_complete_db db\n" in out.getvalue()
+    assert str(index) in out.getvalue()
+
+
+def test_write_completion__default_index(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    cli = DbCli(args=[], out=StringIO())
+    cli.write_completion("zsh", prog="db")
+    assert (tmp_path / "completion" / "db.index").is_file()
+
+
+def test_write_completion__unsupported_shell(tmp_path: Path) -> None:
+    cli = DbCli(args=[], out=StringIO())
+    with raises(ValueError, match='"tcsh" is not a supported shell'):
+        cli.write_completion("tcsh", index_path=str(tmp_path / "db.index"))
+    assert not (tmp_path / "db.index").exists()
@@ -0,0 +1,40 @@
+from io import StringIO
+from pathlib import Path
+from typing import List
+
+from cline.completion.cli import CompletionCli
+
+
+def invoke(args: List[str], expect_exit_code: int = 0) -> str:
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out = StringIO()
+    CompletionCli.invoke_and_exit(
+        args=args,
+        callback=done,
+        init_logging=False,
+        out=out,
+    )
+    assert result["exit_code"] == expect_exit_code
+    return out.getvalue()
+
+
+def test_help__incomplete() -> None:
+    output = invoke(["--index", "app.index"], 1)
+    assert output.startswith("usage: python -m cline.completion")
+
+
+def test_invalid_cli() -> None:
+    output = invoke(["bash", "app", "nope"], 1)
+    assert output == '🔥 "nope" is not in the form "module:Cli"\n'
+
+
+def test_script(tmp_path: Path) -> None:
+    index = tmp_path / "example.index"
+    cli = "examples.example03.cli:ExampleCli"
+    output = invoke(["fish", "example", cli, "--index", str(index)])
+    assert output.startswith("# fish completion for example, generated by Cline.")
+    assert "o\t\t--sum\tsums numbers\n" in index.read_text()
@@ -0,0 +1,58 @@
+from pathlib import Path
+from typing import List
+
+from pytest import MonkeyPatch, mark
+
+from cline.completion.index import complete, default_index_path, make_index
+
+INDEX = make_index(
+    [("db",), ("db", "migrate", "up"), ("db", "dump"), ("serve",)],
+    [("-h", "show help"), ("--help", "show help"), ("--dry-run", "")],
+    app_version="1.0.0",
+)
+
+
+def test_default_index_path(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    expect = tmp_path / "completion" / "my_app.index"
+    assert default_index_path("my app") == expect
+
+
+def test_make_index() -> None:
+    assert INDEX == (
+        "# cline completion index 1.0.0\n"
+        + "c\t\tdb\n"
+        + "c\tdb\tmigrate\n"
+        + "c\tdb migrate\tup\n"
+        + "c\tdb\tdump\n"
+        + "c\t\tserve\n"
+        + "o\t\t-h\tshow help\n"
+        + "o\t\t--help\tshow help\n"
+        + "o\t\t--dry-run\t\n"
+    )
+
+
+def test_make_index__cleans_values() -> None:
+    index = make_index([], [("--foo", "multi\tline\nhelp")])
+    assert index == "# cline completion index\no\t\t--foo\tmulti line help\n"
+
+
+@mark.parametrize(
+    "words, current, expect",
+    [
+        ([], "", ["db", "serve"]),
+        ([], "d", ["db"]),
+        ([], "-", ["-h", "--help", "--dry-run"]),
+        ([], "--d", ["--dry-run"]),
+        (["db"], "", ["migrate", "dump"]),
+        (["db"], "--h", ["--help"]),
+        (["db", "migrate"], "", ["up"]),
+        (["db", "migrate", "up"], "", []),
+        (["db", "migrate", "up"], "-h", ["-h"]),
+        (["serve"], "", []),
+        (["nope"], "", []),
+        (["--dry-run"], "", []),
+    ],
+)
+def test_complete(words: List[str], current: str, expect: List[str]) -> None:
+    assert complete(INDEX, words, current) == expect
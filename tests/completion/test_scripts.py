@@ -0,0 +1,99 @@
+from pathlib import Path
+from shutil import which
+from subprocess import check_output
+from typing import List
+
+from pytest import mark, raises
+
+from cline.completion.index import complete
+from cline.completion.scripts import AWK_PROGRAM, SHELLS, make_script
+from tests.completion.test_index import INDEX
+
+CASES = [
+    ([], ""),
+    ([], "d"),
+    ([], "-"),
+    (["db"], ""),
+    (["db"], "--h"),
+    (["db", "migrate"], ""),
+    (["db", "migrate", "up"], ""),
+    (["nope"], "-h"),
+]
+
+awk_required = mark.skipif(which("awk") is None, reason="requires awk")
+bash_required = mark.skipif(which("bash") is None, reason="requires bash")
+
+
+def test_make_script__name() -> None:
+    script = make_script("bash", "my-app", "/tmp/my app.index")
+    assert "_cline_complete_my_app() {\n" in script
+    assert " '/tmp/my app.index'))\n" in script
+
+
+@mark.parametrize("shell", SHELLS)
+def test_make_script__program(shell: str) -> None:
+    script = make_script(shell, "app", "/tmp/app.index")
+    assert f"'{AWK_PROGRAM}' /tmp/app.index" in script
+
+
+def test_make_script__unsupported() -> None:
+    with raises(ValueError, match='"tcsh" is not a supported shell'):
+        make_script("tcsh", "app", "/tmp/app.index")
+
+
+def test_program__quoting() -> None:
+    assert "'" not in AWK_PROGRAM
+    assert "\\\\" not in AWK_PROGRAM
+
+
+@awk_required
+@mark.parametrize("words, current", CASES)
+def test_program(tmp_path: Path, words: List[str], current: str) -> None:
+    path = tmp_path / "app.index"
+    path.write_text(INDEX)
+
+    output = check_output(
+        [
+            "awk",
+            "-v",
+            f"ctx={' '.join(words)}",
+            "-v",
+            f"cur={current}",
+            "-v",
+            "fish=0",
+            AWK_PROGRAM,
+            str(path),
+        ],
+        text=True,
+    )
+
+    assert output.splitlines() == complete(INDEX, words, current)
+
+
+@awk_required
+def test_program__fish(tmp_path: Path) -> None:
+    path = tmp_path / "app.index"
+    path.write_text(INDEX)
+    args = ["awk", "-v", "ctx=", "-v", "cur=--", "-v", "fish=1", AWK_PROGRAM]
+    output = check_output([*args, str(path)], text=True)
+    assert output.splitlines() == ["--help\tshow help", "--dry-run"]
+
+
+@awk_required
+@bash_required
+@mark.parametrize("words, current", CASES)
+def test_bash(tmp_path: Path, words: List[str], current: str) -> None:
+    path = tmp_path / "app.index"
+    path.write_text(INDEX)
+
+    script = make_script("bash", "app", str(path))
+    comp_words = " ".join(f"'{w}'" for w in ["app", *words, current])
+    query = (
+        f"COMP_WORDS=({comp_words}); COMP_CWORD={len(words) + 1}; "
+        + '_cline_complete_app; printf "%s\\n" "${COMPREPLY[@]}"'
+    )
+
+    output = check_output(["bash", "-c", f"{script}\n{query}"], text=True)
+    assert [line for line in output.splitlines() if line] == complete(
+        INDEX, words, current
+    )
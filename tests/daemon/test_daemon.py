@@ -0,0 +1,201 @@
+import sys
+from argparse import ArgumentParser
+from io import BytesIO
+from os import chmod, environ, getcwd, stat
+from pathlib import Path
+from shutil import which
+from socket import AF_UNIX, SHUT_WR, SOCK_STREAM, socket
+from subprocess import run
+from threading import Thread
+from typing import Any, Iterator, List, Type
+
+from pytest import MonkeyPatch, fixture, mark, raises
+
+from cline import CommandLineArguments, Task
+from cline.cli import ArgumentParserCli, Cli, RegisteredTasks
+from cline.daemon.client import invoke
+from cline.daemon.server import make_server
+from cline.daemon.shim import make_shim
+
+connector_required = mark.skipif(
+    which("sh") is None or (which("socat") is None and which("nc") is None),
+    reason="requires sh and socat or nc",
+)
+
+
+class EchoTask(Task[bool]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bool:
+        args.assert_true("echo")
+        return True
+
+    def invoke(self) -> int:
+        self.out.write(f"{getcwd()}\n")
+        self.out.write(f"{environ.get('CLINE_DAEMON_TEST')}\n")
+        self.out.write(sys.stdin.read().upper())
+        return 3
+
+
+class FooCli(Cli[None]):
+    def register_tasks(self) -> RegisteredTasks:
+        return [EchoTask]
+
+    def make_cli_args(self, args: List[str]) -> CommandLineArguments:
+        return CommandLineArguments({"echo": "--echo" in args})
+
+    def make_parser(self) -> None:
+        return None
+
+    def write_help(self) -> None:
+        self.out.write("help\n")
+
+
+class ModeCli(ArgumentParserCli):
+    def make_parser(self) -> ArgumentParser:
+        parser = ArgumentParser(prog="mode")
+        parser.add_argument("--mode", choices=["a", "b"])
+        return parser
+
+    def register_tasks(self) -> RegisteredTasks:
+        return []
+
+
+def _serve(cli_type: Type[Cli[Any]], path: str) -> Iterator[str]:
+    server = make_server(cli_type, path)
+    thread = Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def _make_shim(path: Path, socket_path: str) -> str:
+    path.write_text(make_shim(socket_path))
+    chmod(path, 0o755)
+    return str(path)
+
+
+@fixture
+def mode_socket_path(tmp_path: Path) -> Iterator[str]:
+    yield from _serve(ModeCli, str(tmp_path / "mode.sock"))
+
+
+@fixture
+def socket_path(tmp_path: Path) -> Iterator[str]:
+    yield from _serve(FooCli, str(tmp_path / "cline.sock"))
+
+
+def test_invoke(socket_path: str, tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("CLINE_DAEMON_TEST", "foo")
+
+    stdout = BytesIO()
+    exit_code = invoke(socket_path, ["--echo"], BytesIO(b"bar\n"), stdout)
+
+    assert stdout.getvalue() == f"{tmp_path}\nfoo\nBAR\n".encode("utf-8")
+    assert exit_code == 3
+
+
+def test_invoke__help(socket_path: str) -> None:
+    stdout = BytesIO()
+    assert invoke(socket_path, [], None, stdout) == 1
+    assert stdout.getvalue() == b"help\n"
+
+
+def test_invoke__usage_error(mode_socket_path: str) -> None:
+    stdout = BytesIO()
+    stderr = BytesIO()
+
+    assert invoke(mode_socket_path, ["--mode", "zzz"], None, stdout, stderr) == 2
+    assert stdout.getvalue() == b""
+    assert b"invalid choice: 'zzz'" in stderr.getvalue()
+
+
+def test_invoke__parser_help(mode_socket_path: str) -> None:
+    stdout = BytesIO()
+    assert invoke(mode_socket_path, ["--mode", "a", "--help"], None, stdout) == 0
+    assert stdout.getvalue().startswith(b"usage: mode [-h]")
+
+
+def test_invoke__plain(
+    socket_path: str,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.setenv("CLINE_DAEMON_TEST", "foo")
+
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(f"cline\0{tmp_path}\0001\0--echo\0bar\nbaz".encode("utf-8"))
+        sock.shutdown(SHUT_WR)
+
+        with sock.makefile("rb") as reader:
+            response = reader.read()
+
+    # Environment variables aren't forwarded, so the server's own are used:
+    assert response == f"o {tmp_path}\no foo\no BAR\nO BAZ\nx 3\n".encode("utf-8")
+
+
+def test_invoke__plain_usage_error(mode_socket_path: str) -> None:
+    with socket(AF_UNIX, SOCK_STREAM) as sock:
+        sock.connect(mode_socket_path)
+        sock.sendall(b"cline\0/\0002\0--mode\0zzz\0")
+        sock.shutdown(SHUT_WR)
+
+        with sock.makefile("rb") as reader:
+            lines = reader.read().decode("utf-8").splitlines()
+
+    assert lines[0].startswith("e usage: mode [-h]")
+    assert lines[-1] == "x 2"
+
+
+def test_invoke__not_listening(tmp_path: Path) -> None:
+    with raises(FileNotFoundError):
+        invoke(str(tmp_path / "missing.sock"), [], None, BytesIO())
+
+
+def test_make_server__not_socket(tmp_path: Path) -> None:
+    path = tmp_path / "cline.sock"
+    path.write_text("keep me")
+
+    with raises(FileExistsError, match="exists and is not a socket"):
+        make_server(FooCli, str(path))
+
+    assert path.read_text() == "keep me"
+
+
+def test_make_server__permissions(socket_path: str) -> None:
+    assert stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_make_server__replaces_socket(tmp_path: Path) -> None:
+    path = str(tmp_path / "cline.sock")
+    with socket(AF_UNIX, SOCK_STREAM) as stale:
+        stale.bind(path)
+
+    server = make_server(FooCli, path)
+    server.server_close()
+
+
+@connector_required
+def test_shim(socket_path: str, tmp_path: Path) -> None:
+    shim = _make_shim(tmp_path / "app", socket_path)
+    result = run([shim, "--echo"], capture_output=True, cwd=tmp_path, input=b"bar")
+
+    # Environment variables aren't forwarded, so the server's own are used:
+    assert result.stdout == f"{tmp_path}\nNone\nBAR".encode("utf-8")
+    assert result.returncode == 3
+
+
+@connector_required
+def test_shim__usage_error(
+    mode_socket_path: str,
+    tmp_path: Path,
+) -> None:
+    shim = _make_shim(tmp_path / "app", mode_socket_path)
+    result = run([shim, "--mode", "zzz"], capture_output=True, input=b"")
+
+    assert result.stdout == b""
+    assert b"invalid choice: 'zzz'" in result.stderr
+    assert result.returncode == 2
@@ -0,0 +1,82 @@
+from io import BufferedReader, BytesIO
+from socket import socketpair
+
+from cline.daemon.protocol import (
+    OUTPUT,
+    STDIN,
+    FrameReader,
+    FrameWriter,
+    LineWriter,
+    read_fields,
+    read_frame,
+    send_frame,
+)
+
+
+def test_read_frame() -> None:
+    left, right = socketpair()
+    with left, right:
+        send_frame(left, OUTPUT, b"foo")
+        send_frame(left, STDIN)
+        left.close()
+
+        with right.makefile("rb") as reader:
+            assert read_frame(reader) == (OUTPUT, b"foo")
+            assert read_frame(reader) == (STDIN, b"")
+            assert read_frame(reader) is None
+
+
+def test_read_frame__truncated() -> None:
+    assert read_frame(BytesIO(OUTPUT + (4).to_bytes(4, "big") + b"foo")) is None
+
+
+def test_frame_reader() -> None:
+    frames = BytesIO()
+    for payload in [b"foo", b"bar", b""]:
+        frames.write(STDIN + len(payload).to_bytes(4, "big") + payload)
+    frames.seek(0)
+
+    reader = BufferedReader(FrameReader(frames, STDIN))
+    assert reader.read() == b"foobar"
+
+
+def test_frame_reader__other_kind_ends() -> None:
+    frames = BytesIO(OUTPUT + (3).to_bytes(4, "big") + b"foo")
+    reader = BufferedReader(FrameReader(frames, STDIN))
+    assert reader.read() == b""
+
+
+def test_frame_writer() -> None:
+    left, right = socketpair()
+    with left, right:
+        writer = FrameWriter(left, OUTPUT)
+        assert writer.write(b"foo") == 3
+        assert writer.write(b"") == 0
+        left.close()
+
+        with right.makefile("rb") as reader:
+            assert read_frame(reader) == (OUTPUT, b"foo")
+            assert read_frame(reader) is None
+
+
+def test_line_writer() -> None:
+    left, right = socketpair()
+    with left, right:
+        writer = LineWriter(left, b"o")
+        writer.write(b"foo\nb")
+        writer.write(b"ar\n\nbaz")
+        writer.close()
+        left.close()
+
+        with right.makefile("rb") as reader:
+            assert reader.read() == b"o foo\no bar\no \nO baz\n"
+
+
+def test_read_fields() -> None:
+    reader = BytesIO(b"cline\0/tmp\0\0rest")
+    assert read_fields(reader, 3) == ["cline", "/tmp", ""]
+    assert reader.read() == b"rest"
+
+
+def test_read_fields__truncated() -> None:
+    assert read_fields(BytesIO(b"cline\0/tmp"), 2) is None
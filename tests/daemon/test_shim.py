@@ -0,0 +1,36 @@
+from shutil import which
+from subprocess import run
+
+from pytest import mark
+
+from cline.daemon.shim import AWK_PROGRAM, make_shim
+
+awk_required = mark.skipif(which("awk") is None, reason="requires awk")
+
+
+def test_make_shim() -> None:
+    shim = make_shim("/tmp/my app.sock")
+    assert shim.startswith("#!/bin/sh\n")
+    assert "socket='/tmp/my app.sock'\n" in shim
+    assert f"'{AWK_PROGRAM}'" in shim
+
+
+def test_program__quoting() -> None:
+    assert "'" not in AWK_PROGRAM
+
+
+@awk_required
+def test_program() -> None:
+    response = b"o foo\no \ne oops\nO bar\nx 3\n"
+    result = run(["awk", AWK_PROGRAM], capture_output=True, input=response)
+
+    assert result.stdout == b"foo\n\nbar"
+    assert result.stderr == b"oops\n"
+    assert result.returncode == 3
+
+
+@awk_required
+def test_program__no_exit_code() -> None:
+    result = run(["awk", AWK_PROGRAM], capture_output=True, input=b"o foo\n")
+    assert result.stdout == b"foo\n"
+    assert result.returncode == 101
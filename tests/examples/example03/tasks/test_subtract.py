@@ -2,7 +2,7 @@ from io import StringIO
 
 from cline import CommandLineArguments
 from examples.example03.arguments import NumberArgs
-from examples.example03.tasks import SubtractTask
+from examples.example03.tasks.subtract import SubtractTask
 
 
 def test_make_args() -> None:
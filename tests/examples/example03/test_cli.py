@@ -1,11 +1,15 @@
+from pathlib import Path
+from subprocess import run
+from sys import executable
 from typing import List, Type
 
 from pytest import mark
 
 import cline.tasks
-import examples.example03.tasks
 from cline import AnyTask
 from examples.example03.cli import ExampleCli
+from examples.example03.tasks.subtract import SubtractTask
+from examples.example03.tasks.sum import SumTask
 
 
 @mark.parametrize(
@@ -13,10 +17,32 @@ from examples.example03.cli import ExampleCli
     [
         ([], cline.tasks.HelpTask),
         (["--version"], cline.tasks.HelpTask),
-        (["1", "2", "--sub"], examples.example03.tasks.SubtractTask),
-        (["1", "2", "--sum"], examples.example03.tasks.SumTask),
+        (["1", "2", "--sub"], SubtractTask),
+        (["1", "2", "--sum"], SumTask),
     ],
 )
 def test(args: List[str], expect: Type[AnyTask]) -> None:
     cli = ExampleCli(args=args)
     assert isinstance(cli.task, expect)
+
+
+def test__imports_selected_task_only() -> None:
+    code = "\n".join(
+        [
+            "import sys",
+            "from examples.example03.cli import ExampleCli",
+            "ExampleCli(args=['--sub', '3', '1']).task",
+            "print('examples.example03.tasks.subtract' in sys.modules)",
+            "print('examples.example03.tasks.sum' in sys.modules)",
+        ]
+    )
+
+    process = run(
+        [executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent.parent.parent,
+        text=True,
+    )
+
+    assert process.stdout == "True\nFalse\n"
@@ -0,0 +1,29 @@
+from asyncio import run
+from io import StringIO
+
+from cline import CommandLineArguments
+from cline.tasks import AsyncTask
+
+
+class DoubleTask(AsyncTask[int]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> int:
+        return args.get_integer("value")
+
+    async def ainvoke(self) -> int:
+        self.out.write(f"{self.args * 2}\n")
+        return 0
+
+
+def test_invoke() -> None:
+    out = StringIO()
+    task = DoubleTask(args=2, out=out)
+    assert task.invoke() == 0
+    assert out.getvalue() == "4\n"
+
+
+def test_ainvoke() -> None:
+    out = StringIO()
+    task = DoubleTask(args=2, out=out)
+    assert run(task.ainvoke()) == 0
+    assert out.getvalue() == "4\n"
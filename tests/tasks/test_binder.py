@@ -0,0 +1,122 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Union
+
+from pytest import raises
+
+from cline import CommandLineArguments, InvalidArguments
+from cline.tasks.binder import make_binder
+
+
+@dataclass
+class AllArgs:
+    flag: bool
+    number: int
+    text: str
+    texts: List[str]
+
+
+@dataclass
+class DefaultArgs:
+    flag: bool = False
+    number: int = 3
+    optional: Optional[str] = None
+    optional_number: Optional[int] = None
+    texts: List[str] = field(default_factory=lambda: ["foo"])
+    not_bound: str = field(default="bar", init=False)
+
+
+def test_make_binder() -> None:
+    bind = make_binder(AllArgs)
+    args = CommandLineArguments(
+        {
+            "flag": True,
+            "number": "7",
+            "text": "foo",
+            "texts": ["bar", "baz"],
+        }
+    )
+
+    assert bind(args) == AllArgs(flag=True, number=7, text="foo", texts=["bar", "baz"])
+
+
+def test_make_binder__cannot_make() -> None:
+    bind = make_binder(AllArgs)
+    args = CommandLineArguments({"flag": True, "number": "seven"})
+
+    with raises(InvalidArguments) as ex:
+        bind(args)
+
+    assert ex.value.problems == [
+        "\"number\" must be an integer (not 'seven')",
+        '"text" is required',
+        '"texts" is required',
+    ]
+
+
+def test_make_binder__defaults() -> None:
+    bind = make_binder(DefaultArgs)
+    assert bind(CommandLineArguments()) == DefaultArgs()
+
+    args = CommandLineArguments(
+        {
+            "flag": True,
+            "number": "7",
+            "optional": "foo",
+            "optional_number": "8",
+            "texts": ["bar"],
+        }
+    )
+
+    assert bind(args) == DefaultArgs(
+        flag=True,
+        number=7,
+        optional="foo",
+        optional_number=8,
+        texts=["bar"],
+    )
+
+
+def test_make_binder__default_factory_per_bind() -> None:
+    bind = make_binder(DefaultArgs)
+    first = bind(CommandLineArguments())
+    second = bind(CommandLineArguments())
+    assert first.texts is not second.texts
+
+
+def test_make_binder__not_dataclass() -> None:
+    with raises(TypeError) as ex:
+        make_binder(str)
+
+    assert str(ex.value) == "<class 'str'> is not a dataclass"
+
+
+def test_make_binder__union() -> None:
+    @dataclass
+    class UnionArgs:
+        value: Union[int, str]
+
+    with raises(TypeError) as ex:
+        make_binder(UnionArgs)
+
+    assert str(ex.value) == '"value" is a union of types (typing.Union[int, str])'
+
+
+def test_make_binder__unsupported() -> None:
+    @dataclass
+    class UnsupportedArgs:
+        value: Dict[str, str]
+
+    with raises(TypeError) as ex:
+        make_binder(UnsupportedArgs)
+
+    expect = '"value" has an unsupported type (typing.Dict[str, str])'
+    assert str(ex.value) == expect
+
+
+def test_make_binder__unsupported_list() -> None:
+    @dataclass
+    class UnsupportedArgs:
+        value: List[int]
+
+    with raises(TypeError):
+        make_binder(UnsupportedArgs)
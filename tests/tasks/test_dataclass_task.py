@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from io import StringIO
+from typing import Generic, TypeVar
+
+from mock import patch
+from pytest import raises
+
+from cline import CannotMakeArguments, CommandLineArguments
+from cline.tasks import DataclassTask, Selector
+
+
+@dataclass
+class NumberArgs:
+    a: int
+    b: int
+
+
+class SumTask(DataclassTask[NumberArgs]):
+    selector = Selector(flags=["sum"])
+
+    def invoke(self) -> int:
+        self.out.write(f"{self.args.a + self.args.b}\n")
+        return 0
+
+
+T = TypeVar("T")
+
+
+class GenericTask(DataclassTask[T], Generic[T]):
+    def invoke(self) -> int:
+        return 0
+
+
+class ConcreteTask(GenericTask[NumberArgs]):
+    pass
+
+
+def test_args_type() -> None:
+    assert SumTask.args_type() is NumberArgs
+
+
+def test_args_type__inherited() -> None:
+    assert ConcreteTask.args_type() is NumberArgs
+
+
+def test_args_type__generic() -> None:
+    with raises(TypeError):
+        GenericTask.args_type()
+
+
+def test_make_args() -> None:
+    args = CommandLineArguments({"a": "1", "b": "2", "sum": True})
+    task_args = SumTask.make_args(args)
+    assert task_args == NumberArgs(a=1, b=2)
+
+    out = StringIO()
+    assert SumTask(task_args, out).invoke() == 0
+    assert out.getvalue() == "3\n"
+
+
+def test_make_args__binder_cached() -> None:
+    args = CommandLineArguments({"a": "1", "b": "2"})
+    ConcreteTask.make_args(args)
+
+    with patch("cline.tasks.dataclass_task.make_binder") as make_binder:
+        assert ConcreteTask.make_args(args) == NumberArgs(a=1, b=2)
+
+    make_binder.assert_not_called()
+
+
+def test_make_args__selector_not_matched() -> None:
+    args = CommandLineArguments({"a": "1", "b": "2"})
+
+    with raises(CannotMakeArguments):
+        SumTask.make_args(args)
@@ -0,0 +1,39 @@
+from pytest import raises
+
+from cline import LazyTask, Selector
+from cline.tasks import HelpTask
+
+
+def test_load() -> None:
+    task = LazyTask("cline.tasks.help:HelpTask")
+    assert not task.loaded
+    assert task.load() is HelpTask
+    assert task.loaded
+
+
+def test_load__nested() -> None:
+    task = LazyTask("cline.tasks:help.HelpTask")
+    assert task.load() is HelpTask
+
+
+def test_load__not_task() -> None:
+    task = LazyTask("cline.tasks.help:HelpArgs")
+    with raises(TypeError) as ex:
+        task.load()
+    assert str(ex.value) == "cline.tasks.help:HelpArgs is not a task"
+
+
+def test_init__invalid_path() -> None:
+    with raises(ValueError) as ex:
+        LazyTask("cline.tasks.help.HelpTask")
+    expect = '"cline.tasks.help.HelpTask" is not in the form "package.module:Task"'
+    assert str(ex.value) == expect
+
+
+def test_path() -> None:
+    assert LazyTask("foo.bar:Woo").path == "foo.bar:Woo"
+
+
+def test_selector() -> None:
+    selector = Selector(flags=["foo"])
+    assert LazyTask("foo.bar:Woo", selector=selector).selector is selector
@@ -0,0 +1,64 @@
+from typing import Any, Dict
+
+from pytest import mark
+
+from cline import CommandLineArguments
+from cline.tasks import Selector
+
+
+def test_key__flags_first() -> None:
+    selector = Selector(flags=["sum"], values={"command": "add"})
+    assert selector.key == ("sum", [True])
+
+
+def test_key__values() -> None:
+    selector = Selector(values={"command": ["sub", "add"]})
+    assert selector.key == ("command", ["add", "sub"])
+
+
+def test_key__none() -> None:
+    assert Selector().key is None
+
+
+@mark.parametrize(
+    "known, expect",
+    [
+        ({"sum": True, "command": "add"}, True),
+        ({"sum": True, "command": "plus"}, True),
+        ({"sum": True, "command": "sub"}, False),
+        ({"sum": False, "command": "add"}, False),
+        ({"sum": "yes", "command": "add"}, False),
+        ({"command": "add"}, False),
+        ({"sum": True}, False),
+    ],
+)
+def test_matches(known: Dict[str, Any], expect: bool) -> None:
+    selector = Selector(flags=["sum"], values={"command": ["add", "plus"]})
+    assert selector.matches(CommandLineArguments(known)) is expect
+
+
+def test_command() -> None:
+    assert Selector(command=["db", "migrate"]).command == ("db", "migrate")
+
+
+def test_command__string() -> None:
+    assert Selector(command="db  migrate").command == ("db", "migrate")
+
+
+def test_command__none() -> None:
+    assert Selector().command == ()
+
+
+def test_key__command_only() -> None:
+    assert Selector(command="db").key is None
+
+
+def test_matches__ignores_command() -> None:
+    selector = Selector(command="db", flags=["force"])
+    assert selector.matches(CommandLineArguments({"force": True}))
+
+
+def test_repr() -> None:
+    selector = Selector(command="db up", flags=["force"], values={"env": "dev"})
+    expect = "Selector(command=['db', 'up'], flags=['force'], values={'env': ['dev']})"
+    assert repr(selector) == expect
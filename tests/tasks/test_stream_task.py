@@ -0,0 +1,111 @@
+from io import BytesIO, StringIO
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from cline import CommandLineArguments
+from cline.cli import ArgumentSpec, Flag, RegisteredTasks, SpecCli
+from cline.tasks import StreamTask
+
+if TYPE_CHECKING:
+    from _typeshed import ReadableBuffer
+
+
+class UpperTask(StreamTask[None]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> None:
+        args.assert_true("upper")
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        for record in records:
+            yield record.upper()
+
+
+class CountTask(UpperTask):
+    framing = "nul"
+
+    def process(self, records: Iterator[bytes]) -> Iterator[bytes]:
+        yield str(sum(1 for _ in records)).encode("utf-8")
+
+
+def test_invoke() -> None:
+    out_bytes = BytesIO()
+    task = UpperTask(
+        args=None,
+        in_bytes=BytesIO(b"foo\nbar"),
+        out=StringIO(),
+        out_bytes=out_bytes,
+    )
+    assert task.invoke() == 0
+    assert out_bytes.getvalue() == b"FOO\nBAR\n"
+
+
+def test_invoke__framing() -> None:
+    out_bytes = BytesIO()
+    task = CountTask(
+        args=None,
+        in_bytes=BytesIO(b"a\nb\0c\0"),
+        out=StringIO(),
+        out_bytes=out_bytes,
+    )
+    assert task.invoke() == 0
+    assert out_bytes.getvalue() == b"2\0"
+
+
+def test_invoke__streams() -> None:
+    class EndlessReader(BytesIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.remaining = 1_000
+
+        def read1(self, size: Optional[int] = -1) -> bytes:
+            if not self.remaining:
+                return b""
+            self.remaining -= 1
+            return b"x\n" * 100
+
+    in_bytes = EndlessReader()
+
+    class RecordingWriter(BytesIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.first_write_remaining = -1
+            self.written = 0
+
+        def write(self, data: "ReadableBuffer") -> int:
+            if self.first_write_remaining < 0:
+                self.first_write_remaining = in_bytes.remaining
+            self.written += len(bytes(data))
+            return len(bytes(data))
+
+    out_bytes = RecordingWriter()
+    task = UpperTask(args=None, in_bytes=in_bytes, out=StringIO(), out_bytes=out_bytes)
+    assert task.invoke() == 0
+
+    # Output was written before the input was exhausted:
+    assert out_bytes.first_write_remaining == 999
+    assert out_bytes.written == 200_000
+
+
+def test_invoke_and_exit() -> None:
+    class UpperCli(SpecCli):
+        def make_parser(self) -> ArgumentSpec:
+            return ArgumentSpec([Flag("upper")])
+
+        def register_tasks(self) -> RegisteredTasks:
+            return [UpperTask]
+
+    result = {"exit_code": -1}
+
+    def done(exit_code: int) -> None:
+        result["exit_code"] = exit_code
+
+    out_bytes = BytesIO()
+    UpperCli.invoke_and_exit(
+        args=["--upper"],
+        callback=done,
+        in_bytes=BytesIO(b"foo\n"),
+        init_logging=False,
+        out=StringIO(),
+        out_bytes=out_bytes,
+    )
+    assert result["exit_code"] == 0
+    assert out_bytes.getvalue() == b"FOO\n"
@@ -0,0 +1,57 @@
+from io import BytesIO, StringIO, TextIOWrapper
+
+from mock import patch
+
+from cline import CommandLineArguments
+from cline.tasks import NO_MATCH, Task
+
+
+class BinaryTask(Task[bytes]):
+    @classmethod
+    def make_args(cls, args: CommandLineArguments) -> bytes:
+        return args.get_string("value").encode("utf-8")
+
+    def invoke(self) -> int:
+        self.out.write("text\n")
+        self.out.flush()
+        self.out_bytes.write(self.args)
+        self.flush()
+        return 0
+
+
+def test_in_bytes() -> None:
+    in_bytes = BytesIO(b"input")
+    task = BinaryTask(args=b"", in_bytes=in_bytes, out=StringIO())
+    assert task.in_bytes is in_bytes
+
+
+def test_in_bytes__default() -> None:
+    stdin = TextIOWrapper(BytesIO(b"input"))
+    task = BinaryTask(args=b"", out=StringIO())
+    with patch("sys.stdin", stdin):
+        assert task.in_bytes.read() == b"input"
+
+
+def test_out_bytes() -> None:
+    out = StringIO()
+    out_bytes = BytesIO()
+    task = BinaryTask(args=b"bytes\n", out=out, out_bytes=out_bytes)
+    assert task.invoke() == 0
+    assert out.getvalue() == "text\n"
+    assert out_bytes.getvalue() == b"bytes\n"
+
+
+def test_out_bytes__default() -> None:
+    out = StringIO()
+    task = BinaryTask(args=b"bytes\n", out=out)
+    assert task.invoke() == 0
+    assert out.getvalue() == "text\nbytes\n"
+
+
+def test_try_make_args() -> None:
+    args = CommandLineArguments({"value": "foo"})
+    assert BinaryTask.try_make_args(args) == b"foo"
+
+
+def test_try_make_args__no_match() -> None:
+    assert BinaryTask.try_make_args(CommandLineArguments()) is NO_MATCH
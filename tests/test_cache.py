@@ -0,0 +1,85 @@
+from os import utime
+from pathlib import Path
+
+from mock import patch
+from pytest import MonkeyPatch, mark
+
+from cline.cache import cache_dir, cache_key, read_cache, write_cache
+
+
+def test_cache_dir__override(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", "/foo")
+    assert cache_dir() == Path("/foo")
+
+
+def test_cache_dir__xdg(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("CLINE_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", "/xdg")
+    with patch("cline.cache.platform", "linux"):
+        assert cache_dir() == Path("/xdg/cline")
+
+
+@mark.parametrize(
+    "platform, expect",
+    [
+        ("darwin", Path("Library/Caches/cline")),
+        ("linux", Path(".cache/cline")),
+        ("win32", Path("AppData/Local/cline")),
+    ],
+)
+def test_cache_dir__home(
+    platform: str,
+    expect: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    monkeypatch.delenv("CLINE_CACHE_DIR", raising=False)
+    monkeypatch.delenv("LOCALAPPDATA", raising=False)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    with patch("cline.cache.platform", platform):
+        assert cache_dir() == Path.home() / expect
+
+
+def test_cache_key() -> None:
+    assert cache_key("a", b"b") == cache_key("a", "b")
+    assert cache_key("ab", "") != cache_key("a", "b")
+
+
+def test_read_cache__missing(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    assert read_cache("foo", "bar") is None
+
+
+def test_write_cache(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    write_cache("foo", "bar", b"first")
+    assert read_cache("foo", "bar") == b"first"
+
+
+def test_write_cache__removes_stale(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    write_cache("foo", "bar", b"first")
+    write_cache("foo", "woo", b"second")
+    assert read_cache("foo", "bar") is None
+    assert read_cache("foo", "woo") == b"second"
+
+
+def test_write_cache__keep(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(tmp_path))
+    for index, key in enumerate(["c", "a", "b"]):
+        write_cache("foo", key, key.encode("utf-8"), keep=3)
+        # Order the writes regardless of the file system's time resolution:
+        utime(tmp_path / "foo" / key, ns=(index, index))
+
+    write_cache("foo", "d", b"d", keep=3)
+    assert read_cache("foo", "c") is None
+    assert read_cache("foo", "a") == b"a"
+    assert read_cache("foo", "b") == b"b"
+    assert read_cache("foo", "d") == b"d"
+
+
+def test_write_cache__unwritable(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    not_a_directory = tmp_path / "file"
+    not_a_directory.write_text("")
+    monkeypatch.setenv("CLINE_CACHE_DIR", str(not_a_directory))
+    write_cache("foo", "bar", b"first")
+    assert read_cache("foo", "bar") is None
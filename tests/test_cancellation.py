@@ -0,0 +1,216 @@
+from os import getpid, kill
+from signal import SIG_DFL, SIGTERM, getsignal
+from threading import Thread
+from time import monotonic, sleep
+from typing import List
+
+from pytest import mark, raises
+
+from cline.cancellation import (
+    CANCELLED,
+    TERMINATED,
+    TIMED_OUT,
+    CancellationToken,
+    exit_code,
+    install_handlers,
+)
+from cline.exceptions import Cancelled
+
+
+def test_cancel() -> None:
+    token = CancellationToken()
+    assert not token.cancelled
+    assert token.reason is None
+
+    token.cancel()
+    assert token.cancelled
+    assert token.reason == CANCELLED
+
+
+def test_cancel__keeps_first_reason() -> None:
+    token = CancellationToken()
+    token.cancel(TERMINATED)
+    token.cancel(TIMED_OUT)
+    assert token.reason == TERMINATED
+
+
+def test_cancel_after() -> None:
+    token = CancellationToken()
+    token.cancel_after(0)
+    assert token.cancelled
+    assert token.reason == TIMED_OUT
+
+
+def test_cancel_after__keeps_sooner_deadline() -> None:
+    changes: List[None] = []
+    token = CancellationToken()
+    token.add_listener(lambda: changes.append(None))
+
+    token.cancel_after(10)
+    token.cancel_after(20)
+    remaining = token.remaining
+    assert remaining is not None and 9 < remaining <= 10
+    assert len(changes) == 1
+
+    token.cancel_after(5)
+    remaining = token.remaining
+    assert remaining is not None and 4 < remaining <= 5
+    assert len(changes) == 2
+
+
+def test_check() -> None:
+    token = CancellationToken()
+    token.check()
+    token.cancel(TERMINATED)
+
+    with raises(Cancelled) as ex:
+        token.check()
+
+    assert ex.value.reason == TERMINATED
+
+
+@mark.parametrize(
+    "reason, expect",
+    [
+        (CANCELLED, 103),
+        (TERMINATED, 103),
+        (TIMED_OUT, 102),
+    ],
+)
+def test_exit_code(reason: str, expect: int) -> None:
+    assert exit_code(reason) == expect
+
+
+def test_reason__signalled_first() -> None:
+    token = CancellationToken()
+    token._signal(TERMINATED)
+    token.cancel()
+    assert token.reason == TERMINATED
+
+
+def test_remaining__no_deadline() -> None:
+    assert CancellationToken().remaining is None
+
+
+def test_remove_listener() -> None:
+    changes: List[None] = []
+
+    def listener() -> None:
+        changes.append(None)
+
+    token = CancellationToken()
+    token.add_listener(listener)
+    token.remove_listener(listener)
+    token.cancel_after(10)
+    assert not changes
+
+
+def test_wait__cancelled_by_thread() -> None:
+    token = CancellationToken()
+    Thread(target=token.cancel).start()
+    assert token.wait(10)
+
+
+def test_wait__deadline() -> None:
+    token = CancellationToken()
+    token.cancel_after(0.01)
+    started = monotonic()
+    assert token.wait()
+    assert monotonic() - started < 5
+
+
+def test_wait__seconds() -> None:
+    assert not CancellationToken().wait(0.01)
+
+
+def test_install_handlers__preempts_timeout() -> None:
+    token = CancellationToken()
+    uninstall = install_handlers(token, lambda: True)
+
+    try:
+        with raises(Cancelled) as ex:
+            token.cancel_after(0.01)
+            sleep(5)
+    finally:
+        uninstall()
+
+    assert ex.value.reason == TIMED_OUT
+    assert token.reason == TIMED_OUT
+
+
+def test_install_handlers__cooperates_on_sigterm() -> None:
+    token = CancellationToken()
+    uninstall = install_handlers(token, lambda: False)
+
+    try:
+        kill(getpid(), SIGTERM)
+        assert token.wait(5)
+    finally:
+        uninstall()
+
+    assert token.reason == TERMINATED
+    assert getsignal(SIGTERM) is SIG_DFL
+
+
+def test_install_handlers__lock_held() -> None:
+    token = CancellationToken()
+    uninstall = install_handlers(token, lambda: True)
+
+    try:
+        token.cancel_after(0.01)
+        with raises(Cancelled) as ex:
+            # Interrupted while the token is locked, like during `cancel()`:
+            with token._lock:
+                sleep(5)
+    finally:
+        uninstall()
+
+    assert ex.value.reason == TIMED_OUT
+    assert token.cancelled
+    assert token.reason == TIMED_OUT
+
+
+def test_install_handlers__sigterm_lock_held() -> None:
+    token = CancellationToken()
+    uninstall = install_handlers(token, lambda: False)
+
+    try:
+        with token._lock:
+            kill(getpid(), SIGTERM)
+            sleep(0.01)
+        assert token.cancelled
+    finally:
+        uninstall()
+
+    assert token.reason == TERMINATED
+
+
+def test_install_handlers__wakes_waiter() -> None:
+    token = CancellationToken()
+    uninstall = install_handlers(token, lambda: False)
+
+    def terminate() -> None:
+        sleep(0.05)
+        kill(getpid(), SIGTERM)
+
+    try:
+        Thread(target=terminate).start()
+        started = monotonic()
+        assert token.wait()
+        assert monotonic() - started < 5
+    finally:
+        uninstall()
+
+    assert token.reason == TERMINATED
+
+
+def test_install_handlers__not_main_thread() -> None:
+    uninstalls = []
+    token = CancellationToken()
+
+    thread = Thread(target=lambda: uninstalls.append(install_handlers(token, bool)))
+    thread.start()
+    thread.join()
+
+    uninstalls[0]()
+    assert getsignal(SIGTERM) is SIG_DFL
@@ -1,9 +1,12 @@
-from typing import List, Union
+from pickle import dumps, loads
+from typing import List, Optional, Union
 
+from mock import patch
 from pytest import mark, raises
 
 from cline import CommandLineArguments
-from cline.exceptions import CannotMakeArguments
+from cline.cli_args import ArgumentsType, ArgumentValue
+from cline.exceptions import CannotMakeArguments, InvalidArguments
 
 
 @mark.parametrize("value", ["bar", ["woo", "bar"]])
@@ -69,3 +72,249 @@ def test_get_string__none() -> None:
     args = CommandLineArguments()
     with raises(CannotMakeArguments):
         args.get_string("foo")
+
+
+def test_get_raw() -> None:
+    args = CommandLineArguments({"foo": ["bar"]})
+    assert args.get_raw("foo") == ["bar"]
+
+
+def test_get_raw__none() -> None:
+    args = CommandLineArguments()
+    assert args.get_raw("foo") is None
+
+
+def test_copies_arguments() -> None:
+    known: ArgumentsType = {"foo": "1"}
+    unknown = ["--bar"]
+    args = CommandLineArguments(known, unknown)
+    known["foo"] = "2"
+    unknown.append("--baz")
+    assert args.get_integer("foo") == 1
+    assert args.unknown == ["--bar"]
+
+
+@mark.parametrize("value", [None, True, ["1"], "one"])
+def test_get_integer__fail(value: ArgumentValue) -> None:
+    args = CommandLineArguments({"foo": value})
+
+    # The failure is remembered, and raised on every call:
+    for _ in range(2):
+        with raises(CannotMakeArguments):
+            args.get_integer("foo")
+
+
+def test_get_integer__memoized() -> None:
+    args = CommandLineArguments({"foo": "1"})
+
+    with patch.object(
+        CommandLineArguments,
+        "_convert_integer",
+        return_value=1,
+    ) as convert_integer:
+        assert args.get_integer("foo") == 1
+        assert args.get_integer("foo") == 1
+
+    convert_integer.assert_called_once_with("foo")
+
+
+def test_pickle() -> None:
+    args = CommandLineArguments({"foo": "1"}, ["--bar"])
+    args.get_integer("foo")
+    unpickled = loads(dumps(args))
+    assert unpickled.get_integer("foo") == 1
+    assert unpickled.unknown == ["--bar"]
+
+
+def test_read_only() -> None:
+    args = CommandLineArguments({"foo": "bar"})
+
+    with raises(AttributeError) as ex:
+        args.foo = "baz"
+
+    assert str(ex.value) == "CommandLineArguments is read-only"
+
+    with raises(AttributeError):
+        args._known = {}
+
+
+def test_read_only__lists() -> None:
+    items = ["a", "b"]
+    unknown = ["--baz"]
+    args = CommandLineArguments({"items": items}, unknown)
+
+    items.append("c")
+    unknown.append("--qux")
+
+    args.get_list("items").append("d")
+    args.try_get_list("items").append("d")  # type: ignore[union-attr]
+    args.get_raw("items").append("d")  # type: ignore[union-attr]
+    args.extract({"items": list})["items"].append("d")
+    args.unknown.append("--qux")
+
+    assert args.get_list("items") == ["a", "b"]
+    assert args.unknown == ["--baz"]
+
+
+def test_repr() -> None:
+    args = CommandLineArguments({"foo": "bar"}, ["--baz"])
+    assert repr(args) == "CommandLineArguments(known={'foo': 'bar'}, unknown=['--baz'])"
+
+
+def test_extract() -> None:
+    args = CommandLineArguments(
+        {
+            "flag": True,
+            "number": "7",
+            "text": "foo",
+            "texts": ["bar"],
+        }
+    )
+
+    schema = {"flag": bool, "number": int, "text": str, "texts": list}
+
+    assert args.extract(schema) == {
+        "flag": True,
+        "number": 7,
+        "text": "foo",
+        "texts": ["bar"],
+    }
+
+
+def test_extract__defaults() -> None:
+    args = CommandLineArguments({"number": "7"})
+    schema = {"number": int, "text": str}
+    assert args.extract(schema, {"number": 1, "text": None}) == {
+        "number": 7,
+        "text": None,
+    }
+
+
+def test_extract__invalid() -> None:
+    args = CommandLineArguments(
+        {
+            "flag": "yes",
+            "number": "seven",
+            "text": ["foo"],
+            "texts": "bar",
+        }
+    )
+
+    schema = {
+        "flag": bool,
+        "missing": str,
+        "number": int,
+        "text": str,
+        "texts": list,
+    }
+
+    with raises(InvalidArguments) as ex:
+        args.extract(schema)
+
+    assert ex.value.problems == [
+        '"flag" must be a flag',
+        '"missing" is required',
+        "\"number\" must be an integer (not 'seven')",
+        '"text" must be a string',
+        '"texts" must be a list',
+    ]
+
+    assert str(ex.value).startswith('"flag" must be a flag, "missing" is required, ')
+
+
+def test_extract__unsupported() -> None:
+    args = CommandLineArguments({"foo": "1.5"})
+
+    with raises(TypeError) as ex:
+        args.extract({"foo": float})
+
+    assert str(ex.value) == "\"foo\" has an unsupported type (<class 'float'>)"
+
+
+def test_shape() -> None:
+    args = CommandLineArguments(
+        {
+            "b": "2",
+            "a": True,
+            "empty": [],
+            "list": ["x"],
+            "off": False,
+            "unset": None,
+        }
+    )
+    assert args.shape == (("a", "bool"), ("b", "str"), ("list", "list"))
+
+
+def test_shape__ignores_values() -> None:
+    assert (
+        CommandLineArguments({"a": "1"}).shape == CommandLineArguments({"a": "2"}).shape
+    )
+
+
+@mark.parametrize(
+    "value, default, expect",
+    [
+        (True, None, True),
+        (False, None, False),
+        (None, None, None),
+        (None, True, True),
+        ("true", None, None),
+    ],
+)
+def test_try_get_bool(
+    value: ArgumentValue,
+    default: Optional[bool],
+    expect: Optional[bool],
+) -> None:
+    args = CommandLineArguments({"foo": value})
+    assert args.try_get_bool("foo", default) == expect
+
+
+@mark.parametrize(
+    "value, expect",
+    [
+        ("1", 1),
+        ("one", None),
+        (None, None),
+        (True, None),
+    ],
+)
+def test_try_get_integer(value: ArgumentValue, expect: Optional[int]) -> None:
+    args = CommandLineArguments({"foo": value})
+    assert args.try_get_integer("foo") == expect
+
+
+@mark.parametrize(
+    "value, default, expect",
+    [
+        (["a"], None, ["a"]),
+        (None, None, None),
+        (None, ["b"], ["b"]),
+        ("a", None, None),
+    ],
+)
+def test_try_get_list(
+    value: ArgumentValue,
+    default: Optional[List[str]],
+    expect: Optional[List[str]],
+) -> None:
+    args = CommandLineArguments({"foo": value})
+    assert args.try_get_list("foo", default) == expect
+
+
+@mark.parametrize(
+    "value, default, expect",
+    [
+        ("a", None, "a"),
+        (None, None, None),
+        (None, "b", "b"),
+        (["a"], None, None),
+    ],
+)
+def test_try_get_string(
+    value: ArgumentValue,
+    default: Optional[str],
+    expect: Optional[str],
+) -> None:
+    args = CommandLineArguments({"foo": value})
+    assert args.try_get_string("foo", default) == expect
@@ -1,5 +1,61 @@
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from typing import List
+
+from pytest import raises
+
 import cline
 
+# Generous enough to tolerate slow CI runners, but far below the cost of eagerly
+# importing the CLI and task modules:
+IMPORT_BUDGET_MICROSECONDS = 25_000
+
+
+def run_python(code: str, options: List[str]) -> str:
+    process = run(
+        [executable, *options, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=Path(__file__).parent.parent,
+        text=True,
+    )
+    return process.stdout + process.stderr
+
+
+def test_dir() -> None:
+    names = dir(cline)
+    assert "Cli" in names
+    assert "__version__" in names
+
+
+def test_getattr() -> None:
+    from cline.cli import Cli
+
+    assert cline.Cli is Cli
+
+
+def test_getattr__unknown() -> None:
+    with raises(AttributeError) as ex:
+        cline.Foo
+    assert str(ex.value) == "module 'cline' has no attribute 'Foo'"
+
+
+def test_import__is_lazy() -> None:
+    code = "import cline, sys; print(sorted(m for m in sys.modules if 'cline' in m))"
+    assert run_python(code, []) == "['cline']\n"
+
+
+def test_import__within_budget() -> None:
+    output = run_python("import cline", ["-X", "importtime"])
+
+    # Lines are formatted as: "import time: <self> | <cumulative> | <module>"
+    timings = [line.split("|") for line in output.splitlines()]
+    cumulative = [int(t[1]) for t in timings if len(t) == 3 and t[2].strip() == "cline"]
+
+    assert len(cumulative) == 1
+    assert cumulative[0] < IMPORT_BUDGET_MICROSECONDS
+
 
 def test_version() -> None:
     assert cline.__version__ == "0.0.0"
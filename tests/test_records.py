@@ -0,0 +1,92 @@
+from io import BytesIO
+from typing import List, Optional
+
+from pytest import mark, raises
+
+from cline.records import FRAMINGS, read_records, write_record
+
+
+class TrickleReader(BytesIO):
+    """
+    Reader that returns at most one byte per read.
+    """
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return super().read(1 if size is None or size < 0 else min(size, 1))
+
+    def read1(self, size: Optional[int] = -1) -> bytes:
+        return self.read(size)
+
+
+@mark.parametrize(
+    "data, framing, expect",
+    [
+        (b"", "lines", []),
+        (b"a\nbc\n", "lines", [b"a", b"bc"]),
+        (b"a\n\nbc", "lines", [b"a", b"", b"bc"]),
+        (b"a\0b c\0", "nul", [b"a", b"b c"]),
+        (b"a\nb\0c", "nul", [b"a\nb", b"c"]),
+        (b"\0\0\0\x01a\0\0\0\x00\0\0\0\x02\n\0", "length", [b"a", b"", b"\n\0"]),
+    ],
+)
+def test_read_records(data: bytes, framing: str, expect: List[bytes]) -> None:
+    assert list(read_records(BytesIO(data), framing, chunk_size=2)) == expect
+    assert list(read_records(TrickleReader(data), framing)) == expect
+
+
+def test_read_records__lazy() -> None:
+    reader = BytesIO(b"a\nb\n")
+    records = read_records(reader, chunk_size=2)
+    assert next(records) == b"a"
+    assert reader.tell() == 2
+
+
+def test_read_records__spanning_chunks() -> None:
+    data = b"a" * 100_000 + b"\nbc\n" + b"d" * 100_000
+    records = list(read_records(BytesIO(data), chunk_size=5))
+    assert records == [b"a" * 100_000, b"bc", b"d" * 100_000]
+
+
+@mark.parametrize(
+    "data, framing",
+    [
+        (b"abcdef\n", "lines"),
+        (b"abcdef", "lines"),
+        (b"ab\nabcdef\n", "lines"),
+        (b"abc\nabcd\nabcde", "lines"),
+        (b"\0\0\0\x06abcdef", "length"),
+    ],
+)
+def test_read_records__too_large(data: bytes, framing: str) -> None:
+    records = read_records(BytesIO(data), framing, chunk_size=2, max_record_size=4)
+    with raises(ValueError, match="record exceeds 4 bytes"):
+        list(records)
+
+
+def test_read_records__truncated_length() -> None:
+    with raises(ValueError, match="record length is truncated"):
+        list(read_records(BytesIO(b"\0\0"), "length"))
+
+
+def test_read_records__truncated_record() -> None:
+    with raises(ValueError, match=r"record is truncated \(1 of 2 bytes\)"):
+        list(read_records(BytesIO(b"\0\0\0\x02a"), "length"))
+
+
+def test_read_records__unsupported() -> None:
+    with raises(ValueError, match='"csv" is not a record framing'):
+        read_records(BytesIO(), "csv")
+
+
+@mark.parametrize("framing", FRAMINGS)
+def test_write_record(framing: str) -> None:
+    writer = BytesIO()
+    for record in [b"a", b"", b"bc"]:
+        write_record(writer, record, framing)
+    writer.seek(0)
+    assert list(read_records(writer, framing)) == [b"a", b"", b"bc"]
+
+
+def test_write_record__unsupported() -> None:
+    with raises(ValueError, match='"csv" is not a record framing'):
+        write_record(BytesIO(), b"a", "csv")
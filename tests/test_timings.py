@@ -0,0 +1,59 @@
+from io import StringIO
+
+from cline.timings import PhaseTiming, Timings
+
+
+def test_duration_ns() -> None:
+    timing = PhaseTiming(ended_ns=15, phase="parse", started_ns=10)
+    assert timing.duration_ns == 5
+
+
+def test_phases() -> None:
+    timings = Timings()
+    timings.record("second", 20)
+    timings.record("first", 10)
+    assert [p.phase for p in timings.phases] == ["first", "second"]
+
+
+def test_record() -> None:
+    timings = Timings()
+    timings.record("probe", 10, "FooTask")
+    assert len(timings.phases) == 1
+    assert timings.phases[0].phase == "probe"
+    assert timings.phases[0].started_ns == 10
+    assert timings.phases[0].task == "FooTask"
+    assert timings.phases[0].ended_ns > 10
+
+
+def test_total_ns() -> None:
+    timings = Timings()
+    timings._phases = [
+        PhaseTiming(ended_ns=30, phase="dispatch", started_ns=10),
+        PhaseTiming(ended_ns=20, phase="probe", started_ns=15),
+        PhaseTiming(ended_ns=50, phase="invoke", started_ns=40),
+    ]
+    assert timings.total_ns == 40
+
+
+def test_total_ns__empty() -> None:
+    assert Timings().total_ns == 0
+
+
+def test_write_summary() -> None:
+    timings = Timings()
+    timings._phases = [
+        PhaseTiming(ended_ns=3_000_000, phase="dispatch", started_ns=1_000_000),
+        PhaseTiming(ended_ns=1_500_000, phase="probe", started_ns=1_250_000, task="A"),
+        PhaseTiming(ended_ns=5_000_000, phase="invoke", started_ns=4_000_000),
+    ]
+
+    out = StringIO()
+    timings.write_summary(out)
+
+    assert out.getvalue() == (
+        "phase                           ms\n"
+        + "dispatch                     2.000\n"
+        + "  probe A                    0.250\n"
+        + "invoke                       1.000\n"
+        + "total                        4.000\n"
+    )
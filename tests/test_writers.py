@@ -0,0 +1,44 @@
+from io import BytesIO, StringIO, TextIOWrapper
+from pathlib import Path
+
+from cline.writers import make_binary_writer, make_buffered_writer
+
+
+def test_make_binary_writer__buffer() -> None:
+    buffer = BytesIO()
+    out = TextIOWrapper(buffer)
+    assert make_binary_writer(out) is buffer
+
+
+def test_make_binary_writer__text() -> None:
+    out = StringIO()
+    writer = make_binary_writer(out)
+
+    # Split a multi-byte character across writes:
+    encoded = "🔥 foo\n".encode("utf-8")
+    writer.write(encoded[:2])
+    writer.write(encoded[2:])
+    writer.flush()
+
+    assert out.getvalue() == "🔥 foo\n"
+
+
+def test_make_buffered_writer__not_file() -> None:
+    out = StringIO()
+    assert make_buffered_writer(out, 1024) is out
+
+
+def test_make_buffered_writer(tmp_path: Path) -> None:
+    path = tmp_path / "out.txt"
+
+    with open(path, "w", encoding="utf-8") as out:
+        out.write("first\n")
+
+        writer = make_buffered_writer(out, 1024 * 1024)
+        assert path.read_text() == "first\n"
+
+        writer.write("second\n")
+        assert path.read_text() == "first\n"
+
+        writer.flush()
+        assert path.read_text() == "first\nsecond\n"